@@ -621,6 +621,7 @@ mod bench {
                 alias: None,
             }],
             distinct: false,
+            plan_key: None,
         }
     }
 
@@ -643,6 +644,7 @@ mod bench {
                 alias: None,
             }],
             distinct: false,
+            plan_key: None,
         }
     }
 
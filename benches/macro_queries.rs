@@ -146,6 +146,7 @@ mod bench {
                 },
             ],
             distinct: true,
+            plan_key: None,
         }
     }
 
@@ -187,6 +188,7 @@ mod bench {
                 alias: None,
             }],
             distinct: false,
+            plan_key: None,
         }
     }
 
@@ -220,6 +222,7 @@ mod bench {
                 },
             ],
             distinct: false,
+            plan_key: None,
         }
     }
 }
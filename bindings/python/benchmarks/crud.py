@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import itertools
+import json
 import os
 import statistics
 import time
-from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Callable, Deque, List
+from typing import Callable, Iterable, List, Sequence, Tuple
 
 from sombra import Database
+from sombra.query import OP_CREATE_EDGE, OP_CREATE_NODE
+
+try:
+    from orjson import dumps as _dumps_json
+except ImportError:  # pragma: no cover - orjson is optional for the benchmark
+
+    def _dumps_json(value: object) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
 
 LABEL_USER = "User"
 EDGE_TYPE_FOLLOWS = "FOLLOWS"
+# Shared label list so every op references the same object.
+USER_LABELS = [LABEL_USER]
 EDGE_ANCHOR_COUNT = 16
-BENCH_ROOT = Path(__file__).resolve().parents[3] / "target" / "bench"
+# Point BENCH_ROOT at a tmpfs (e.g. /dev/shm) to keep disk fsync cost out of
+# the measurements.
+BENCH_ROOT = Path(os.environ.get("BENCH_ROOT") or Path(__file__).resolve().parents[3] / "target" / "bench")
 DB_PATH = BENCH_ROOT / "python-crud.db"
 
 
@@ -32,6 +47,17 @@ def _env_int(name: str, default: int) -> int:
 OPS_PER_BATCH = _env_int("BENCH_BATCH_SIZE", 256)
 PREFILL_BATCHES = _env_int("BENCH_PREFILL_BATCHES", 512)
 CACHE_PAGES = _env_int("BENCH_CACHE_PAGES", 4096)
+WARMUP_ITERS = _env_int("BENCH_WARMUP", 20)
+PARALLEL_WORKERS = _env_int("BENCH_PARALLEL", 1)
+# Commit-path knobs, so syscall/fsync amortization can be compared without
+# editing the script. commit_coalesce_ms=0 is meaningful, hence no _env_int.
+SYNCHRONOUS = os.environ.get("BENCH_SYNCHRONOUS", "normal")
+COMMIT_COALESCE_MS = int(os.environ.get("BENCH_COMMIT_COALESCE_MS") or 5)
+ASYNC_FSYNC = os.environ.get("BENCH_ASYNC_FSYNC") == "1"
+
+_node_name = "bench-node-%d".__mod__
+_bio = "bio-%d".__mod__
+_pool_name = "delete-pool-%d".__mod__
 
 
 def _format_ops_per_second(ops_per_second: float) -> str:
@@ -43,22 +69,56 @@ def _format_ops_per_second(ops_per_second: float) -> str:
     return f"{ops_per_second:.0f}"
 
 
+class IdPool:
+    """FIFO of ids backed by a list and a read cursor, drained by slicing."""
+
+    def __init__(self) -> None:
+        self.items: List[int] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.items) - self.head
+
+    def extend(self, ids: Iterable[int]) -> None:
+        self.items.extend(ids)
+
+    def take(self, count: int) -> List[int]:
+        start = self.head
+        self.head = start + count
+        ids = self.items[start : self.head]
+        if self.head * 2 > len(self.items):
+            del self.items[: self.head]
+            self.head = 0
+        return ids
+
+
 class CrudHarness:
     def __init__(self, db: Database, batch_size: int) -> None:
         self.db = db
         self.batch_size = batch_size
         self.counter = 0
-        self.node_delete_pool: Deque[int] = deque()
-        self.edge_delete_pool: Deque[int] = deque()
+        self.node_delete_pool = IdPool()
+        self.edge_delete_pool = IdPool()
         self.edge_anchor_nodes: List[int] = []
+        self._anchors: Tuple[int, ...] = ()
+        self._anchor_mask = 0
         self.node_update_target = 0
         self.edge_update_target = 0
         self.bootstrap()
+        self._build_op_templates()
+        # QueryBuilder.execute() rebuilds its spec from the stored state on
+        # each call, so the chain can be assembled once and re-executed.
+        self._read_users_query = db.query().match(LABEL_USER).select(["n0"])
 
     def bootstrap(self) -> None:
         if not self.edge_anchor_nodes:
             for i in range(EDGE_ANCHOR_COUNT):
                 self.edge_anchor_nodes.append(self.create_user(f"edge-anchor-{i}"))
+        anchor_count = len(self.edge_anchor_nodes)
+        if anchor_count < 2 or anchor_count & (anchor_count - 1):
+            raise RuntimeError("edge anchor set must hold a power-of-two count of at least two nodes")
+        self._anchors = tuple(self.edge_anchor_nodes)
+        self._anchor_mask = anchor_count - 1
         self.node_update_target = self.edge_anchor_nodes[0]
         self.edge_update_target = self.create_edge_between(
             self.edge_anchor_nodes[0],
@@ -66,6 +126,28 @@ class CrudHarness:
         )
         self.prefill_delete_pools()
 
+    def _build_op_templates(self) -> None:
+        # Op dicts are allocated once and only their varying field is rewritten
+        # per iteration, so the timed loops measure mutate_many rather than
+        # Python dict construction.
+        size = self.batch_size
+        self._create_node_ops = [
+            {"op": "createNode", "labels": USER_LABELS, "props": {"name": ""}} for _ in range(size)
+        ]
+        self._update_node_ops = [
+            {"op": "updateNode", "id": self.node_update_target, "set": {"bio": ""}, "unset": []}
+            for _ in range(size)
+        ]
+        self._delete_node_ops = [{"op": "deleteNode", "id": 0, "cascade": True} for _ in range(size)]
+        self._create_edge_ops = [
+            {"op": "createEdge", "src": 0, "dst": 0, "ty": EDGE_TYPE_FOLLOWS, "props": {}} for _ in range(size)
+        ]
+        self._update_edge_ops = [
+            {"op": "updateEdge", "id": self.edge_update_target, "set": {"weight": 0}, "unset": []}
+            for _ in range(size)
+        ]
+        self._delete_edge_ops = [{"op": "deleteEdge", "id": 0} for _ in range(size)]
+
     def prefill_delete_pools(self) -> None:
         target = self.batch_size * PREFILL_BATCHES
         if len(self.node_delete_pool) < target:
@@ -76,88 +158,126 @@ class CrudHarness:
             self.edge_delete_pool.extend(self.create_edges(missing))
 
     def create_node_batch(self) -> None:
-        ops = [
-            {
-                "op": "createNode",
-                "labels": [LABEL_USER],
-                "props": {"name": f"bench-node-{self.bump_counter()}"},
-            }
-            for _ in range(self.batch_size)
-        ]
-        summary = self.db.mutate_many(ops)
+        ops = self._create_node_ops
+        for op, name in zip(ops, map(_node_name, self._reserve(self.batch_size))):
+            op["props"]["name"] = name
+        summary = self.db.mutate_many(ops, copy=False)
         self.node_delete_pool.extend(summary.get("createdNodes", []))
 
     def update_node_batch(self) -> None:
-        ops = [
-            {
-                "op": "updateNode",
-                "id": self.node_update_target,
-                "set": {"bio": f"bio-{self.bump_counter()}"},
-                "unset": [],
-            }
-            for _ in range(self.batch_size)
-        ]
-        self.db.mutate_many(ops)
+        ops = self._update_node_ops
+        for op, bio in zip(ops, map(_bio, self._reserve(self.batch_size))):
+            op["set"]["bio"] = bio
+        self.db.mutate_many(ops, collect_ids=False, copy=False)
 
     def delete_node_batch(self) -> None:
         self._ensure_node_capacity()
-        ids = [self.node_delete_pool.popleft() for _ in range(self.batch_size)]
-        ops = [{"op": "deleteNode", "id": node_id, "cascade": True} for node_id in ids]
-        self.db.mutate_many(ops)
+        ops = self._delete_node_ops
+        for op, node_id in zip(ops, self.node_delete_pool.take(self.batch_size)):
+            op["id"] = node_id
+        self.db.mutate_many(ops, collect_ids=False, copy=False)
 
     def create_edge_batch(self) -> None:
-        ops = []
-        for _ in range(self.batch_size):
-            src, dst = self.next_edge_pair()
-            ops.append({"op": "createEdge", "src": src, "dst": dst, "ty": EDGE_TYPE_FOLLOWS, "props": {}})
-        summary = self.db.mutate_many(ops)
+        ops = self._create_edge_ops
+        for op, (src, dst) in zip(ops, self.edge_pairs(self.batch_size)):
+            op["src"] = src
+            op["dst"] = dst
+        summary = self.db.mutate_many(ops, copy=False)
         self.edge_delete_pool.extend(summary.get("createdEdges", []))
 
     def update_edge_batch(self) -> None:
-        ops = [
-            {
-                "op": "updateEdge",
-                "id": self.edge_update_target,
-                "set": {"weight": self.bump_counter() % 1_000},
-                "unset": [],
-            }
-            for _ in range(self.batch_size)
-        ]
-        self.db.mutate_many(ops)
+        ops = self._update_edge_ops
+        weights = [value % 1_000 for value in self._reserve(self.batch_size)]
+        for op, weight in zip(ops, weights):
+            op["set"]["weight"] = weight
+        self.db.mutate_many(ops, collect_ids=False, copy=False)
 
     def delete_edge_batch(self) -> None:
         self._ensure_edge_capacity()
-        ids = [self.edge_delete_pool.popleft() for _ in range(self.batch_size)]
-        ops = [{"op": "deleteEdge", "id": edge_id} for edge_id in ids]
-        self.db.mutate_many(ops)
+        ops = self._delete_edge_ops
+        for op, edge_id in zip(ops, self.edge_delete_pool.take(self.batch_size)):
+            op["id"] = edge_id
+        self.db.mutate_many(ops, collect_ids=False, copy=False)
+
+    def create_node_columns(self) -> None:
+        names = list(map(_node_name, self._reserve(self.batch_size)))
+        summary = self.db.mutate_columns("createNode", {"labels": USER_LABELS, "props": {"name": names}})
+        self.node_delete_pool.extend(summary.get("createdNodes", []))
+
+    def update_node_columns(self) -> None:
+        bios = list(map(_bio, self._reserve(self.batch_size)))
+        ids = [self.node_update_target] * self.batch_size
+        self.db.mutate_columns("updateNode", {"id": ids, "set": {"bio": bios}})
+
+    def delete_node_columns(self) -> None:
+        self._ensure_node_capacity()
+        ids = self.node_delete_pool.take(self.batch_size)
+        self.db.mutate_columns("deleteNode", {"id": ids, "cascade": True})
+
+    def create_edge_columns(self) -> None:
+        src, dst = self.edge_columns(self.batch_size)
+        summary = self.db.mutate_columns("createEdge", {"src": src, "dst": dst, "ty": EDGE_TYPE_FOLLOWS})
+        self.edge_delete_pool.extend(summary.get("createdEdges", []))
+
+    def update_edge_columns(self) -> None:
+        weights = [value % 1_000 for value in self._reserve(self.batch_size)]
+        ids = [self.edge_update_target] * self.batch_size
+        self.db.mutate_columns("updateEdge", {"id": ids, "set": {"weight": weights}})
+
+    def delete_edge_columns(self) -> None:
+        self._ensure_edge_capacity()
+        ids = self.edge_delete_pool.take(self.batch_size)
+        self.db.mutate_columns("deleteEdge", {"id": ids})
+
+    def create_node_json(self) -> None:
+        ops = self._create_node_ops
+        for op, name in zip(ops, map(_node_name, self._reserve(self.batch_size))):
+            op["props"]["name"] = name
+        summary = self.db.mutate_json(_dumps_json({"ops": ops}))
+        self.node_delete_pool.extend(summary.get("createdNodes", []))
+
+    def create_edge_json(self) -> None:
+        ops = self._create_edge_ops
+        for op, (src, dst) in zip(ops, self.edge_pairs(self.batch_size)):
+            op["src"] = src
+            op["dst"] = dst
+        summary = self.db.mutate_json(_dumps_json({"ops": ops}))
+        self.edge_delete_pool.extend(summary.get("createdEdges", []))
+
+    def create_node_compact(self) -> None:
+        ops = [
+            (OP_CREATE_NODE, USER_LABELS, {"name": name})
+            for name in map(_node_name, self._reserve(self.batch_size))
+        ]
+        summary = self.db.mutate_compact(ops)
+        self.node_delete_pool.extend(summary.get("createdNodes", []))
+
+    def create_edge_compact(self) -> None:
+        ops = [
+            (OP_CREATE_EDGE, src, dst, EDGE_TYPE_FOLLOWS, None)
+            for src, dst in self.edge_pairs(self.batch_size)
+        ]
+        summary = self.db.mutate_compact(ops)
+        self.edge_delete_pool.extend(summary.get("createdEdges", []))
 
     def read_users(self) -> None:
-        self.db.query().match(LABEL_USER).select(["n0"]).execute()
+        self._read_users_query.execute()
 
     def create_user(self, name: str) -> int:
-        summary = self.db.mutate_many([{"op": "createNode", "labels": [LABEL_USER], "props": {"name": name}}])
+        summary = self.db.mutate_many([{"op": "createNode", "labels": USER_LABELS, "props": {"name": name}}])
         created = summary.get("createdNodes", [])
         if not created:
             raise RuntimeError("create_user must return an id")
         return int(created[-1])
 
     def create_users(self, count: int) -> List[int]:
-        created: List[int] = []
-        remaining = count
-        while remaining > 0:
-            chunk = min(remaining, self.batch_size)
-            ops = [
-                {
-                    "op": "createNode",
-                    "labels": [LABEL_USER],
-                    "props": {"name": f"delete-pool-{self.bump_counter()}"},
-                }
-                for _ in range(chunk)
-            ]
-            summary = self.db.mutate_many(ops)
-            created.extend(int(node_id) for node_id in summary.get("createdNodes", []))
-            remaining -= chunk
-        return created
+        # One columnar call covers the whole shortfall; the native side
+        # already returns plain ints, so the id list is used as-is.
+        if count <= 0:
+            return []
+        names = list(map(_pool_name, self._reserve(count)))
+        summary = self.db.mutate_columns("createNode", {"labels": USER_LABELS, "props": {"name": names}})
+        return summary.get("createdNodes", [])
 
     def create_edge_between(self, src: int, dst: int) -> int:
         summary = self.db.mutate_many(
@@ -169,18 +289,11 @@ class CrudHarness:
         return int(created[-1])
 
     def create_edges(self, count: int) -> List[int]:
-        created: List[int] = []
-        remaining = count
-        while remaining > 0:
-            chunk = min(remaining, self.batch_size)
-            ops = []
-            for _ in range(chunk):
-                src, dst = self.next_edge_pair()
-                ops.append({"op": "createEdge", "src": src, "dst": dst, "ty": EDGE_TYPE_FOLLOWS, "props": {}})
-            summary = self.db.mutate_many(ops)
-            created.extend(int(edge_id) for edge_id in summary.get("createdEdges", []))
-            remaining -= chunk
-        return created
+        if count <= 0:
+            return []
+        src, dst = self.edge_columns(count)
+        summary = self.db.mutate_columns("createEdge", {"src": src, "dst": dst, "ty": EDGE_TYPE_FOLLOWS})
+        return summary.get("createdEdges", [])
 
     def _ensure_node_capacity(self) -> None:
         if len(self.node_delete_pool) < self.batch_size:
@@ -190,18 +303,23 @@ class CrudHarness:
         if len(self.edge_delete_pool) < self.batch_size:
             self.edge_delete_pool.extend(self.create_edges(self.batch_size * 2))
 
-    def next_edge_pair(self) -> tuple[int, int]:
-        if len(self.edge_anchor_nodes) < 2:
-            raise RuntimeError("edge anchor set must contain at least two nodes")
-        idx = self.bump_counter() % len(self.edge_anchor_nodes)
-        src = self.edge_anchor_nodes[idx]
-        dst = self.edge_anchor_nodes[(idx + 1) % len(self.edge_anchor_nodes)]
-        return src, dst
+    def edge_pairs(self, count: int) -> List[Tuple[int, int]]:
+        # The anchor count is a power of two, so masking replaces the modulo.
+        anchors = self._anchors
+        mask = self._anchor_mask
+        return [(anchors[c & mask], anchors[(c + 1) & mask]) for c in self._reserve(count)]
 
-    def bump_counter(self) -> int:
-        value = self.counter
-        self.counter += 1
-        return value
+    def edge_columns(self, count: int) -> Tuple[List[int], List[int]]:
+        anchors = self._anchors
+        mask = self._anchor_mask
+        counters = self._reserve(count)
+        return [anchors[c & mask] for c in counters], [anchors[(c + 1) & mask] for c in counters]
+
+    def _reserve(self, count: int) -> range:
+        """Claim ``count`` consecutive counter values in one attribute write."""
+        base = self.counter
+        self.counter += count
+        return range(base, self.counter)
 
 
 def time_operation(
@@ -209,44 +327,102 @@ def time_operation(
     fn: Callable[[], None],
     iterations: int = 200,
     ops_per_iter: int = 1,
+    warmup: int = WARMUP_ITERS,
 ) -> float:
-    samples: List[float] = []
-    for _ in range(iterations):
-        start = time.perf_counter()
+    # Untimed warmup iterations settle caches and lazily-built state so the
+    # samples reflect the steady-state hot path.
+    for _ in itertools.repeat(None, warmup):
+        fn()
+    clock = time.perf_counter_ns
+    samples_ns = [0] * iterations
+    for idx, _ in enumerate(itertools.repeat(None, iterations)):
+        start = clock()
         fn()
-        samples.append(time.perf_counter() - start)
+        samples_ns[idx] = clock() - start
+    # The first timed sample is still an outlier often enough to trim it.
+    samples = [sample / 1e9 for sample in samples_ns[1:] or samples_ns]
     mean = statistics.mean(samples)
+    median = statistics.median(samples)
     per_op = mean / max(ops_per_iter, 1)
+    median_per_op = median / max(ops_per_iter, 1)
     ops_per_second = ops_per_iter / mean if mean > 0 else float("inf")
     formatted_ops = _format_ops_per_second(ops_per_second)
-    print(f"{label:>20}: {per_op * 1e6:.1f} µs/op | {formatted_ops} ops/s ({ops_per_iter} ops/txn)")
+    print(
+        f"{label:>20}: {per_op * 1e6:.1f} µs/op (median {median_per_op * 1e6:.1f}) | "
+        f"{formatted_ops} ops/s ({ops_per_iter} ops/txn)"
+    )
     return per_op
 
 
-def main() -> None:
-    BENCH_ROOT.mkdir(parents=True, exist_ok=True)
-    fresh = not DB_PATH.exists()
+BENCH_OPS: Tuple[Tuple[str, str, bool], ...] = (
+    # (label, CrudHarness method, whether one call is a batch of OPS_PER_BATCH ops)
+    ("create nodes", "create_node_batch", True),
+    ("update nodes", "update_node_batch", True),
+    ("delete nodes", "delete_node_batch", True),
+    ("create edges", "create_edge_batch", True),
+    ("update edges", "update_edge_batch", True),
+    ("delete edges", "delete_edge_batch", True),
+    ("read users", "read_users", False),
+    ("create nodes (col)", "create_node_columns", True),
+    ("update nodes (col)", "update_node_columns", True),
+    ("delete nodes (col)", "delete_node_columns", True),
+    ("create edges (col)", "create_edge_columns", True),
+    ("update edges (col)", "update_edge_columns", True),
+    ("delete edges (col)", "delete_edge_columns", True),
+    ("create nodes (json)", "create_node_json", True),
+    ("create edges (json)", "create_edge_json", True),
+    ("create nodes (tuple)", "create_node_compact", True),
+    ("create edges (tuple)", "create_edge_compact", True),
+)
+
+
+def open_bench_db(path: Path) -> Database:
+    fresh = not path.exists()
     db = Database.open(
-        str(DB_PATH),
-        synchronous="normal",
-        commit_coalesce_ms=5,
+        str(path),
+        synchronous=SYNCHRONOUS,
+        commit_coalesce_ms=COMMIT_COALESCE_MS,
+        async_fsync=ASYNC_FSYNC,
         cache_pages=CACHE_PAGES,
     )
     if fresh:
         db.seed_demo()
-    harness = CrudHarness(db, OPS_PER_BATCH)
+    return db
+
 
+def run_ops(db_path: Path, ops: Sequence[Tuple[str, str, bool]]) -> List[float]:
+    harness = CrudHarness(open_bench_db(db_path), OPS_PER_BATCH)
+    return [
+        time_operation(label, getattr(harness, method), ops_per_iter=OPS_PER_BATCH if batched else 1)
+        for label, method, batched in ops
+    ]
+
+
+def run_parallel(workers: int) -> None:
+    # DatabaseHandle is unsendable and the native calls hold the GIL, so
+    # overlap comes from worker processes. Each one gets its own database file
+    # because the file lock admits a single writer per database.
+    groups = [BENCH_OPS[idx::workers] for idx in range(workers)]
+    paths = [BENCH_ROOT / f"python-crud-{idx}.db" for idx in range(workers)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run_ops, paths, groups))
+    elapsed = time.perf_counter() - start
+    print(f"parallel suite: {len(BENCH_OPS)} ops across {workers} processes in {elapsed:.2f}s wall")
+
+
+def main() -> None:
+    BENCH_ROOT.mkdir(parents=True, exist_ok=True)
     print(
         f"Running Python CRUD micro-benchmarks with batch_size={OPS_PER_BATCH}, "
-        f"synchronous=normal, commit_coalesce_ms=5, cache_pages={CACHE_PAGES}",
+        f"synchronous={SYNCHRONOUS}, commit_coalesce_ms={COMMIT_COALESCE_MS}, "
+        f"async_fsync={ASYNC_FSYNC}, cache_pages={CACHE_PAGES}",
     )
-    time_operation("create nodes", harness.create_node_batch, ops_per_iter=OPS_PER_BATCH)
-    time_operation("update nodes", harness.update_node_batch, ops_per_iter=OPS_PER_BATCH)
-    time_operation("delete nodes", harness.delete_node_batch, ops_per_iter=OPS_PER_BATCH)
-    time_operation("create edges", harness.create_edge_batch, ops_per_iter=OPS_PER_BATCH)
-    time_operation("update edges", harness.update_edge_batch, ops_per_iter=OPS_PER_BATCH)
-    time_operation("delete edges", harness.delete_edge_batch, ops_per_iter=OPS_PER_BATCH)
-    time_operation("read users", harness.read_users)
+    workers = min(PARALLEL_WORKERS, len(BENCH_OPS))
+    if workers > 1:
+        run_parallel(workers)
+        return
+    run_ops(DB_PATH, BENCH_OPS)
 
 
 if __name__ == "__main__":
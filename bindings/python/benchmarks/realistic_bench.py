@@ -9,7 +9,7 @@ import os
 import tempfile
 import time
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional
 
 from sombra import Database
 
@@ -27,6 +27,14 @@ def env_int(name: str, default: int) -> int:
 NODE_COUNT = env_int("NODES", 5000)
 EDGE_COUNT = env_int("EDGES", 20000)
 READ_COUNT = env_int("READS", 10000)
+# The native DatabaseHandle is unsendable, so bulk reads stay on the opening
+# thread; READ_BATCH only bounds how many records each native call returns.
+READ_BATCH = max(env_int("READ_BATCH", 500), 1)
+# Commit-path knobs, so syscall/fsync amortization can be compared without
+# editing the script.
+SYNCHRONOUS = os.environ.get("BENCH_SYNCHRONOUS", "normal")
+COMMIT_COALESCE_MS = env_int("BENCH_COMMIT_COALESCE_MS", 0)
+ASYNC_FSYNC = os.environ.get("BENCH_ASYNC_FSYNC") == "1"
 
 CODE_TEXTS = [
     "function foo() { return 1; }",
@@ -43,15 +51,54 @@ METADATA = [
 ]
 
 
+def bench_tmp_root() -> Optional[str]:
+    """Prefer a RAM-backed directory so the benchmark measures the DB, not the disk."""
+    override = os.environ.get("BENCH_TMPDIR")
+    if override:
+        return override
+    candidates = ["/dev/shm"]
+    if hasattr(os, "getuid"):
+        candidates.append(f"/run/user/{os.getuid()}")
+    for candidate in candidates:
+        if os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
+def iter_node_props(count: int) -> Iterator[Dict[str, Any]]:
+    # nodes_bulk() copies each mapping as it is consumed, so a single scratch
+    # dict is rewritten in place instead of materializing one dict per node.
+    props: Dict[str, Any] = {
+        "name": "",
+        "filePath": "",
+        "startLine": 0,
+        "endLine": 0,
+        "codeText": "",
+        "language": "typescript",
+        "metadata": "",
+    }
+    code_count = len(CODE_TEXTS)
+    metadata_count = len(METADATA)
+    for i in range(count):
+        props["name"] = f"fn_{i}"
+        props["filePath"] = f"/tmp/file_{i // 50}.ts"
+        props["startLine"] = i
+        props["endLine"] = i + 5
+        props["codeText"] = CODE_TEXTS[i % code_count]
+        props["metadata"] = METADATA[i % metadata_count]
+        yield props
+
+
 def main() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(dir=bench_tmp_root()) as tmpdir:
         db_path = Path(tmpdir) / "bench.sombra"
         print(f"📂 temp db: {db_path}")
 
         db = Database.open(
             str(db_path),
-            synchronous="normal",
-            commit_coalesce_ms=0,
+            synchronous=SYNCHRONOUS,
+            commit_coalesce_ms=COMMIT_COALESCE_MS,
+            async_fsync=ASYNC_FSYNC,
             cache_pages=16384,
         )
 
@@ -60,44 +107,33 @@ def main() -> None:
         write_start = time.perf_counter()
 
         builder = db.create()
-        handles: List = []
 
         # Create nodes
-        for i in range(NODE_COUNT):
-            handle = builder.node(
-                ["Node"],
-                {
-                    "name": f"fn_{i}",
-                    "filePath": f"/tmp/file_{i // 50}.ts",
-                    "startLine": i,
-                    "endLine": i + 5,
-                    "codeText": CODE_TEXTS[i % len(CODE_TEXTS)],
-                    "language": "typescript",
-                    "metadata": METADATA[i % len(METADATA)],
-                },
-            )
-            handles.append(handle)
+        handles = builder.nodes_bulk(["Node"], iter_node_props(NODE_COUNT))
 
         node_prep_time = time.perf_counter() - write_start
         print(f"  prepared {NODE_COUNT} nodes: {node_prep_time * 1000:.1f} ms")
 
         # Create edges using handles
         edge_start = time.perf_counter()
+        handle_count = len(handles)
+        edges: List[Any] = [None] * EDGE_COUNT
         for i in range(EDGE_COUNT):
-            src = handles[i % len(handles)]
-            dst = handles[(i * 13 + 7) % len(handles)]
+            src_idx = i % handle_count
+            dst_idx = (i * 13 + 7) % handle_count
             # Skip self loops
-            if src.index == dst.index:
-                dst = handles[(i + 1) % len(handles)]
-            builder.edge(
-                src,
+            if src_idx == dst_idx:
+                dst_idx = (i + 1) % handle_count
+            edges[i] = (
+                handles[src_idx],
                 "LINKS",
-                dst,
+                handles[dst_idx],
                 {
                     "weight": (i % 10) / 10.0,
                     "kind": "call" if i % 2 == 0 else "reference",
                 },
             )
+        builder.edges_bulk(edges)
 
         edge_prep_time = time.perf_counter() - edge_start
         print(f"  prepared {EDGE_COUNT} edges: {edge_prep_time * 1000:.1f} ms")
@@ -113,17 +149,19 @@ def main() -> None:
 
         node_ids = summary["nodes"]
 
-        # Random reads using get_node_record
+        # Random reads: time the first 20 individually, then fetch the rest in one bulk call
         print(f"Running {READ_COUNT} reads...")
+        read_ids = [node_ids[(i * 17) % len(node_ids)] for i in range(READ_COUNT)]
         read_start = time.perf_counter()
-        first_20_times: List[float] = []
+        first_reads = read_ids[:20]
+        first_20_times = [0.0] * len(first_reads)
 
-        for i in range(READ_COUNT):
-            node_id = node_ids[(i * 17) % len(node_ids)]
+        for idx, node_id in enumerate(first_reads):
             single_start = time.perf_counter()
-            record = db.get_node_record(node_id)
-            if i < 20:
-                first_20_times.append((time.perf_counter() - single_start) * 1_000_000)  # µs
+            db.get_node_record(node_id)
+            first_20_times[idx] = (time.perf_counter() - single_start) * 1_000_000  # µs
+        for start in range(20, READ_COUNT, READ_BATCH):
+            db.get_node_records_bulk(read_ids[start : start + READ_BATCH])
 
         read_time = time.perf_counter() - read_start
         print(f"random reads: {read_time * 1000:.1f} ms")
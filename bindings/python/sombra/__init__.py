@@ -1,10 +1,11 @@
 """Python bindings for the Sombra database (Stage 8 query surface)."""
 
-from . import typed
 from ._native import version as _native_version
 from .query import (
+    BoundQuery,
     CreateBuilder,
     Database,
+    PreparedQuery,
     QueryBuilder,
     QueryResult,
     open_database,
@@ -30,6 +31,8 @@ __all__ = [
     "QueryBuilder",
     "CreateBuilder",
     "QueryResult",
+    "PreparedQuery",
+    "BoundQuery",
     "open_database",
     "typed",
     # Error types
@@ -52,3 +55,13 @@ __all__ = [
 def version() -> str:
     """Return the current stub version string."""
     return _native_version()
+
+
+def __getattr__(name: str) -> object:
+    # The typed facade pulls in typing_extensions, so it is imported on first
+    # access to keep a plain ``import sombra`` cheap.
+    if name == "typed":
+        import importlib
+
+        return importlib.import_module(".typed", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,14 +4,18 @@
 use std::sync::{Arc, Mutex};
 
 use pyo3::{
-    exceptions::PyRuntimeError,
+    exceptions::{PyRuntimeError, PyTypeError, PyValueError},
     prelude::*,
-    types::{PyAny, PyBool, PyDict, PyList, PyModule, PyTuple},
+    types::{
+        PyAny, PyBool, PyBytes, PyDict, PyFloat, PyList, PyLong, PyModule, PySet, PyString, PyTuple,
+    },
     Bound,
 };
-use serde_json::Value;
+use serde_json::{Map, Value};
 use sombra::{
-    ffi::{Database, DatabaseOptions, FfiError, QueryStream},
+    ffi::{
+        Database, DatabaseOptions, FfiError, MutationOp, MutationSpec, MutationSummary, QueryStream,
+    },
     primitives::pager::{PagerOptions, Synchronous},
     storage::Dir,
 };
@@ -84,6 +88,8 @@ impl DatabaseHandle {
 #[pyclass(module = "sombra._native", unsendable)]
 pub struct StreamHandle {
     inner: Mutex<Option<QueryStream>>,
+    /// Error hit after a partial batch was returned; raised on the next pull.
+    pending_err: Mutex<Option<PyErr>>,
 }
 
 struct ParsedNeighborOptions {
@@ -252,6 +258,15 @@ fn database_execute(
     handle: &DatabaseHandle,
     spec: &Bound<'_, PyAny>,
 ) -> PyResult<PyObject> {
+    // Specs pre-encoded as JSON bytes are parsed without walking Python objects.
+    if let Ok(payload) = spec.downcast::<PyBytes>() {
+        return handle.with_db(|db| {
+            let response = db
+                .execute_json_bytes(payload.as_bytes())
+                .map_err(to_py_err)?;
+            value_to_py(py, response)
+        });
+    }
     let value = any_to_value(spec)?;
     handle.with_db(|db| {
         let response = db.execute_json(&value).map_err(to_py_err)?;
@@ -265,6 +280,14 @@ fn database_explain(
     handle: &DatabaseHandle,
     spec: &Bound<'_, PyAny>,
 ) -> PyResult<PyObject> {
+    if let Ok(payload) = spec.downcast::<PyBytes>() {
+        return handle.with_db(|db| {
+            let explain = db
+                .explain_json_bytes(payload.as_bytes())
+                .map_err(to_py_err)?;
+            value_to_py(py, explain)
+        });
+    }
     let value = any_to_value(spec)?;
     handle.with_db(|db| {
         let explain = db.explain_json(&value).map_err(to_py_err)?;
@@ -274,12 +297,15 @@ fn database_explain(
 
 #[pyfunction]
 fn database_stream(handle: &DatabaseHandle, spec: &Bound<'_, PyAny>) -> PyResult<StreamHandle> {
-    let value = any_to_value(spec)?;
-    handle.with_db(|db| {
-        let stream = db.stream_json(&value).map_err(to_py_err)?;
-        Ok(StreamHandle {
-            inner: Mutex::new(Some(stream)),
-        })
+    let stream = if let Ok(payload) = spec.downcast::<PyBytes>() {
+        handle.with_db(|db| db.stream_json_bytes(payload.as_bytes()).map_err(to_py_err))?
+    } else {
+        let value = any_to_value(spec)?;
+        handle.with_db(|db| db.stream_json(&value).map_err(to_py_err))?
+    };
+    Ok(StreamHandle {
+        inner: Mutex::new(Some(stream)),
+        pending_err: Mutex::new(None),
     })
 }
 
@@ -296,6 +322,164 @@ fn database_mutate(
     })
 }
 
+/// Like `database_mutate`, but leaves `createdNodes`/`createdEdges` empty so
+/// callers that discard ids skip building the Python lists.
+#[pyfunction]
+fn database_mutate_counts(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    spec: &Bound<'_, PyAny>,
+) -> PyResult<PyObject> {
+    let spec: MutationSpec = serde_json::from_value(any_to_value(spec)?)
+        .map_err(|err| to_py_err(FfiError::Message(format!("invalid mutation spec: {err}"))))?;
+    handle.with_db(|db| {
+        let mut summary = db.mutate(spec).map_err(to_py_err)?;
+        summary.created_nodes = Vec::new();
+        summary.created_edges = Vec::new();
+        let value = serde_json::to_value(summary)
+            .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+        value_to_py(py, value)
+    })
+}
+
+/// Applies `ops` in transactions of at most `batch_size` operations and
+/// returns the merged summary, keeping the chunking loop on the native side.
+#[pyfunction]
+fn database_mutate_many(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    ops: &Bound<'_, PyList>,
+    batch_size: usize,
+) -> PyResult<PyObject> {
+    if batch_size == 0 {
+        return Err(PyValueError::new_err(
+            "batch_size must be a positive integer",
+        ));
+    }
+    handle.with_db(|db| {
+        let mut total = MutationSummary::default();
+        let len = ops.len();
+        let mut start = 0;
+        while start < len {
+            let end = len.min(start + batch_size);
+            let mut batch = Vec::with_capacity(end - start);
+            for idx in start..end {
+                let value = any_to_value(&ops.get_item(idx)?)?;
+                let op: MutationOp = serde_json::from_value(value).map_err(|err| {
+                    to_py_err(FfiError::Message(format!("invalid mutation spec: {err}")))
+                })?;
+                batch.push(op);
+            }
+            let summary = db.mutate(MutationSpec { ops: batch }).map_err(to_py_err)?;
+            total.created_nodes.extend(summary.created_nodes);
+            total.created_edges.extend(summary.created_edges);
+            total.updated_nodes += summary.updated_nodes;
+            total.updated_edges += summary.updated_edges;
+            total.deleted_nodes += summary.deleted_nodes;
+            total.deleted_edges += summary.deleted_edges;
+            start = end;
+        }
+        let value =
+            serde_json::to_value(total).map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+        value_to_py(py, value)
+    })
+}
+
+#[pyfunction]
+fn database_mutate_bytes(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    payload: &[u8],
+) -> PyResult<PyObject> {
+    let spec: MutationSpec = serde_json::from_slice(payload)
+        .map_err(|err| to_py_err(FfiError::Message(format!("invalid mutation spec: {err}"))))?;
+    handle.with_db(|db| {
+        let summary = db.mutate(spec).map_err(to_py_err)?;
+        let value = serde_json::to_value(summary)
+            .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+        value_to_py(py, value)
+    })
+}
+
+#[pyfunction]
+fn database_mutate_compact(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    ops: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let mut parsed = Vec::with_capacity(ops.len());
+    for item in ops.iter() {
+        parsed.push(compact_to_mutation_op(item.downcast::<PyTuple>()?)?);
+    }
+    handle.with_db(|db| {
+        let summary = db.mutate(MutationSpec { ops: parsed }).map_err(to_py_err)?;
+        let value = serde_json::to_value(summary)
+            .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+        value_to_py(py, value)
+    })
+}
+
+#[pyfunction]
+fn database_mutate_columns(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    op: &str,
+    columns: &Bound<'_, PyDict>,
+) -> PyResult<PyObject> {
+    let ops = columns_to_mutation_ops(op, columns)?;
+    handle.with_db(|db| {
+        let summary = db.mutate(MutationSpec { ops }).map_err(to_py_err)?;
+        let value = serde_json::to_value(summary)
+            .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+        value_to_py(py, value)
+    })
+}
+
+/// Creates one `label` node per props mapping in `rows` within a single
+/// mutation, returning the new ids in row order.
+#[pyfunction]
+fn database_bulk_create_nodes(
+    handle: &DatabaseHandle,
+    label: String,
+    rows: &Bound<'_, PyList>,
+) -> PyResult<Vec<u64>> {
+    let labels = vec![label];
+    let mut ops = Vec::with_capacity(rows.len());
+    for props in rows.iter() {
+        ops.push(MutationOp::CreateNode {
+            labels: labels.clone(),
+            props: prop_map(&props)?,
+        });
+    }
+    handle.with_db(|db| {
+        let summary = db.mutate(MutationSpec { ops }).map_err(to_py_err)?;
+        Ok(summary.created_nodes)
+    })
+}
+
+/// Creates one edge per `(src, dst, ty, props)` tuple in `rows` within a
+/// single mutation, returning the new ids in row order.
+#[pyfunction]
+fn database_bulk_create_edges(
+    handle: &DatabaseHandle,
+    rows: &Bound<'_, PyList>,
+) -> PyResult<Vec<u64>> {
+    let mut ops = Vec::with_capacity(rows.len());
+    for row in rows.iter() {
+        let (src, dst, ty, props): (u64, u64, String, Bound<'_, PyAny>) = row.extract()?;
+        ops.push(MutationOp::CreateEdge {
+            src,
+            dst,
+            ty,
+            props: prop_map(&props)?,
+        });
+    }
+    handle.with_db(|db| {
+        let summary = db.mutate(MutationSpec { ops }).map_err(to_py_err)?;
+        Ok(summary.created_edges)
+    })
+}
+
 #[pyfunction]
 fn database_create(
     py: Python<'_>,
@@ -343,6 +527,38 @@ fn database_get_node(
     })
 }
 
+#[pyfunction]
+fn database_nodes_have_label(
+    handle: &DatabaseHandle,
+    node_ids: Vec<u64>,
+    label: &str,
+) -> PyResult<Vec<bool>> {
+    handle.with_db(|db| db.nodes_have_label(&node_ids, label).map_err(to_py_err))
+}
+
+#[pyfunction]
+fn database_get_nodes(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    node_ids: Vec<u64>,
+) -> PyResult<PyObject> {
+    handle.with_db(|db| {
+        let records = db.get_node_records(&node_ids).map_err(to_py_err)?;
+        let list = PyList::empty_bound(py);
+        for record in records {
+            match record {
+                Some(node) => {
+                    let value = serde_json::to_value(node)
+                        .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+                    list.append(value_to_py(py, value)?)?;
+                }
+                None => list.append(py.None())?,
+            }
+        }
+        Ok(list.into_py(py))
+    })
+}
+
 #[pyfunction]
 fn database_get_edge(
     py: Python<'_>,
@@ -377,6 +593,23 @@ fn database_list_nodes_with_label(handle: &DatabaseHandle, label: &str) -> PyRes
     handle.with_db(|db| db.node_ids_with_label(label).map_err(to_py_err))
 }
 
+/// Same ids as `database_list_nodes_with_label`, packed as native-endian u64s.
+#[pyfunction]
+fn database_list_nodes_with_label_packed(
+    py: Python<'_>,
+    handle: &DatabaseHandle,
+    label: &str,
+) -> PyResult<PyObject> {
+    handle.with_db(|db| {
+        let nodes = db.node_ids_with_label(label).map_err(to_py_err)?;
+        let mut buf = Vec::with_capacity(nodes.len() * 8);
+        for id in nodes {
+            buf.extend_from_slice(&id.to_ne_bytes());
+        }
+        Ok(PyBytes::new_bound(py, &buf).into_py(py))
+    })
+}
+
 #[pyfunction]
 fn database_neighbors(
     py: Python<'_>,
@@ -406,6 +639,26 @@ fn database_neighbors(
     })
 }
 
+#[pyfunction]
+fn database_neighbor_ids(
+    handle: &DatabaseHandle,
+    node_id: u64,
+    options: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<u64>> {
+    let parsed = parse_neighbor_options(options)?;
+    handle.with_db(|db| {
+        let neighbors = db
+            .neighbors_with_options(
+                node_id,
+                parsed.direction,
+                parsed.edge_type.as_deref(),
+                parsed.distinct,
+            )
+            .map_err(to_py_err)?;
+        Ok(neighbors.into_iter().map(|entry| entry.node_id).collect())
+    })
+}
+
 #[pyfunction]
 fn database_bfs_traversal(
     py: Python<'_>,
@@ -436,6 +689,44 @@ fn database_bfs_traversal(
     })
 }
 
+#[pyfunction]
+fn database_bfs_reachable_multi(
+    handle: &DatabaseHandle,
+    start_ids: Vec<u64>,
+    max_depth: u32,
+    options: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<u64>> {
+    let parsed = parse_bfs_options(options)?;
+    handle.with_db(|db| {
+        db.bfs_reachable_multi(
+            &start_ids,
+            parsed.direction,
+            max_depth,
+            parsed.edge_types.as_deref(),
+        )
+        .map_err(to_py_err)
+    })
+}
+
+#[pyfunction]
+fn database_bfs_reachable_from_label(
+    handle: &DatabaseHandle,
+    label: &str,
+    max_depth: u32,
+    options: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<u64>> {
+    let parsed = parse_bfs_options(options)?;
+    handle.with_db(|db| {
+        db.bfs_reachable_from_label(
+            label,
+            parsed.direction,
+            max_depth,
+            parsed.edge_types.as_deref(),
+        )
+        .map_err(to_py_err)
+    })
+}
+
 #[pyfunction]
 fn database_pragma_get(py: Python<'_>, handle: &DatabaseHandle, name: &str) -> PyResult<PyObject> {
     handle.with_db(|db| {
@@ -464,6 +755,7 @@ fn database_pragma_set(
 
 #[pyfunction]
 fn stream_next(py: Python<'_>, handle: &StreamHandle) -> PyResult<Option<PyObject>> {
+    take_pending_stream_err(handle)?;
     let mut guard = handle
         .inner
         .lock()
@@ -477,6 +769,55 @@ fn stream_next(py: Python<'_>, handle: &StreamHandle) -> PyResult<Option<PyObjec
     }
 }
 
+/// Pulls up to `max_rows` rows in one call; an empty list means the stream is done.
+///
+/// If the stream fails after some rows were collected, those rows are returned
+/// and the error is raised by the next call, matching per-row `stream_next`.
+#[pyfunction]
+fn stream_next_batch(py: Python<'_>, handle: &StreamHandle, max_rows: usize) -> PyResult<PyObject> {
+    take_pending_stream_err(handle)?;
+    let mut guard = handle
+        .inner
+        .lock()
+        .map_err(|_| PyRuntimeError::new_err("[CLOSED] stream handle lock poisoned"))?;
+    let stream = guard
+        .as_mut()
+        .ok_or_else(|| PyRuntimeError::new_err("[CLOSED] stream is closed"))?;
+    let list = PyList::empty_bound(py);
+    for _ in 0..max_rows.max(1) {
+        let next = stream
+            .next()
+            .map_err(to_py_err)
+            .and_then(|row| row.map(|value| value_to_py(py, value)).transpose());
+        match next {
+            Ok(Some(value)) => list.append(value)?,
+            Ok(None) => break,
+            Err(err) if list.is_empty() => return Err(err),
+            Err(err) => {
+                let mut pending = handle
+                    .pending_err
+                    .lock()
+                    .map_err(|_| PyRuntimeError::new_err("[CLOSED] stream handle lock poisoned"))?;
+                *pending = Some(err);
+                break;
+            }
+        }
+    }
+    Ok(list.into_py(py))
+}
+
+fn take_pending_stream_err(handle: &StreamHandle) -> PyResult<()> {
+    let pending = handle
+        .pending_err
+        .lock()
+        .map_err(|_| PyRuntimeError::new_err("[CLOSED] stream handle lock poisoned"))?
+        .take();
+    match pending {
+        Some(err) => Err(err),
+        None => Ok(()),
+    }
+}
+
 #[pyfunction]
 fn stream_close(handle: &StreamHandle) -> PyResult<()> {
     let mut guard = handle
@@ -501,19 +842,40 @@ fn _native(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(pyo3::wrap_pyfunction!(database_explain, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_stream, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_mutate, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_mutate_bytes, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_mutate_counts, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_mutate_many, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(encode_literal_list, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_mutate_compact, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_mutate_columns, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_bulk_create_nodes, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_bulk_create_edges, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_create, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_intern, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_pragma_get, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_pragma_set, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_cancel_request, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_get_node, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_get_nodes, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_nodes_have_label, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_get_edge, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_count_nodes_with_label, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_count_edges_with_type, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_list_nodes_with_label, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(
+        database_list_nodes_with_label_packed,
+        m
+    )?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_neighbors, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_neighbor_ids, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_bfs_traversal, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(database_bfs_reachable_multi, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(
+        database_bfs_reachable_from_label,
+        m
+    )?)?;
     m.add_function(pyo3::wrap_pyfunction!(stream_next, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(stream_next_batch, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(stream_close, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(database_seed_demo, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(version, m)?)?;
@@ -622,6 +984,266 @@ fn parse_synchronous(value: &str) -> PyResult<Synchronous> {
     })
 }
 
+/// Decodes a positional op record whose first element is the op kind:
+/// `(0, labels, props)`, `(1, id, set, unset)`, `(2, id, cascade)`,
+/// `(3, src, dst, ty, props)`, `(4, id, set, unset)`, or `(5, id)`.
+fn compact_to_mutation_op(op: &Bound<'_, PyTuple>) -> PyResult<MutationOp> {
+    let kind = op.get_item(0)?.extract::<u8>()?;
+    let props_at = |idx: usize| -> PyResult<Map<String, Value>> { prop_map(&op.get_item(idx)?) };
+    match (kind, op.len()) {
+        (0, 3) => Ok(MutationOp::CreateNode {
+            labels: op.get_item(1)?.extract()?,
+            props: props_at(2)?,
+        }),
+        (1, 4) => Ok(MutationOp::UpdateNode {
+            id: op.get_item(1)?.extract()?,
+            set: props_at(2)?,
+            unset: op.get_item(3)?.extract()?,
+        }),
+        (2, 3) => Ok(MutationOp::DeleteNode {
+            id: op.get_item(1)?.extract()?,
+            cascade: op.get_item(2)?.extract()?,
+        }),
+        (3, 5) => Ok(MutationOp::CreateEdge {
+            src: op.get_item(1)?.extract()?,
+            dst: op.get_item(2)?.extract()?,
+            ty: op.get_item(3)?.extract()?,
+            props: props_at(4)?,
+        }),
+        (4, 4) => Ok(MutationOp::UpdateEdge {
+            id: op.get_item(1)?.extract()?,
+            set: props_at(2)?,
+            unset: op.get_item(3)?.extract()?,
+        }),
+        (5, 2) => Ok(MutationOp::DeleteEdge {
+            id: op.get_item(1)?.extract()?,
+        }),
+        (kind, len) => Err(PyRuntimeError::new_err(format!(
+            "invalid compact mutation record (kind {kind}, {len} fields)"
+        ))),
+    }
+}
+
+fn prop_map(value: &Bound<'_, PyAny>) -> PyResult<Map<String, Value>> {
+    if value.is_none() {
+        return Ok(Map::new());
+    }
+    match any_to_value(value)? {
+        Value::Object(map) => Ok(map),
+        _ => Err(PyRuntimeError::new_err(
+            "mutation properties must be a dict",
+        )),
+    }
+}
+
+/// Expands a column-oriented payload into one mutation op per row.
+///
+/// Per-row fields (`id`, `src`, `dst`, and the property columns under
+/// `props`/`set`) are sequences of equal length; `labels`, `ty`, `cascade`,
+/// and `unset` are broadcast to every row.
+fn columns_to_mutation_ops(op: &str, columns: &Bound<'_, PyDict>) -> PyResult<Vec<MutationOp>> {
+    match op {
+        "createNode" => {
+            let labels = required_column::<Vec<String>>(columns, "labels")?;
+            let len = match columns.get_item("count")? {
+                Some(value) => value.extract::<usize>()?,
+                None => first_prop_column_len(columns, "props")?,
+            };
+            let rows = prop_rows(columns, "props", len)?;
+            Ok(rows
+                .into_iter()
+                .map(|props| MutationOp::CreateNode {
+                    labels: labels.clone(),
+                    props,
+                })
+                .collect())
+        }
+        "updateNode" | "updateEdge" => {
+            let ids = required_column::<Vec<u64>>(columns, "id")?;
+            let unset = match columns.get_item("unset")? {
+                Some(value) => value.extract::<Vec<String>>()?,
+                None => Vec::new(),
+            };
+            let rows = prop_rows(columns, "set", ids.len())?;
+            let node = op == "updateNode";
+            Ok(ids
+                .into_iter()
+                .zip(rows)
+                .map(|(id, set)| {
+                    let unset = unset.clone();
+                    if node {
+                        MutationOp::UpdateNode { id, set, unset }
+                    } else {
+                        MutationOp::UpdateEdge { id, set, unset }
+                    }
+                })
+                .collect())
+        }
+        "deleteNode" => {
+            let ids = required_column::<Vec<u64>>(columns, "id")?;
+            let cascade = match columns.get_item("cascade")? {
+                Some(value) => value.extract::<bool>()?,
+                None => false,
+            };
+            Ok(ids
+                .into_iter()
+                .map(|id| MutationOp::DeleteNode { id, cascade })
+                .collect())
+        }
+        "createEdge" => {
+            let src = required_column::<Vec<u64>>(columns, "src")?;
+            let dst = required_column::<Vec<u64>>(columns, "dst")?;
+            let ty = required_column::<String>(columns, "ty")?;
+            if src.len() != dst.len() {
+                return Err(PyRuntimeError::new_err(
+                    "columnar createEdge requires 'src' and 'dst' columns of equal length",
+                ));
+            }
+            let rows = prop_rows(columns, "props", src.len())?;
+            Ok(src
+                .into_iter()
+                .zip(dst)
+                .zip(rows)
+                .map(|((src, dst), props)| MutationOp::CreateEdge {
+                    src,
+                    dst,
+                    ty: ty.clone(),
+                    props,
+                })
+                .collect())
+        }
+        "deleteEdge" => {
+            let ids = required_column::<Vec<u64>>(columns, "id")?;
+            Ok(ids
+                .into_iter()
+                .map(|id| MutationOp::DeleteEdge { id })
+                .collect())
+        }
+        other => Err(PyRuntimeError::new_err(format!(
+            "unsupported columnar mutation op '{other}'"
+        ))),
+    }
+}
+
+fn required_column<'py, T: FromPyObject<'py>>(
+    columns: &Bound<'py, PyDict>,
+    key: &str,
+) -> PyResult<T> {
+    match columns.get_item(key)? {
+        Some(value) => value.extract::<T>(),
+        None => Err(PyRuntimeError::new_err(format!(
+            "columnar mutation requires a '{key}' column"
+        ))),
+    }
+}
+
+fn first_prop_column_len(columns: &Bound<'_, PyDict>, key: &str) -> PyResult<usize> {
+    if let Some(value) = columns.get_item(key)? {
+        let props = value.downcast::<PyDict>()?;
+        if let Some((_, column)) = props.iter().next() {
+            return column.len();
+        }
+    }
+    Err(PyRuntimeError::new_err(
+        "columnar createNode requires a 'count' or at least one property column",
+    ))
+}
+
+fn prop_rows(
+    columns: &Bound<'_, PyDict>,
+    key: &str,
+    len: usize,
+) -> PyResult<Vec<Map<String, Value>>> {
+    let mut rows: Vec<Map<String, Value>> = (0..len).map(|_| Map::new()).collect();
+    let Some(value) = columns.get_item(key)? else {
+        return Ok(rows);
+    };
+    let props = value.downcast::<PyDict>()?;
+    for (name, column) in props.iter() {
+        let name: String = name.extract()?;
+        if column.len()? != len {
+            return Err(PyRuntimeError::new_err(format!(
+                "property column '{name}' must have {len} entries"
+            )));
+        }
+        for (row, item) in rows.iter_mut().zip(column.iter()?) {
+            row.insert(name.clone(), any_to_value(&item?)?);
+        }
+    }
+    Ok(rows)
+}
+
+/// Tags the scalar literals of an `in` predicate in one call. Exact
+/// None/bool/int/float/str values are tagged here; anything else (datetimes,
+/// bytes, subclasses, out-of-range numbers) goes through the Python `fallback`
+/// so both paths share a single set of literal rules.
+#[pyfunction]
+fn encode_literal_list<'py>(
+    py: Python<'py>,
+    values: &Bound<'py, PyList>,
+    fallback: &Bound<'py, PyAny>,
+) -> PyResult<Bound<'py, PyList>> {
+    let tagged = PyList::empty_bound(py);
+    let mut exemplar: Option<String> = None;
+    for value in values.iter() {
+        if value.is_instance_of::<PyList>()
+            || value.is_instance_of::<PyTuple>()
+            || value.is_instance_of::<PySet>()
+            || value.is_instance_of::<PyDict>()
+        {
+            return Err(PyTypeError::new_err(
+                "in_() does not accept nested collections",
+            ));
+        }
+        let native_tag = if value.is_none() {
+            Some("Null")
+        } else if value.is_exact_instance_of::<PyBool>() {
+            Some("Bool")
+        } else if value.is_exact_instance_of::<PyLong>() && value.extract::<i64>().is_ok() {
+            Some("Int")
+        } else if value.is_exact_instance_of::<PyFloat>() && value.extract::<f64>()?.is_finite() {
+            Some("Float")
+        } else if value.is_exact_instance_of::<PyString>() {
+            Some("String")
+        } else {
+            None
+        };
+        let (entry, tag) = match native_tag {
+            Some(tag) => {
+                let entry = PyDict::new_bound(py);
+                entry.set_item("t", tag)?;
+                if tag != "Null" {
+                    entry.set_item("v", &value)?;
+                }
+                (entry, tag.to_owned())
+            }
+            None => {
+                let entry = fallback
+                    .call1((value.clone(),))?
+                    .downcast_into::<PyDict>()?;
+                let tag = entry
+                    .get_item("t")?
+                    .ok_or_else(|| PyRuntimeError::new_err("literal is missing its tag"))?
+                    .extract::<String>()?;
+                (entry, tag)
+            }
+        };
+        if tag != "Null" {
+            match &exemplar {
+                None => exemplar = Some(tag),
+                Some(expected) if *expected != tag => {
+                    return Err(PyValueError::new_err(
+                        "in_() requires all literals to share the same type",
+                    ));
+                }
+                Some(_) => {}
+            }
+        }
+        tagged.append(entry)?;
+    }
+    Ok(tagged)
+}
+
 fn any_to_value(obj: &Bound<'_, PyAny>) -> PyResult<Value> {
     if obj.is_none() {
         return Ok(Value::Null);
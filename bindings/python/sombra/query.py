@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import base64
-import copy
+import hashlib
+import json
 import math
 import re
+import sys
+from array import array
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
@@ -125,6 +128,9 @@ _ERROR_CLASS_MAP: Dict[str, Type[SombraError]] = {
     ErrorCode.NOT_FOUND: NotFoundError,
     ErrorCode.CLOSED: ClosedError,
 }
+# Bound once so the error path skips the attribute lookups.
+_ERROR_CODE_MATCH = _ERROR_CODE_REGEX.match
+_ERROR_CLASS_LOOKUP = _ERROR_CLASS_MAP.get
 
 
 def wrap_native_error(err: BaseException) -> SombraError:
@@ -139,12 +145,13 @@ def wrap_native_error(err: BaseException) -> SombraError:
         A typed SombraError subclass instance
     """
     message = str(err)
-    match = _ERROR_CODE_REGEX.match(message)
+    # Messages without a "[CODE]" prefix never reach the regex engine.
+    match = _ERROR_CODE_MATCH(message) if message.startswith("[") else None
     
     if match:
         code = match.group(1)
         clean_message = message[match.end():]
-        error_class = _ERROR_CLASS_MAP.get(code, SombraError)
+        error_class = _ERROR_CLASS_LOOKUP(code, SombraError)
         return error_class(clean_message)
     
     # No code prefix, return as generic SombraError
@@ -164,21 +171,31 @@ def _wrap_native_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
 class QueryResult(dict):
     """Envelope returned by execute()/explain() with convenience helpers."""
 
+    # Set on envelopes that already went through _normalize_envelope, whose
+    # accessors can then skip the per-call type checks.
+    _validated = False
+
+    @classmethod
+    def _from_envelope(cls, payload: Dict[str, Any]) -> "QueryResult":
+        result = cls(payload)
+        result._validated = True
+        return result
+
     def rows(self) -> List[Dict[str, Any]]:
         rows = self.get("rows") or []
-        if not isinstance(rows, list):
+        if not self._validated and not isinstance(rows, list):
             raise TypeError("result rows must be a list")
         return rows
 
     def request_id(self) -> Optional[str]:
         rid = self.get("request_id")
-        if rid is not None and not isinstance(rid, str):
+        if not self._validated and rid is not None and not isinstance(rid, str):
             raise TypeError("request_id must be a string when present")
         return rid
 
     def features(self) -> List[Any]:
         feats = self.get("features") or []
-        if not isinstance(feats, list):
+        if not self._validated and not isinstance(feats, list):
             raise TypeError("features must be a list")
         return feats
 
@@ -194,11 +211,29 @@ class QueryResult(dict):
 
     def plan_hash(self) -> Optional[str]:
         value = self.get("plan_hash")
-        if value is not None and not isinstance(value, str):
+        if not self._validated and value is not None and not isinstance(value, str):
             raise TypeError("plan_hash must be a string when present")
         return value
 
-LiteralInput = Optional[Union[str, int, float, bool, datetime, bytes, bytearray, memoryview]]
+class Param:
+    """Named placeholder for a literal supplied later through ``PreparedQuery.bind``."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        if not isinstance(name, str) or not name:
+            raise ValueError("param() requires a non-empty name")
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"param({self.name!r})"
+
+
+def param(name: str) -> Param:
+    return Param(name)
+
+
+LiteralInput = Optional[Union[str, int, float, bool, datetime, bytes, bytearray, memoryview, Param]]
 ProjectionField = Union[
     str,
     Dict[str, Optional[str]],
@@ -206,8 +241,63 @@ ProjectionField = Union[
 ]
 
 
+_AUTO_VAR_NAMES = tuple(sys.intern(f"n{i}") for i in range(64))
+_DIRECTIONS = frozenset(("out", "in", "both"))
+
+
 def _auto_var_name(idx: int) -> str:
-    return f"n{idx}"
+    if 0 <= idx < 64:
+        return _AUTO_VAR_NAMES[idx]
+    return sys.intern(f"n{idx}")
+
+
+def _intern_name(value: Optional[str]) -> Optional[str]:
+    # Variable, label and edge-type names repeat across clauses and specs, so
+    # interning lets dict lookups and comparisons hit the identity fast path.
+    # sys.intern rejects str subclasses; those are kept as-is.
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def _neighbor_options(
+    ctx: str,
+    node_id: int,
+    direction: str,
+    edge_type: Optional[str],
+    distinct: bool,
+) -> Dict[str, Any]:
+    if not isinstance(node_id, int) or node_id < 0:
+        raise ValueError(f"{ctx}() requires a non-negative node id")
+    if direction not in _DIRECTIONS:
+        raise ValueError("direction must be 'out', 'in', or 'both'")
+    options: Dict[str, Any] = {"direction": direction, "distinct": bool(distinct)}
+    if edge_type is not None:
+        if not isinstance(edge_type, str) or not edge_type.strip():
+            raise ValueError("edge_type must be a non-empty string when provided")
+        options["edge_type"] = edge_type
+    return options
+
+
+def _reachable_options(
+    ctx: str,
+    max_depth: int,
+    direction: str,
+    edge_types: Optional[Sequence[str]],
+) -> Dict[str, Any]:
+    if not isinstance(max_depth, int) or max_depth < 0:
+        raise ValueError(f"{ctx}() requires a non-negative integer max_depth")
+    if direction not in _DIRECTIONS:
+        raise ValueError("direction must be 'out', 'in', or 'both'")
+    options: Dict[str, Any] = {"direction": direction}
+    if edge_types is not None:
+        values: List[str] = []
+        for ty in edge_types:
+            if not isinstance(ty, str) or not ty.strip():
+                raise ValueError("edge_types entries must be non-empty strings")
+            values.append(ty)
+        options["edge_types"] = values
+    return options
 
 
 def _normalize_target(
@@ -250,39 +340,119 @@ _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 _MIN_DATETIME = datetime(1900, 1, 1, tzinfo=timezone.utc)
 _MAX_DATETIME = datetime(2100, 1, 1, tzinfo=timezone.utc)
 _NANOS_PER_SECOND = 1_000_000_000
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MIN_NS = int((_MIN_DATETIME - _EPOCH).total_seconds()) * _NANOS_PER_SECOND
+_MAX_NS = int((_MAX_DATETIME - _EPOCH).total_seconds()) * _NANOS_PER_SECOND
+
+# Shared literal payloads for the most common values. Spec nodes are read-only
+# once built, so the same dicts can appear in many specs.
+_LIT_NULL: Dict[str, Any] = {"t": "Null"}
+_LIT_TRUE: Dict[str, Any] = {"t": "Bool", "v": True}
+_LIT_FALSE: Dict[str, Any] = {"t": "Bool", "v": False}
+_INT_LIT_CACHE: Dict[int, Dict[str, Any]] = {i: {"t": "Int", "v": i} for i in range(-8, 257)}
 
 
 def _encode_bytes_literal(value: Union[bytes, bytearray, memoryview]) -> str:
-    buf = bytes(value)
-    return base64.b64encode(buf).decode("ascii")
+    # b64encode reads any contiguous buffer directly; only strided memoryviews
+    # need a bytes() copy. Base64 output is ASCII, so latin-1 decodes it
+    # without the range check.
+    if type(value) is memoryview and not value.c_contiguous:
+        value = bytes(value)
+    return base64.b64encode(value).decode("latin-1")
+
+
+def _lit_null(value: None) -> Dict[str, Any]:
+    return _LIT_NULL
+
+
+def _lit_bool(value: bool) -> Dict[str, Any]:
+    return _LIT_TRUE if value else _LIT_FALSE
+
+
+def _lit_datetime(value: datetime) -> Dict[str, Any]:
+    return {"t": "DateTime", "v": _datetime_to_ns(value)}
+
+
+def _lit_int(value: int) -> Dict[str, Any]:
+    cached = _INT_LIT_CACHE.get(value)
+    if cached is not None:
+        return cached
+    if value < _I64_MIN or value > _I64_MAX:
+        raise ValueError("integer literal must fit within signed 64-bit range")
+    return {"t": "Int", "v": value}
+
+
+def _lit_float(value: float) -> Dict[str, Any]:
+    if not math.isfinite(value):
+        raise ValueError("float literal must be finite")
+    return {"t": "Float", "v": value}
+
+
+def _lit_str(value: str) -> Dict[str, Any]:
+    return {"t": "String", "v": value}
+
+
+def _lit_bytes(value: Union[bytes, bytearray, memoryview]) -> Dict[str, Any]:
+    return {"t": "Bytes", "v": _encode_bytes_literal(value)}
+
+
+def _lit_param(value: Param) -> Dict[str, Any]:
+    return {"t": "Param", "name": value.name}
+
+
+# Exact-type dispatch; subclasses (IntEnum, datetime subclasses, ...) fall back
+# to the isinstance ladder in _literal_value.
+_LITERAL_DISPATCH: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    type(None): _lit_null,
+    bool: _lit_bool,
+    int: _lit_int,
+    float: _lit_float,
+    str: _lit_str,
+    datetime: _lit_datetime,
+    bytes: _lit_bytes,
+    bytearray: _lit_bytes,
+    memoryview: _lit_bytes,
+    Param: _lit_param,
+}
+
+
+_NESTED_COLLECTION_TYPES = (list, tuple, set, dict)
+_BYTES_LIKE_TYPES = (bytes, bytearray, memoryview)
+# Exact-type sets for the common case; the tuples above back the isinstance
+# fallback for subclasses.
+_COLLECTION_TYPES = frozenset(_NESTED_COLLECTION_TYPES)
+_BYTES_TYPES = frozenset(_BYTES_LIKE_TYPES)
+_SCALAR_TYPES = frozenset((type(None), str, int, float, bool))
+# Below this many values the per-call FFI cost outweighs tagging in Python.
+_NATIVE_IN_LIST_MIN = 16
+
+
+def _is_nested_collection(value: Any) -> bool:
+    kind = type(value)
+    if kind in _LITERAL_DISPATCH:
+        return False
+    return kind in _COLLECTION_TYPES or isinstance(value, _NESTED_COLLECTION_TYPES)
 
 
 def _literal_value(value: LiteralInput) -> Dict[str, Any]:
-    if value is None:
-        return {"t": "Null"}
+    handler = _LITERAL_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
     if isinstance(value, bool):
-        return {"t": "Bool", "v": value}
+        return _lit_bool(value)
     if isinstance(value, datetime):
-        return {"t": "DateTime", "v": _datetime_to_ns(value)}
+        return _lit_datetime(value)
     if isinstance(value, int):
-        if value < _I64_MIN or value > _I64_MAX:
-            raise ValueError("integer literal must fit within signed 64-bit range")
-        return {"t": "Int", "v": value}
+        return _lit_int(value)
     if isinstance(value, float):
-        if math.isnan(value) or math.isinf(value):
-            raise ValueError("float literal must be finite")
-        return {"t": "Float", "v": value}
+        return _lit_float(value)
     if isinstance(value, str):
-        return {"t": "String", "v": value}
-    if isinstance(value, (bytes, bytearray, memoryview)):
-        return {"t": "Bytes", "v": _encode_bytes_literal(value)}
+        return _lit_str(value)
+    if isinstance(value, _BYTES_LIKE_TYPES):
+        return _lit_bytes(value)
     raise ValueError(f"unsupported literal type: {type(value)!r}")
 
 
-def _clone(obj: Dict[str, Any]) -> Dict[str, Any]:
-    return copy.deepcopy(obj)
-
-
 def _empty_mutation_summary() -> Dict[str, Any]:
     return {
         "createdNodes": [],
@@ -294,22 +464,20 @@ def _empty_mutation_summary() -> Dict[str, Any]:
     }
 
 
-def _merge_mutation_summaries(lhs: Dict[str, Any], rhs: Dict[str, Any]) -> Dict[str, Any]:
-    left = lhs or _empty_mutation_summary()
-    right = rhs or _empty_mutation_summary()
-    return {
-        "createdNodes": list(left.get("createdNodes") or []) + list(right.get("createdNodes") or []),
-        "createdEdges": list(left.get("createdEdges") or []) + list(right.get("createdEdges") or []),
-        "updatedNodes": int(left.get("updatedNodes") or 0) + int(right.get("updatedNodes") or 0),
-        "updatedEdges": int(left.get("updatedEdges") or 0) + int(right.get("updatedEdges") or 0),
-        "deletedNodes": int(left.get("deletedNodes") or 0) + int(right.get("deletedNodes") or 0),
-        "deletedEdges": int(left.get("deletedEdges") or 0) + int(right.get("deletedEdges") or 0),
-    }
-
-
 def _normalize_envelope(payload: Dict[str, Any], *, expect_plan: bool = False) -> Dict[str, Any]:
-    if "request_id" not in payload:
+    # Validated once here so QueryResult accessors can trust the shape.
+    rid = payload.get("request_id")
+    if rid is None:
         payload["request_id"] = None
+    elif not isinstance(rid, str):
+        raise TypeError("request_id must be a string when present")
+    if not isinstance(payload.get("rows") or [], list):
+        raise TypeError("result rows must be a list")
+    if not isinstance(payload.get("features") or [], list):
+        raise TypeError("features must be a list")
+    plan_hash = payload.get("plan_hash")
+    if plan_hash is not None and not isinstance(plan_hash, str):
+        raise TypeError("plan_hash must be a string when present")
     if expect_plan:
         plan = payload.get("plan")
         if plan is None:
@@ -324,7 +492,8 @@ def _normalize_envelope(payload: Dict[str, Any], *, expect_plan: bool = False) -
 
 
 def _normalize_prop_name(prop: str) -> str:
-    if not isinstance(prop, str) or not prop.strip():
+    # isspace() answers the blank check without allocating a stripped copy.
+    if not isinstance(prop, str) or not prop or prop.isspace():
         raise ValueError("property name must be a non-empty string")
     return prop
 
@@ -332,7 +501,7 @@ def _normalize_prop_name(prop: str) -> str:
 def _normalize_labels(labels: Union[str, Sequence[str]]) -> List[str]:
     if isinstance(labels, str):
         return [labels]
-    if isinstance(labels, Sequence):
+    if type(labels) is list or type(labels) is tuple or isinstance(labels, Sequence):
         result: List[str] = []
         for label in labels:
             if not isinstance(label, str):
@@ -364,17 +533,31 @@ def _ensure_expr(value: Any, ctx: str) -> Dict[str, Any]:
 
 
 def _ensure_expr_prop(prop: Any, ctx: str) -> str:
-    if not isinstance(prop, str) or not prop.strip():
+    if not isinstance(prop, str) or not prop or prop.isspace():
         raise ValueError(f"{ctx} requires a non-empty property name")
     return prop
 
 
+def _is_literal_sequence(values: Any) -> bool:
+    # Concrete list/tuple checks avoid the Sequence ABC instance-check path.
+    if type(values) is list or type(values) is tuple:
+        return True
+    return isinstance(values, Sequence) and not isinstance(values, (str, bytes, bytearray))
+
+
+def _is_bool_pair(value: Any) -> bool:
+    if type(value) is list or type(value) is tuple:
+        return len(value) == 2 and type(value[0]) is bool and type(value[1]) is bool
+    return isinstance(value, Sequence) and len(value) == 2 and all(isinstance(flag, bool) for flag in value)
+
+
 def _ensure_scalar_literal(value: Any, ctx: str) -> None:
-    if isinstance(value, (list, tuple, set, dict)):
-        raise TypeError(f"{ctx} does not accept nested arrays or objects")
-    if isinstance(value, (datetime, bytes, bytearray, memoryview)):
+    kind = type(value)
+    if kind in _SCALAR_TYPES or kind in _BYTES_TYPES or kind is datetime:
         return
-    if value is None or isinstance(value, (str, int, float, bool)):
+    if kind in _COLLECTION_TYPES or isinstance(value, _NESTED_COLLECTION_TYPES):
+        raise TypeError(f"{ctx} does not accept nested arrays or objects")
+    if isinstance(value, (datetime, str, int, float, bytes, bytearray, memoryview)):
         return
     raise TypeError(f"{ctx} requires scalar literal values")
 
@@ -430,11 +613,7 @@ def between(
     inclusive: Optional[Sequence[bool]] = None,
 ) -> Expr:
     if inclusive is not None:
-        if (
-            not isinstance(inclusive, Sequence)
-            or len(inclusive) != 2
-            or not all(isinstance(flag, bool) for flag in inclusive)
-        ):
+        if not _is_bool_pair(inclusive):
             raise ValueError("inclusive must be a two-element sequence of booleans")
         flags: Optional[List[bool]] = [bool(inclusive[0]), bool(inclusive[1])]
     else:
@@ -451,7 +630,7 @@ def between(
 
 
 def in_list(prop: str, values: Sequence[LiteralInput]) -> Expr:
-    if not isinstance(values, Sequence) or isinstance(values, (str, bytes, bytearray)):
+    if not _is_literal_sequence(values):
         raise TypeError("in_list() requires a sequence of literal values")
     items = list(values)
     if not items:
@@ -474,9 +653,20 @@ def is_not_null(prop: str) -> Expr:
 
 
 _PRAGMA_SENTINEL = object()
+_COLUMNAR_MUTATION_OPS = ("createNode", "updateNode", "deleteNode", "createEdge", "updateEdge", "deleteEdge")
+
+# Op kinds for the positional records accepted by Database.mutate_compact().
+OP_CREATE_NODE = 0  # (OP_CREATE_NODE, labels, props)
+OP_UPDATE_NODE = 1  # (OP_UPDATE_NODE, id, set, unset)
+OP_DELETE_NODE = 2  # (OP_DELETE_NODE, id, cascade)
+OP_CREATE_EDGE = 3  # (OP_CREATE_EDGE, src, dst, ty, props)
+OP_UPDATE_EDGE = 4  # (OP_UPDATE_EDGE, id, set, unset)
+OP_DELETE_EDGE = 5  # (OP_DELETE_EDGE, id)
 
 
 class CreateSummaryResult(dict):
+    __slots__ = ()
+
     def __init__(self, summary: Mapping[str, Any]):
         nodes = list(summary.get("nodes") or [])
         edges = list(summary.get("edges") or [])
@@ -491,7 +681,18 @@ class CreateSummaryResult(dict):
         return int(value) if value is not None else None
 
 
+def _adopt_list(value: Optional[Sequence[Any]]) -> List[Any]:
+    # Only for arguments consumed before the call returns; queued ops copy.
+    if value is None:
+        return []
+    if type(value) is list:
+        return value
+    return list(value)
+
+
 class _MutationBatch:
+    __slots__ = ("_ops", "_sealed")
+
     def __init__(self) -> None:
         self._ops: List[Dict[str, Any]] = []
         self._sealed = False
@@ -551,15 +752,23 @@ class _MutationBatch:
 
     def drain(self) -> List[Dict[str, Any]]:
         self._sealed = True
-        ops = list(self._ops)
-        self._ops.clear()
+        ops = self._ops
+        self._ops = []
         return ops
 
 
 class _QueryStream:
+    # Rows are pulled from the native stream in batches of _BATCH_ROWS and
+    # served from a local buffer, so most steps never cross into native code.
+    _BATCH_ROWS = 128
+
+    __slots__ = ("_handle", "_closed", "_buf", "_pos")
+
     def __init__(self, handle: _native.StreamHandle):
         self._handle = handle
         self._closed = False
+        self._buf: List[Any] = []
+        self._pos = 0
 
     def __aiter__(self) -> "_QueryStream":
         return self
@@ -567,11 +776,16 @@ class _QueryStream:
     async def __anext__(self) -> Any:
         if self._closed:
             raise StopAsyncIteration
-        value = _wrap_native_call(_native.stream_next, self._handle)
-        if value is None:
-            self.close()
-            raise StopAsyncIteration
-        return value
+        pos = self._pos
+        buf = self._buf
+        if pos >= len(buf):
+            buf = self._buf = _wrap_native_call(_native.stream_next_batch, self._handle, self._BATCH_ROWS)
+            pos = 0
+            if not buf:
+                self.close()
+                raise StopAsyncIteration
+        self._pos = pos + 1
+        return buf[pos]
 
     async def __aenter__(self) -> "_QueryStream":
         return self
@@ -583,6 +797,7 @@ class _QueryStream:
         if self._closed:
             return
         self._closed = True
+        self._buf = []
         close_fn = getattr(_native, "stream_close", None)
         if close_fn is None:
             return
@@ -603,6 +818,8 @@ class _QueryStream:
 
 
 class _PredicateBuilder:
+    __slots__ = ("_parent", "_var", "_mode", "_validator", "_exprs", "_sealed")
+
     def __init__(
         self,
         parent: Optional["QueryBuilder"],
@@ -649,40 +866,38 @@ class _PredicateBuilder:
             return self._validator(prop)
         return _normalize_prop_name(prop)
 
-    def _comparison(self, op: str, prop: str, extra: Dict[str, Any]) -> "_PredicateBuilder":
-        spec = {"op": op, "var": self._var, "prop": self._normalize_prop(prop)}
-        spec.update(extra)
-        return self._push(spec)
+    def _comparison(self, op: str, prop: str, literal: Dict[str, Any]) -> "_PredicateBuilder":
+        return self._push({"op": op, "var": self._var, "prop": self._normalize_prop(prop), "value": literal})
 
     def eq(self, prop: str, value: LiteralInput) -> "_PredicateBuilder":
-        return self._comparison("eq", prop, {"value": _literal_value(value)})
+        return self._comparison("eq", prop, _literal_value(value))
 
     def ne(self, prop: str, value: LiteralInput) -> "_PredicateBuilder":
-        return self._comparison("ne", prop, {"value": _literal_value(value)})
+        return self._comparison("ne", prop, _literal_value(value))
 
     def lt(self, prop: str, value: LiteralInput) -> "_PredicateBuilder":
         literal = _literal_value(value)
         if literal["t"] == "Null":
             raise ValueError("lt() does not accept null literals")
-        return self._comparison("lt", prop, {"value": literal})
+        return self._comparison("lt", prop, literal)
 
     def le(self, prop: str, value: LiteralInput) -> "_PredicateBuilder":
         literal = _literal_value(value)
         if literal["t"] == "Null":
             raise ValueError("le() does not accept null literals")
-        return self._comparison("le", prop, {"value": literal})
+        return self._comparison("le", prop, literal)
 
     def gt(self, prop: str, value: LiteralInput) -> "_PredicateBuilder":
         literal = _literal_value(value)
         if literal["t"] == "Null":
             raise ValueError("gt() does not accept null literals")
-        return self._comparison("gt", prop, {"value": literal})
+        return self._comparison("gt", prop, literal)
 
     def ge(self, prop: str, value: LiteralInput) -> "_PredicateBuilder":
         literal = _literal_value(value)
         if literal["t"] == "Null":
             raise ValueError("ge() does not accept null literals")
-        return self._comparison("ge", prop, {"value": literal})
+        return self._comparison("ge", prop, literal)
 
     def between(
         self,
@@ -697,11 +912,7 @@ class _PredicateBuilder:
             raise ValueError("between() does not accept null bounds")
         flags = [True, True]
         if inclusive is not None:
-            if (
-                not isinstance(inclusive, Sequence)
-                or len(inclusive) != 2
-                or not all(isinstance(flag, bool) for flag in inclusive)
-            ):
+            if not _is_bool_pair(inclusive):
                 raise ValueError("inclusive must be a two-element sequence of booleans")
             flags = [bool(inclusive[0]), bool(inclusive[1])]
         return self._push(
@@ -716,21 +927,35 @@ class _PredicateBuilder:
         )
 
     def in_(self, prop: str, values: Sequence[LiteralInput]) -> "_PredicateBuilder":
-        if not isinstance(values, Sequence) or isinstance(values, (str, bytes, bytearray)):
+        if not _is_literal_sequence(values):
             raise TypeError("in_() requires a sequence of literal values")
         items = list(values)
         if not items:
             raise ValueError("in_() requires at least one literal")
+        if len(items) > _NATIVE_IN_LIST_MIN:
+            # Long IN lists are tagged in one native call instead of a Python loop.
+            return self._push(
+                {
+                    "op": "in",
+                    "var": self._var,
+                    "prop": self._normalize_prop(prop),
+                    "values": _native.encode_literal_list(items, _literal_value),
+                }
+            )
         tagged: List[Dict[str, Any]] = []
+        append = tagged.append
+        exemplar_t: Optional[str] = None
         for value in items:
-            if isinstance(value, (list, tuple, set, dict)):
+            if _is_nested_collection(value):
                 raise TypeError("in_() does not accept nested collections")
-            tagged.append(_literal_value(value))
-        exemplar = next((entry for entry in tagged if entry["t"] != "Null"), None)
-        if exemplar is not None:
-            for entry in tagged:
-                if entry["t"] != "Null" and entry["t"] != exemplar["t"]:
+            entry = _literal_value(value)
+            tag = entry["t"]
+            if tag != "Null":
+                if exemplar_t is None:
+                    exemplar_t = tag
+                elif tag != exemplar_t:
                     raise ValueError("in_() requires all literals to share the same type")
+            append(entry)
         return self._push(
             {
                 "op": "in",
@@ -777,6 +1002,8 @@ class _PredicateBuilder:
 
 
 class _NodeScope:
+    __slots__ = ("_builder", "_var")
+
     def __init__(self, builder: "QueryBuilder", var_name: str):
         self._builder = builder
         self._var = var_name
@@ -858,30 +1085,48 @@ def _translate_expr_node(
     ctx: str,
     validator: Optional[Callable[[str], str]] = None,
 ) -> Dict[str, Any]:
-    if not isinstance(node, dict):
-        raise TypeError(f"{ctx} must be built via the sombra query helpers")
-    op = node.get("op")
-    if op in ("and", "or"):
-        args = node.get("args")
-        if not isinstance(args, list) or not args:
-            raise ValueError(f"{ctx} {op}_() requires at least one expression")
-        return {
-            "op": op,
-            "args": [
-                _translate_expr_node(builder, var_name, child, f"{ctx}.{op}[{idx}]", validator)
-                for idx, child in enumerate(args)
-            ],
-        }
-    if op == "not":
-        args = node.get("args")
-        if not isinstance(args, list) or len(args) != 1:
-            raise ValueError(f"{ctx} not_() requires exactly one child expression")
-        return {
-            "op": "not",
-            "args": [_translate_expr_node(builder, var_name, args[0], f"{ctx}.not", validator)],
-        }
-    prop_validator = validator or builder._make_prop_validator(var_name)
-    return _translate_comparison_node(builder, var_name, node, ctx, prop_validator)
+    # Explicit-stack walk so deeply nested and_/or_/not_ trees cannot hit the
+    # recursion limit. Each parent's args list is allocated before its
+    # children are visited; children fill their slot in order. Subtrees reused
+    # by identity (e.g. one eq() passed to several and_() calls) are
+    # translated once and shared.
+    prop_validator = validator
+    root: List[Any] = [None]
+    translated: Dict[int, Dict[str, Any]] = {}
+    stack: List[Tuple[Any, str, List[Any], int]] = [(node, ctx, root, 0)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        current, current_ctx, target, slot = pop()
+        cached = translated.get(id(current))
+        if cached is not None:
+            target[slot] = cached
+            continue
+        if not isinstance(current, dict):
+            raise TypeError(f"{current_ctx} must be built via the sombra query helpers")
+        op = current.get("op")
+        if op == "and" or op == "or":
+            args = current.get("args")
+            if not isinstance(args, list) or not args:
+                raise ValueError(f"{current_ctx} {op}_() requires at least one expression")
+            children: List[Any] = [None] * len(args)
+            target[slot] = translated[id(current)] = {"op": op, "args": children}
+            for idx in range(len(args) - 1, -1, -1):
+                push((args[idx], f"{current_ctx}.{op}[{idx}]", children, idx))
+        elif op == "not":
+            args = current.get("args")
+            if not isinstance(args, list) or len(args) != 1:
+                raise ValueError(f"{current_ctx} not_() requires exactly one child expression")
+            children = [None]
+            target[slot] = translated[id(current)] = {"op": "not", "args": children}
+            push((args[0], f"{current_ctx}.not", children, 0))
+        else:
+            if prop_validator is None:
+                prop_validator = builder._cached_prop_validator(var_name)
+            target[slot] = translated[id(current)] = _translate_comparison_node(
+                builder, var_name, current, current_ctx, prop_validator
+            )
+    return root[0]
 
 
 def _translate_comparison_node(
@@ -893,66 +1138,202 @@ def _translate_comparison_node(
 ) -> Dict[str, Any]:
     prop = validator(_ensure_expr_prop(node.get("prop"), ctx))
     op = node.get("op")
-    if op in {"eq", "ne", "lt", "le", "gt", "ge"}:
-        if "value" not in node:
-            raise ValueError(f"{ctx} {op}() requires a value")
-        literal = _literal_value(node["value"])
-        if op in {"lt", "le", "gt", "ge"} and literal["t"] == "Null":
-            raise ValueError(f"{ctx} {op}() does not accept null literals")
-        return {"op": op, "var": var_name, "prop": prop, "value": literal}
-    if op == "between":
-        if "low" not in node or "high" not in node:
-            raise ValueError(f"{ctx} between() requires low and high bounds")
-        low_literal = _literal_value(node["low"])
-        high_literal = _literal_value(node["high"])
-        if low_literal["t"] == "Null" or high_literal["t"] == "Null":
-            raise ValueError(f"{ctx} between() does not accept null bounds")
-        inclusive = _normalize_inclusive_tuple(node.get("inclusive"))
-        return {
-            "op": "between",
-            "var": var_name,
-            "prop": prop,
-            "low": low_literal,
-            "high": high_literal,
-            "inclusive": inclusive,
-        }
-    if op == "in":
-        raw_values = node.get("values")
-        if not isinstance(raw_values, list) or not raw_values:
-            raise ValueError(f"{ctx} in_list() requires at least one literal")
-        tagged = _convert_in_list_values(raw_values)
-        return {"op": "in", "var": var_name, "prop": prop, "values": tagged}
-    if op in {"exists", "isNull", "isNotNull"}:
-        return {"op": op, "var": var_name, "prop": prop}
-    raise ValueError(f"unsupported expression operator '{op}'")
+    translate = _COMPARISON_TRANSLATORS.get(op)
+    if translate is None:
+        raise ValueError(f"unsupported expression operator '{op}'")
+    return translate(op, var_name, prop, node, ctx)
+
+
+def _translate_compare(op: str, var_name: str, prop: str, node: Dict[str, Any], ctx: str) -> Dict[str, Any]:
+    if "value" not in node:
+        raise ValueError(f"{ctx} {op}() requires a value")
+    literal = _literal_value(node["value"])
+    if literal["t"] == "Null" and op in _ORDERED_COMPARISON_OPS:
+        raise ValueError(f"{ctx} {op}() does not accept null literals")
+    return {"op": op, "var": var_name, "prop": prop, "value": literal}
+
+
+def _translate_between(op: str, var_name: str, prop: str, node: Dict[str, Any], ctx: str) -> Dict[str, Any]:
+    if "low" not in node or "high" not in node:
+        raise ValueError(f"{ctx} between() requires low and high bounds")
+    low_literal = _literal_value(node["low"])
+    high_literal = _literal_value(node["high"])
+    if low_literal["t"] == "Null" or high_literal["t"] == "Null":
+        raise ValueError(f"{ctx} between() does not accept null bounds")
+    inclusive = _normalize_inclusive_tuple(node.get("inclusive"))
+    return {
+        "op": "between",
+        "var": var_name,
+        "prop": prop,
+        "low": low_literal,
+        "high": high_literal,
+        "inclusive": inclusive,
+    }
+
+
+def _translate_in(op: str, var_name: str, prop: str, node: Dict[str, Any], ctx: str) -> Dict[str, Any]:
+    raw_values = node.get("values")
+    if not isinstance(raw_values, list) or not raw_values:
+        raise ValueError(f"{ctx} in_list() requires at least one literal")
+    tagged = _convert_in_list_values(raw_values)
+    return {"op": "in", "var": var_name, "prop": prop, "values": tagged}
+
+
+def _translate_presence(op: str, var_name: str, prop: str, node: Dict[str, Any], ctx: str) -> Dict[str, Any]:
+    return {"op": op, "var": var_name, "prop": prop}
+
+
+_ORDERED_COMPARISON_OPS = frozenset(("lt", "le", "gt", "ge"))
+# One dict lookup per leaf instead of a chain of membership tests.
+_COMPARISON_TRANSLATORS: Dict[str, Callable[[str, str, str, Dict[str, Any], str], Dict[str, Any]]] = {
+    "eq": _translate_compare,
+    "ne": _translate_compare,
+    "lt": _translate_compare,
+    "le": _translate_compare,
+    "gt": _translate_compare,
+    "ge": _translate_compare,
+    "between": _translate_between,
+    "in": _translate_in,
+    "exists": _translate_presence,
+    "isNull": _translate_presence,
+    "isNotNull": _translate_presence,
+}
+
+
+_CanonicalMemo = Dict[int, Tuple[Dict[str, Any], Dict[str, Any], str]]
+
+
+def _encode_spec(spec: Mapping[str, Any]) -> str:
+    return json.dumps(spec, sort_keys=True, separators=(",", ":"))
+
+
+def _spec_digest(encoded: str) -> str:
+    # Opts the spec into the native plan cache. The digest covers literals as
+    # well as shape; the native side keys its entries by the parsed spec.
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _finish_payload(encoded: str, request_id: Optional[str], redact_literals: bool) -> bytes:
+    # The body is never empty, so its closing brace can be reopened to append
+    # the fields the digest must not cover.
+    # Redaction only changes how explain() renders the plan, so redacted specs
+    # keep the $planKey and share the cached plan.
+    extra = [f'"$planKey":"{_spec_digest(encoded)}"']
+    if redact_literals:
+        extra.append('"redact_literals":true')
+    if request_id is not None:
+        extra.append(f'"request_id":{json.dumps(request_id)}')
+    return f"{encoded[:-1]},{','.join(extra)}}}".encode("utf-8")
+
+
+# Sorted-key encoding of _lit_param output. Quotes inside user strings are
+# always escaped, so these cannot match string literal contents.
+_PARAM_MARKER = ',"t":"Param"}'
+_PARAM_PATTERN = re.compile(r'\{"name":("(?:[^"\\]|\\.)*"),"t":"Param"\}')
+
+
+def _composite_expr_key(op: str, child_keys: Sequence[str]) -> str:
+    # Fixed-size digest so keys stay short however deep the tree nests.
+    digest = hashlib.blake2b("\x1f".join(child_keys).encode("utf-8"), digest_size=16)
+    return f"{op}:{digest.hexdigest()}"
+
+
+def _canonicalize_expr(
+    expr: Dict[str, Any], memo: Optional[_CanonicalMemo] = None
+) -> Tuple[Dict[str, Any], str]:
+    """Return ``expr`` in canonical form together with its canonical key.
+
+    and/or children are flattened, de-duplicated and sorted by key, and double
+    negations are dropped, so equivalent predicates produce identical specs.
+    ``memo`` maps ``id()`` of already-seen nodes to ``(node, canonical, key)``;
+    holding ``node`` keeps the id from being reused while the memo is alive.
+    """
+    if memo is None:
+        memo = {}
+    stack: List[Tuple[Dict[str, Any], bool]] = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in memo:
+            continue
+        op = node.get("op")
+        if op != "and" and op != "or" and op != "not":
+            key = json.dumps(node, sort_keys=True, separators=(",", ":"))
+            memo[id(node)] = (node, node, key)
+            continue
+        args = node["args"]
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for child in args)
+            continue
+        if op == "not":
+            _, child, child_key = memo[id(args[0])]
+            if child.get("op") == "not":
+                _, canonical, key = memo[id(child["args"][0])]
+            else:
+                canonical = {"op": "not", "args": [child]}
+                key = _composite_expr_key("not", (child_key,))
+        else:
+            terms: Dict[str, Dict[str, Any]] = {}
+            for arg in args:
+                _, child, child_key = memo[id(arg)]
+                if child.get("op") == op:
+                    for grandchild in child["args"]:
+                        terms[memo[id(grandchild)][2]] = grandchild
+                else:
+                    terms[child_key] = child
+            if len(terms) == 1:
+                (key, canonical), = terms.items()
+            else:
+                ordered = sorted(terms)
+                canonical = {"op": op, "args": [terms[term] for term in ordered]}
+                key = _composite_expr_key(op, ordered)
+        memo[id(node)] = (node, canonical, key)
+        if canonical is not node:
+            memo[id(canonical)] = (canonical, canonical, key)
+    _, canonical, key = memo[id(expr)]
+    return canonical, key
 
 
 def _normalize_inclusive_tuple(value: Any) -> List[bool]:
     if value is None:
         return [True, True]
-    if (
-        isinstance(value, Sequence)
-        and len(value) == 2
-        and all(isinstance(flag, bool) for flag in value)
-    ):
+    kind = type(value)
+    if (kind is tuple or kind is list) and len(value) == 2:
+        low, high = value
+        if type(low) is bool and type(high) is bool:
+            return [low, high]
+    elif _is_bool_pair(value):
         return [bool(value[0]), bool(value[1])]
     raise ValueError("between().inclusive must be a two-element sequence of booleans")
 
 
 def _convert_in_list_values(values: Sequence[Any]) -> List[Dict[str, Any]]:
+    if len(values) == 1:
+        # A single literal is trivially homogeneous.
+        entry = values[0]
+        if type(entry) not in _LITERAL_DISPATCH:
+            _ensure_scalar_literal(entry, "in_list()[0]")
+        return [_literal_value(entry)]
     tagged: List[Dict[str, Any]] = []
+    append = tagged.append
+    exemplar_t: Optional[str] = None
     for idx, entry in enumerate(values):
-        _ensure_scalar_literal(entry, f"in_list()[{idx}]")
-        tagged.append(_literal_value(entry))
-    exemplar = next((item for item in tagged if item["t"] != "Null"), None)
-    if exemplar is not None:
-        for entry in tagged:
-            if entry["t"] != "Null" and entry["t"] != exemplar["t"]:
+        if type(entry) not in _LITERAL_DISPATCH:
+            _ensure_scalar_literal(entry, f"in_list()[{idx}]")
+        literal = _literal_value(entry)
+        tag = literal["t"]
+        if tag != "Null":
+            if exemplar_t is None:
+                exemplar_t = tag
+            elif tag != exemplar_t:
                 raise ValueError("in_list() requires all literals to share the same type")
+        append(literal)
     return tagged
 
 
 class _CreateHandle:
+    __slots__ = ("_builder", "_index")
+
     def __init__(self, builder: "CreateBuilder", index: int) -> None:
         self._builder = builder
         self._index = index
@@ -983,6 +1364,8 @@ class _CreateHandle:
 
 
 class CreateBuilder:
+    __slots__ = ("_db", "_nodes", "_edges", "_sealed")
+
     def __init__(self, db: "Database"):
         self._db = db
         self._nodes: List[Dict[str, Any]] = []
@@ -1038,29 +1421,43 @@ class CreateBuilder:
         )
         return self
 
+    def nodes_bulk(
+        self,
+        labels: Union[str, Sequence[str]],
+        props_list: Iterable[Optional[Mapping[str, Any]]],
+    ) -> List[_CreateHandle]:
+        """Queue one node per props mapping, all sharing ``labels``."""
+        self._ensure_mutable()
+        label_list = _normalize_labels(labels)
+        start = len(self._nodes)
+        self._nodes.extend({"labels": label_list, "props": dict(props or {})} for props in props_list)
+        return [_CreateHandle(self, index) for index in range(start, len(self._nodes))]
+
+    def edges_bulk(
+        self,
+        edges: Iterable[
+            Tuple[Union[_CreateHandle, str, int], str, Union[_CreateHandle, str, int], Optional[Mapping[str, Any]]]
+        ],
+    ) -> "CreateBuilder":
+        """Queue ``(src, ty, dst, props)`` edges in one call."""
+        self._ensure_mutable()
+        encode = self._encode_ref
+        entries: List[Dict[str, Any]] = []
+        for src, ty, dst, props in edges:
+            if not isinstance(ty, str) or not ty:
+                raise ValueError("edge type must be a non-empty string")
+            entries.append({"src": encode(src), "ty": ty, "dst": encode(dst), "props": dict(props or {})})
+        self._edges.extend(entries)
+        return self
+
     def execute(self) -> Dict[str, Any]:
         self._db._assert_open()
         self._ensure_mutable()
         self._sealed = True
-        script_nodes: List[Dict[str, Any]] = []
-        for node in self._nodes:
-            spec = {"labels": node["labels"], "props": dict(node["props"])}
-            if "alias" in node:
-                spec["alias"] = node["alias"]
-            script_nodes.append(spec)
-        script_edges = [
-            {
-                "src": dict(edge["src"]),
-                "ty": edge["ty"],
-                "dst": dict(edge["dst"]),
-                "props": dict(edge["props"]),
-            }
-            for edge in self._edges
-        ]
-        script = {
-            "nodes": script_nodes,
-            "edges": script_edges,
-        }
+        # Entries are already in script shape and the builder is now sealed, so
+        # they are handed over as-is; the native side converts them to owned
+        # values anyway.
+        script = {"nodes": self._nodes, "edges": self._edges}
         summary = _wrap_native_call(_native.database_create, self._db._handle, script)
         return CreateSummaryResult(summary)
 
@@ -1088,6 +1485,8 @@ class Database:
     def __init__(self, handle: _native.DatabaseHandle):
         self._handle = handle
         self._schema: Optional[Dict[str, Dict[str, Any]]] = None
+        # Property validators per label, shared by every builder on this handle.
+        self._label_validators: Dict[str, Callable[[str], str]] = {}
         self._closed = False
 
     @classmethod
@@ -1145,13 +1544,35 @@ class Database:
         _wrap_native_call(_native.database_seed_demo, self._handle)
         return self
 
-    def mutate(self, script: Mapping[str, Any]) -> Dict[str, Any]:
+    def mutate(self, script: Mapping[str, Any], *, collect_ids: bool = True) -> Dict[str, Any]:
+        """Apply a mutation script.
+
+        With ``collect_ids=False`` the summary keeps its counts but reports empty
+        ``createdNodes``/``createdEdges`` lists.
+        """
         self._assert_open()
-        return _wrap_native_call(_native.database_mutate, self._handle, script)
+        if collect_ids:
+            return _wrap_native_call(_native.database_mutate, self._handle, script)
+        return _wrap_native_call(_native.database_mutate_counts, self._handle, script)
 
-    def mutate_many(self, ops: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    def mutate_many(
+        self,
+        ops: Sequence[Mapping[str, Any]],
+        *,
+        collect_ids: bool = True,
+        copy: bool = True,
+    ) -> Dict[str, Any]:
+        """Apply ``ops`` in one transaction.
+
+        With ``copy=False`` plain dict ops are handed to the native layer as-is
+        instead of being shallow-copied first; other mappings are still copied.
+        """
         self._assert_open()
-        return self.mutate({"ops": [dict(op) for op in ops]})
+        if copy:
+            payload = [dict(op) for op in ops]
+        else:
+            payload = [op if type(op) is dict else dict(op) for op in ops]
+        return self.mutate({"ops": payload}, collect_ids=collect_ids)
 
     def mutate_batched(
         self,
@@ -1164,21 +1585,86 @@ class Database:
             raise ValueError("batch_size must be a positive integer")
         if isinstance(ops, (str, bytes)):
             raise TypeError("mutate_batched requires a sequence of operations")
-        ops_list = list(ops)
+        # Plain dicts go through as-is; only other mappings are copied.
+        ops_list = [op if type(op) is dict else dict(op) for op in ops]
         if not ops_list:
             return _empty_mutation_summary()
-        summary = _empty_mutation_summary()
-        for i in range(0, len(ops_list), batch_size):
-            chunk = [dict(op) for op in ops_list[i : i + batch_size]]
-            part = self.mutate({"ops": chunk})
-            summary = _merge_mutation_summaries(summary, part)
-        return summary
+        return _wrap_native_call(_native.database_mutate_many, self._handle, ops_list, batch_size)
+
+    def mutate_json(self, payload: Union[bytes, bytearray, memoryview, str]) -> Dict[str, Any]:
+        """Apply a mutation script that is already serialized as JSON.
+
+        ``payload`` must encode ``{"ops": [...]}``; it is parsed natively in one
+        pass (e.g. bytes from ``orjson.dumps``) instead of walking Python dicts.
+        """
+        self._assert_open()
+        if isinstance(payload, str):
+            data = payload.encode("utf-8")
+        elif isinstance(payload, (bytes, bytearray, memoryview)):
+            data = bytes(payload)
+        else:
+            raise TypeError("mutate_json requires a JSON bytes or str payload")
+        return _wrap_native_call(_native.database_mutate_bytes, self._handle, data)
+
+    def mutate_compact(self, ops: Sequence[Tuple[Any, ...]]) -> Dict[str, Any]:
+        """Apply positional op tuples keyed by the ``OP_*`` kind constants.
+
+        Tuples skip the per-op key hashing that ``mutate_many`` dicts require.
+        """
+        self._assert_open()
+        if isinstance(ops, (str, bytes)):
+            raise TypeError("mutate_compact requires a sequence of op tuples")
+        records = ops if type(ops) is list else list(ops)
+        return _wrap_native_call(_native.database_mutate_compact, self._handle, records)
+
+    def mutate_columns(self, op: str, columns: Mapping[str, Any]) -> Dict[str, Any]:
+        """Apply a single op kind to many rows described column-by-column.
+
+        Per-row fields (``id``, ``src``, ``dst``) are sequences of equal length,
+        and ``props``/``set`` map each property name to a column of values.
+        ``labels``, ``ty``, ``cascade`` and ``unset`` are shared by every row;
+        ``createNode`` without property columns needs an explicit ``count``.
+        All rows are applied in one transaction, as with ``mutate_many``.
+        """
+        self._assert_open()
+        if op not in _COLUMNAR_MUTATION_OPS:
+            raise ValueError(f"unsupported columnar mutation op '{op}'")
+        if type(columns) is not dict and not isinstance(columns, Mapping):
+            raise TypeError("mutate_columns requires a mapping of columns")
+        return _wrap_native_call(_native.database_mutate_columns, self._handle, op, dict(columns))
+
+    def bulk_create_nodes(self, label: str, rows: Sequence[Optional[Mapping[str, Any]]]) -> List[int]:
+        """Create one ``label`` node per props mapping in a single transaction.
+
+        Returns the new node ids in row order.
+        """
+        self._assert_open()
+        if not isinstance(label, str) or not label:
+            raise ValueError("bulk_create_nodes requires a non-empty label")
+        records = _adopt_list(rows)
+        if not records:
+            return []
+        return _wrap_native_call(_native.database_bulk_create_nodes, self._handle, label, records)
+
+    def bulk_create_edges(
+        self, rows: Sequence[Tuple[int, int, str, Optional[Mapping[str, Any]]]]
+    ) -> List[int]:
+        """Create one edge per ``(src, dst, ty, props)`` tuple in a single transaction.
+
+        Returns the new edge ids in row order.
+        """
+        self._assert_open()
+        records = _adopt_list(rows)
+        if not records:
+            return []
+        return _wrap_native_call(_native.database_bulk_create_edges, self._handle, records)
 
     def transaction(self, fn: Callable[["_MutationBatch"], Any]) -> Tuple[Any, Dict[str, Any]]:
         self._assert_open()
         batch = _MutationBatch()
         result = fn(batch)
-        if hasattr(result, "__await__"):
+        # Probe the type, not the instance, so a __getattr__ on the result is never hit.
+        if hasattr(type(result), "__await__"):
             raise RuntimeError("async transactions are not supported")
         ops = batch.drain()
         summary = self.mutate({"ops": ops})
@@ -1205,17 +1691,22 @@ class Database:
         distinct: bool = True,
     ) -> List[Dict[str, int]]:
         self._assert_open()
-        if not isinstance(node_id, int) or node_id < 0:
-            raise ValueError("neighbors() requires a non-negative node id")
-        if direction not in ("out", "in", "both"):
-            raise ValueError("direction must be 'out', 'in', or 'both'")
-        options: Dict[str, Any] = {"direction": direction, "distinct": bool(distinct)}
-        if edge_type is not None:
-            if not isinstance(edge_type, str) or not edge_type.strip():
-                raise ValueError("edge_type must be a non-empty string when provided")
-            options["edge_type"] = edge_type
+        options = _neighbor_options("neighbors", node_id, direction, edge_type, distinct)
         return _wrap_native_call(_native.database_neighbors, self._handle, int(node_id), options)
 
+    def neighbor_ids(
+        self,
+        node_id: int,
+        *,
+        direction: str = "out",
+        edge_type: Optional[str] = None,
+        distinct: bool = True,
+    ) -> List[int]:
+        """Like :meth:`neighbors` but returns only the neighbor node ids."""
+        self._assert_open()
+        options = _neighbor_options("neighbor_ids", node_id, direction, edge_type, distinct)
+        return _wrap_native_call(_native.database_neighbor_ids, self._handle, int(node_id), options)
+
     def bfs_traversal(
         self,
         node_id: int,
@@ -1230,7 +1721,7 @@ class Database:
             raise ValueError("bfs_traversal() requires a non-negative node id")
         if not isinstance(max_depth, int) or max_depth < 0:
             raise ValueError("bfs_traversal() requires a non-negative integer max_depth")
-        if direction not in ("out", "in", "both"):
+        if direction not in _DIRECTIONS:
             raise ValueError("direction must be 'out', 'in', or 'both'")
         options: Dict[str, Any] = {"direction": direction}
         if edge_types is not None:
@@ -1248,9 +1739,53 @@ class Database:
             _native.database_bfs_traversal, self._handle, int(node_id), int(max_depth), options
         )
 
+    def bfs_reachable(
+        self,
+        node_ids: Sequence[int],
+        max_depth: int,
+        *,
+        direction: str = "out",
+        edge_types: Optional[Sequence[str]] = None,
+    ) -> List[int]:
+        """Distinct nodes reached at depth 1..``max_depth`` from any of ``node_ids``.
+
+        Runs one traversal per start node inside a single native call; a start
+        node is included only when another start reaches it.
+        """
+        self._assert_open()
+        options = _reachable_options("bfs_reachable", max_depth, direction, edge_types)
+        ids: List[int] = []
+        for node_id in node_ids:
+            if not isinstance(node_id, int) or node_id < 0:
+                raise ValueError("bfs_reachable() requires non-negative node ids")
+            ids.append(int(node_id))
+        if not ids:
+            return []
+        return _wrap_native_call(_native.database_bfs_reachable_multi, self._handle, ids, max_depth, options)
+
+    def bfs_reachable_from_label(
+        self,
+        label: str,
+        max_depth: int,
+        *,
+        direction: str = "out",
+        edge_types: Optional[Sequence[str]] = None,
+    ) -> List[int]:
+        """Same as :meth:`bfs_reachable` starting from every node with ``label``.
+
+        The start nodes are scanned natively and never materialized in Python.
+        """
+        self._assert_open()
+        if not isinstance(label, str) or not label.strip():
+            raise ValueError("bfs_reachable_from_label requires a non-empty string label")
+        options = _reachable_options("bfs_reachable_from_label", max_depth, direction, edge_types)
+        return _wrap_native_call(_native.database_bfs_reachable_from_label, self._handle, label, max_depth, options)
+
     def with_schema(self, schema: Optional[Mapping[str, Mapping[str, Any]]]) -> "Database":
         self._assert_open()
         self._schema = _normalize_runtime_schema(schema)
+        # A fresh dict, so builders created under the old schema keep theirs.
+        self._label_validators = {}
         return self
 
     def get_node_record(self, node_id: int) -> Optional[Dict[str, Any]]:
@@ -1262,6 +1797,26 @@ class Database:
             raise TypeError("node record must be a mapping when present")
         return record
 
+    def get_node_records_bulk(self, node_ids: Sequence[int]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch many node records from one read snapshot in a single native call.
+
+        Results follow the order of ``node_ids``; missing nodes map to ``None``.
+        """
+        self._assert_open()
+        ids = [int(node_id) for node_id in node_ids]
+        return _wrap_native_call(_native.database_get_nodes, self._handle, ids)
+
+    def nodes_have_label(self, node_ids: Sequence[int], label: str) -> List[bool]:
+        """Check label membership for many nodes in a single native call.
+
+        Results follow the order of ``node_ids``; missing nodes map to ``False``.
+        """
+        self._assert_open()
+        if not isinstance(label, str) or not label.strip():
+            raise ValueError("nodes_have_label requires a non-empty string label")
+        ids = [int(node_id) for node_id in node_ids]
+        return _wrap_native_call(_native.database_nodes_have_label, self._handle, ids, label)
+
     def get_edge_record(self, edge_id: int) -> Optional[Dict[str, Any]]:
         self._assert_open()
         record = _wrap_native_call(_native.database_get_edge, self._handle, int(edge_id))
@@ -1287,8 +1842,22 @@ class Database:
         self._assert_open()
         if not isinstance(label, str) or not label.strip():
             raise ValueError("list_nodes_with_label requires a non-empty string label")
-        values = _wrap_native_call(_native.database_list_nodes_with_label, self._handle, label)
-        return [int(value) for value in values]
+        # The binding returns a fresh list of Python ints (Vec<u64>).
+        return _wrap_native_call(_native.database_list_nodes_with_label, self._handle, label)
+
+    def list_nodes_with_label_array(self, label: str) -> "array[int]":
+        """Like :meth:`list_nodes_with_label` but as an unsigned 64-bit ``array``.
+
+        The ids are copied from one native buffer without creating an int per
+        node; ``numpy.frombuffer(result, dtype=numpy.uint64)`` views it as-is.
+        """
+        self._assert_open()
+        if not isinstance(label, str) or not label.strip():
+            raise ValueError("list_nodes_with_label requires a non-empty string label")
+        packed = _wrap_native_call(_native.database_list_nodes_with_label_packed, self._handle, label)
+        values = array("Q")
+        values.frombytes(packed)
+        return values
 
     def create_node(
         self,
@@ -1357,17 +1926,17 @@ class Database:
         self.mutate({"ops": [{"op": "deleteEdge", "id": int(edge_id)}]})
         return self
 
-    def _execute(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute(self, spec: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         self._assert_open()
         payload = _wrap_native_call(_native.database_execute, self._handle, spec)
         return _normalize_envelope(payload)
 
-    def _explain(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+    def _explain(self, spec: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         self._assert_open()
         payload = _wrap_native_call(_native.database_explain, self._handle, spec)
         return _normalize_envelope(payload, expect_plan=True)
 
-    def _stream(self, spec: Dict[str, Any]) -> _native.StreamHandle:
+    def _stream(self, spec: Union[Dict[str, Any], bytes]) -> _native.StreamHandle:
         self._assert_open()
         return _wrap_native_call(_native.database_stream, self._handle, spec)
 
@@ -1377,37 +1946,83 @@ def open_database(path: str, **options: Any) -> Database:
     return Database.open(path, **options)
 
 
+class _MatchClause:
+    __slots__ = ("var", "label")
+
+    def __init__(self, var: str, label: Optional[str]) -> None:
+        self.var = var
+        self.label = label
+
+
+class _EdgeClause:
+    __slots__ = ("src", "dst", "edge_type", "direction")
+
+    def __init__(self, src: str, dst: str, edge_type: Optional[str], direction: str) -> None:
+        self.src = src
+        self.dst = dst
+        self.edge_type = edge_type
+        self.direction = direction
+
+
 class QueryBuilder:
     """Fluent query builder mirroring the Stage 8 TypeScript surface."""
 
+    __slots__ = (
+        "_db",
+        "_schema",
+        "_label_validators",
+        "_matches",
+        "_edges",
+        "_predicate",
+        "_canonical_exprs",
+        "_prop_validators",
+        "_projections",
+        "_default_projections",
+        "_distinct",
+        "_last_var",
+        "_next_var_idx",
+        "_pending_direction",
+        "_request_id",
+        "_encoded_body",
+    )
+
     def __init__(self, db: Database):
         self._db = db
         self._schema = getattr(db, "_schema", None)
-        self._matches: List[Dict[str, Optional[str]]] = []
-        self._edges: List[Dict[str, Any]] = []
+        self._label_validators: Optional[Dict[str, Callable[[str], str]]] = getattr(db, "_label_validators", None)
+        # Keyed by variable name; insertion order is the MATCH order.
+        self._matches: Dict[str, _MatchClause] = {}
+        self._edges: List[_EdgeClause] = []
         self._predicate: Optional[Dict[str, Any]] = None
+        self._canonical_exprs: _CanonicalMemo = {}
+        self._prop_validators: Dict[str, Callable[[str], str]] = {}
         self._projections: List[Dict[str, Any]] = []
+        self._default_projections: Optional[List[Dict[str, Any]]] = None
         self._distinct = False
         self._last_var: Optional[str] = None
         self._next_var_idx = 0
         self._pending_direction = "out"
         self._request_id: Optional[str] = None
+        # JSON of _spec_body(), reused until a clause changes; every method that
+        # changes the spec body resets it.
+        self._encoded_body: Optional[str] = None
 
     def nodes(self, label: str) -> _NodeScope:
         if not isinstance(label, str) or not label:
             raise ValueError("nodes() requires a non-empty label name")
         var_name = self._next_auto_var()
-        self._ensure_match(var_name, label)
-        self._last_var = var_name
+        self._last_var = self._ensure_match(var_name, label)
         return _NodeScope(self, var_name)
 
     def match(self, target: Union[str, Dict[str, Optional[str]]]) -> "QueryBuilder":
-        if isinstance(target, Mapping) and "var" not in target and "label" not in target:
+        # Exact-type checks first: str and dict targets skip the Mapping ABC check.
+        kind = type(target)
+        is_mapping = kind is dict or (kind is not str and isinstance(target, Mapping))
+        if is_mapping and "var" not in target and "label" not in target:
             return self._match_map(target)
         fallback = self._next_auto_var()
         normalized = _normalize_target(target, fallback)
-        self._ensure_match(normalized["var"], normalized.get("label"))
-        self._last_var = normalized["var"]
+        self._last_var = self._ensure_match(normalized["var"], normalized.get("label"))
         return self
 
     def on(self, var_name: str, scope: Callable[[_NodeScope], None]) -> "QueryBuilder":
@@ -1429,15 +2044,12 @@ class QueryBuilder:
             raise ValueError("where requires a preceding match clause")
         fallback = self._next_auto_var()
         normalized = _normalize_target(target, fallback)
-        self._ensure_match(normalized["var"], normalized.get("label"))
-        edge = {
-            "from": self._last_var,
-            "to": normalized["var"],
-            "edge_type": edge_type,
-            "direction": self._pending_direction,
-        }
-        self._edges.append(edge)
-        self._last_var = normalized["var"]
+        var_name = self._ensure_match(normalized["var"], normalized.get("label"))
+        self._edges.append(
+            _EdgeClause(self._last_var, var_name, _intern_name(edge_type), self._pending_direction)
+        )
+        self._encoded_body = None
+        self._last_var = var_name
         self._pending_direction = "out"
         return self
 
@@ -1449,7 +2061,7 @@ class QueryBuilder:
         if not isinstance(var_name, str) or not var_name:
             raise ValueError("where_var() requires a non-empty variable name")
         self._assert_match(var_name)
-        validator = self._make_prop_validator(var_name)
+        validator = self._cached_prop_validator(var_name)
         builder = _PredicateBuilder(self, var_name, validator=validator)
         if build is not None:
             if not callable(build):
@@ -1459,7 +2071,7 @@ class QueryBuilder:
         return builder
 
     def direction(self, direction: str) -> "QueryBuilder":
-        if direction not in ("out", "in", "both"):
+        if direction not in _DIRECTIONS:
             raise ValueError(f"invalid direction: {direction}")
         self._pending_direction = direction
         return self
@@ -1469,6 +2081,7 @@ class QueryBuilder:
 
     def distinct(self, _on: Optional[str] = None) -> "QueryBuilder":
         self._distinct = True
+        self._encoded_body = None
         return self
 
     def request_id(self, value: Optional[str]) -> "QueryBuilder":
@@ -1501,7 +2114,7 @@ class QueryBuilder:
                     if alias is not None and not isinstance(alias, str):
                         raise ValueError("property projection alias must be a string when provided")
                     self._assert_match(var_name)
-                    validator = self._make_prop_validator(var_name)
+                    validator = self._cached_prop_validator(var_name)
                     normalized_prop = validator(prop)
                     projections.append({"kind": "prop", "var": var_name, "prop": normalized_prop, "alias": alias})
                 elif "var" in field:
@@ -1516,25 +2129,33 @@ class QueryBuilder:
             else:
                 raise ValueError("unsupported projection field")
         self._projections = projections
+        self._encoded_body = None
         return self
 
     def explain(self, *, redact_literals: bool = False) -> QueryResult:
-        spec = self._build()
-        if redact_literals:
-            spec["redact_literals"] = True
-        payload = self._db._explain(spec)
-        return QueryResult(payload)
+        payload = self._db._explain(self._encode(redact_literals=redact_literals))
+        return QueryResult._from_envelope(payload)
 
     def execute(self, *, with_meta: bool = False) -> Union[List[Dict[str, Any]], QueryResult]:
-        payload = QueryResult(self._db._execute(self._build()))
+        payload = self._db._execute(self._encode())
         if with_meta:
-            return payload
-        return payload.rows()
+            return QueryResult._from_envelope(payload)
+        # The envelope is already validated; skip copying it into a QueryResult.
+        return payload.get("rows") or []
 
     def stream(self) -> AsyncIterator[Any]:
-        handle = self._db._stream(self._build())
+        handle = self._db._stream(self._encode())
         return _QueryStream(handle)
 
+    def prepare(self) -> "PreparedQuery":
+        """Freeze the query shape; ``param()`` placeholders are bound per run."""
+        encoded = self._encoded_spec_body()
+        parts = _PARAM_PATTERN.split(encoded)
+        # split() alternates literal text with captured (JSON-encoded) names.
+        pieces = parts[0::2]
+        names = [json.loads(name) for name in parts[1::2]]
+        return PreparedQuery(self._db, pieces, names, self._request_id, _param_leaves(self._predicate))
+
     def _match_map(self, mapping: Mapping[str, Any]) -> "QueryBuilder":
         entries = list(mapping.items())
         if not entries:
@@ -1546,86 +2167,115 @@ class QueryBuilder:
                 normalized = {"var": var_name, "label": value}
             elif value is None:
                 normalized = {"var": var_name, "label": None}
-            elif isinstance(value, Mapping):
+            elif type(value) is dict or isinstance(value, Mapping):
                 normalized = _normalize_target({**value, "var": var_name}, var_name)
             else:
                 raise ValueError("match({...}) values must be labels or dicts with optional 'label'")
-            self._ensure_match(normalized["var"], normalized.get("label"))
-        self._last_var = entries[-1][0]
+            last_var = self._ensure_match(normalized["var"], normalized.get("label"))
+        self._last_var = last_var
         return self
 
-    def _ensure_match(self, var_name: str, label: Optional[str]) -> None:
-        for match in self._matches:
-            if match["var"] == var_name:
-                if label is not None and match.get("label") is None:
-                    match["label"] = label
-                return
-        self._matches.append({"var": var_name, "label": label})
+    def _ensure_match(self, var_name: str, label: Optional[str]) -> str:
+        """Register ``var_name`` (attaching ``label`` if new) and return the stored name."""
+        match = self._matches.get(var_name)
+        if match is not None:
+            if label is not None and match.label is None:
+                match.label = _intern_name(label)
+                self._prop_validators.pop(var_name, None)
+                self._encoded_body = None
+            return match.var
+        if type(var_name) is str:
+            var_name = sys.intern(var_name)
+        self._matches[var_name] = _MatchClause(var_name, _intern_name(label))
+        self._prop_validators.pop(var_name, None)
+        self._default_projections = None
+        self._encoded_body = None
+        return var_name
 
     def _assert_match(self, var_name: str) -> None:
-        if not any(match["var"] == var_name for match in self._matches):
+        if var_name not in self._matches:
             raise ValueError(f"unknown variable '{var_name}' - call match() first")
 
     def _append_predicate(self, expr: Dict[str, Any], *, combinator: str = "and") -> None:
-        if self._predicate is None:
-            self._predicate = expr
-            return
-        if combinator == "and":
-            if self._predicate.get("op") == "and":
-                self._predicate["args"].append(expr)
-            else:
-                self._predicate = {"op": "and", "args": [self._predicate, expr]}
-            return
-        if combinator == "or":
-            if self._predicate.get("op") == "or":
-                self._predicate["args"].append(expr)
-            else:
-                self._predicate = {"op": "or", "args": [self._predicate, expr]}
-            return
-        raise ValueError(f"unsupported predicate combinator '{combinator}'")
+        if combinator != "and" and combinator != "or":
+            raise ValueError(f"unsupported predicate combinator '{combinator}'")
+        if self._predicate is not None:
+            expr = {"op": combinator, "args": [self._predicate, expr]}
+        self._predicate, _ = _canonicalize_expr(expr, self._canonical_exprs)
+        self._encoded_body = None
 
     def _next_auto_var(self) -> str:
         name = _auto_var_name(self._next_var_idx)
         self._next_var_idx += 1
         return name
 
-    def _build(self) -> Dict[str, Any]:
-        projections = (
-            self._projections
-            if self._projections
-            else [{"kind": "var", "var": clause["var"], "alias": None} for clause in self._matches]
-        )
+    def _spec_body(self) -> Dict[str, Any]:
+        # Everything but $planKey and request_id. Projection and predicate
+        # nodes are shared with the builder: they are never mutated after
+        # being appended, so no copy is needed.
+        if self._projections:
+            projections = self._projections
+        else:
+            # Derived from the matches alone and never mutated downstream, so
+            # the list is reused across builds until another match is added.
+            if self._default_projections is None:
+                self._default_projections = [
+                    {"kind": "var", "var": var_name, "alias": None} for var_name in self._matches
+                ]
+            projections = self._default_projections
         spec: Dict[str, Any] = {
             "$schemaVersion": 1,
-            "matches": [
-                {"var": clause["var"], "label": clause.get("label")}
-                for clause in self._matches
-            ],
+            "matches": [{"var": clause.var, "label": clause.label} for clause in self._matches.values()],
             "edges": [
                 {
-                    "from": edge["from"],
-                    "to": edge["to"],
-                    "edge_type": edge.get("edge_type"),
-                    "direction": edge["direction"],
+                    "from": edge.src,
+                    "to": edge.dst,
+                    "edge_type": edge.edge_type,
+                    "direction": edge.direction,
                 }
                 for edge in self._edges
             ],
             "distinct": self._distinct,
-            "projections": [_clone(proj) for proj in projections],
+            "projections": projections,
         }
         if self._predicate is not None:
-            spec["predicate"] = _clone(self._predicate)
+            spec["predicate"] = self._predicate
+        return spec
+
+    def _build(self, *, plan_key: bool = True) -> Dict[str, Any]:
+        spec = self._spec_body()
+        # Only the list is copied so appends to the result stay local.
+        spec["projections"] = list(spec["projections"])
+        if plan_key:
+            spec["$planKey"] = _spec_digest(_encode_spec(spec))
         if self._request_id is not None:
             spec["request_id"] = self._request_id
         return spec
 
+    def _encode(self, *, redact_literals: bool = False) -> bytes:
+        """Serialize the spec to JSON bytes for the native query entry points.
+
+        The body is encoded once and reused for the $planKey digest, so the
+        native side parses one buffer instead of walking nested dicts.
+        """
+        encoded = self._encoded_spec_body()
+        if _PARAM_MARKER in encoded:
+            raise ValueError("query has unbound param() placeholders; use prepare().bind(...)")
+        return _finish_payload(encoded, self._request_id, redact_literals)
+
+    def _encoded_spec_body(self) -> str:
+        encoded = self._encoded_body
+        if encoded is None:
+            encoded = self._encoded_body = _encode_spec(self._spec_body())
+        return encoded
+
     def _label_for_var(self, var_name: str) -> Optional[str]:
-        for clause in self._matches:
-            if clause["var"] == var_name:
-                label = clause.get("label")
-                if isinstance(label, str) and label:
-                    return label
-                return None
+        clause = self._matches.get(var_name)
+        if clause is None:
+            return None
+        label = clause.label
+        if isinstance(label, str) and label:
+            return label
         return None
 
     def _require_label(self, var_name: str) -> str:
@@ -1636,10 +2286,17 @@ class QueryBuilder:
 
     def _select_props(self, var_name: str, keys: Sequence[str]) -> None:
         self._assert_match(var_name)
-        validator = self._make_prop_validator(var_name)
+        validator = self._cached_prop_validator(var_name)
         for key in keys:
             normalized = validator(key)
             self._projections.append({"kind": "prop", "var": var_name, "prop": normalized, "alias": None})
+        self._encoded_body = None
+
+    def _cached_prop_validator(self, var_name: str) -> Callable[[str], str]:
+        validator = self._prop_validators.get(var_name)
+        if validator is None:
+            validator = self._prop_validators[var_name] = self._make_prop_validator(var_name)
+        return validator
 
     def _make_prop_validator(self, var_name: str) -> Callable[[str], str]:
         schema = self._schema
@@ -1648,24 +2305,184 @@ class QueryBuilder:
         label = self._label_for_var(var_name)
         if not label:
             return _normalize_prop_name
-        label_schema = schema.get(label)
-        if not isinstance(label_schema, Mapping):
-            return _normalize_prop_name
+        shared = self._label_validators
+        validator = shared.get(label) if shared is not None else None
+        if validator is None:
+            validator = _make_label_prop_validator(schema, label)
+            if shared is not None:
+                shared[label] = validator
+        return validator
+
+
+def _make_label_prop_validator(schema: Mapping[str, Any], label: str) -> Callable[[str], str]:
+    label_schema = schema.get(label)
+    if type(label_schema) is not dict and not isinstance(label_schema, Mapping):
+        return _normalize_prop_name
+
+    def validator(prop: str) -> str:
+        normalized = _normalize_prop_name(prop)
+        if normalized not in label_schema:
+            raise ValueError(f"Unknown property '{normalized}' on label '{label}'")
+        return normalized
+
+    return validator
+
+
+class PreparedQuery:
+    """Query shape frozen by ``QueryBuilder.prepare()``.
+
+    The spec is kept as pre-encoded JSON split around its ``param()`` slots, so
+    each run only encodes the bound literals.
+    """
+
+    __slots__ = ("_db", "_pieces", "_names", "_request_id", "_leaves", "_in_names")
+
+    def __init__(
+        self,
+        db: Database,
+        pieces: List[str],
+        names: List[str],
+        request_id: Optional[str],
+        leaves: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self._db = db
+        self._pieces = pieces
+        self._names = names
+        self._request_id = request_id
+        # Predicate leaves holding param() slots; bind() re-runs the checks the
+        # builder applies to literals against them.
+        self._leaves = leaves or []
+        self._in_names = frozenset(
+            entry["name"]
+            for leaf in self._leaves
+            if leaf["op"] == "in"
+            for entry in leaf["values"]
+            if entry["t"] == "Param"
+        )
+
+    @property
+    def params(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(self._names))
+
+    def bind(self, params: Optional[Mapping[str, Any]] = None) -> "BoundQuery":
+        values = dict(params or {})
+        unknown = values.keys() - set(self._names)
+        if unknown:
+            raise ValueError(f"unknown query parameter '{sorted(unknown)[0]}'")
+        literals: Dict[str, Dict[str, Any]] = {}
+        for name in self._names:
+            if name in literals:
+                continue
+            if name not in values:
+                raise ValueError(f"missing value for query parameter '{name}'")
+            value = values[name]
+            if isinstance(value, Param):
+                raise TypeError(f"query parameter '{name}' must be bound to a literal value")
+            if name in self._in_names and _is_nested_collection(value):
+                raise TypeError("in_() does not accept nested collections")
+            literals[name] = _literal_value(value)
+        for leaf in self._leaves:
+            _check_bound_leaf(leaf, literals)
+        encoded = {name: _encode_spec(literal) for name, literal in literals.items()}
+        pieces = self._pieces
+        parts = [pieces[0]]
+        for idx, name in enumerate(self._names, start=1):
+            parts.append(encoded[name])
+            parts.append(pieces[idx])
+        return BoundQuery(self._db, "".join(parts), self._request_id)
+
+
+def _param_leaves(predicate: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    leaves: List[Dict[str, Any]] = []
+    if predicate is None:
+        return leaves
+    # Shared subtrees may be visited twice; checking a leaf twice is harmless.
+    stack = [predicate]
+    while stack:
+        node = stack.pop()
+        op = node["op"]
+        if op == "and" or op == "or" or op == "not":
+            stack.extend(node["args"])
+        elif op == "between":
+            if node["low"]["t"] == "Param" or node["high"]["t"] == "Param":
+                leaves.append(node)
+        elif op == "in":
+            if any(entry["t"] == "Param" for entry in node["values"]):
+                leaves.append(node)
+        elif op in _ORDERED_COMPARISON_OPS and node["value"]["t"] == "Param":
+            leaves.append(node)
+    return leaves
+
+
+def _resolve_bound(literal: Dict[str, Any], literals: Mapping[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return literals[literal["name"]] if literal["t"] == "Param" else literal
+
+
+_ORDERABLE_BOUND_TAGS = frozenset(("Int", "Float", "String", "DateTime"))
+
+
+def _check_bound_leaf(leaf: Dict[str, Any], literals: Mapping[str, Dict[str, Any]]) -> None:
+    op = leaf["op"]
+    if op == "between":
+        low = _resolve_bound(leaf["low"], literals)
+        high = _resolve_bound(leaf["high"], literals)
+        if low["t"] == "Null" or high["t"] == "Null":
+            raise ValueError("between() does not accept null bounds")
+        numeric = low["t"] in ("Int", "Float") and high["t"] in ("Int", "Float")
+        if (numeric or (low["t"] == high["t"] and low["t"] in _ORDERABLE_BOUND_TAGS)) and low["v"] > high["v"]:
+            raise ValueError("between() requires low <= high")
+    elif op == "in":
+        exemplar_t: Optional[str] = None
+        for entry in leaf["values"]:
+            tag = _resolve_bound(entry, literals)["t"]
+            if tag != "Null":
+                if exemplar_t is None:
+                    exemplar_t = tag
+                elif tag != exemplar_t:
+                    raise ValueError("in_() requires all literals to share the same type")
+    elif _resolve_bound(leaf["value"], literals)["t"] == "Null":
+        raise ValueError(f"{op}() does not accept null literals")
+
+
+class BoundQuery:
+    """A prepared query with every parameter bound."""
+
+    __slots__ = ("_db", "_encoded", "_request_id")
+
+    def __init__(self, db: Database, encoded: str, request_id: Optional[str]) -> None:
+        self._db = db
+        self._encoded = encoded
+        self._request_id = request_id
+
+    def explain(self, *, redact_literals: bool = False) -> QueryResult:
+        payload = self._db._explain(_finish_payload(self._encoded, self._request_id, redact_literals))
+        return QueryResult._from_envelope(payload)
+
+    def execute(self, *, with_meta: bool = False) -> Union[List[Dict[str, Any]], QueryResult]:
+        payload = self._db._execute(_finish_payload(self._encoded, self._request_id, False))
+        if with_meta:
+            return QueryResult._from_envelope(payload)
+        return payload.get("rows") or []
+
+    def stream(self) -> AsyncIterator[Any]:
+        handle = self._db._stream(_finish_payload(self._encoded, self._request_id, False))
+        return _QueryStream(handle)
 
-        def validator(prop: str) -> str:
-            normalized = _normalize_prop_name(prop)
-            if normalized not in label_schema:
-                raise ValueError(f"Unknown property '{normalized}' on label '{label}'")
-            return normalized
 
-        return validator
 def _datetime_to_ns(value: datetime) -> int:
-    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+    if value.tzinfo is timezone.utc:
+        # UTC values skip the timedelta: fold the fields into an integer and
+        # range-check that against precomputed nanosecond bounds.
+        seconds = (((value.toordinal() - _EPOCH_ORDINAL) * 24 + value.hour) * 60 + value.minute) * 60 + value.second
+        ns = seconds * _NANOS_PER_SECOND + value.microsecond * 1_000
+        if ns < _MIN_NS or ns > _MAX_NS:
+            raise ValueError("datetime literal must be between 1900-01-01 and 2100-01-01 UTC")
+        return ns
+    if value.utcoffset() is None:
         raise ValueError("datetime literal must include timezone info")
-    normalized = value.astimezone(timezone.utc)
-    if normalized < _MIN_DATETIME or normalized > _MAX_DATETIME:
+    # Aware comparisons and subtraction already normalize to UTC, so there is
+    # no need to materialize an astimezone() copy first.
+    if value < _MIN_DATETIME or value > _MAX_DATETIME:
         raise ValueError("datetime literal must be between 1900-01-01 and 2100-01-01 UTC")
-    delta = normalized - _EPOCH
-    total_seconds = delta.days * 86_400 + delta.seconds
-    nanos = total_seconds * _NANOS_PER_SECOND + delta.microseconds * 1_000
-    return nanos
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * _NANOS_PER_SECOND + delta.microseconds * 1_000
@@ -1,6 +1,6 @@
 """Typed Sombra client entry point."""
 
-from .db import NodeId, SombraDB, TypedQueryBuilder, TypedQueryResult
+from .db import NodeId, SombraDB, TypedPreparedQuery, TypedQueryBuilder, TypedQueryResult
 from .schema import EdgeSchema, NodeSchema, TypedGraphSchema, normalize_graph_schema
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "NodeId",
     "SombraDB",
     "TypedQueryBuilder",
+    "TypedPreparedQuery",
     "TypedQueryResult",
     "normalize_graph_schema",
 ]
@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Generic, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar, Union, cast
+from array import array
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Literal, TypedDict
 
-from ..query import Database
+from ..query import Database, InvalidArgError
 from .schema import (
     EdgeSchema,
     NormalizedGraphSchema,
@@ -19,10 +35,14 @@ SchemaT = TypeVar("SchemaT", bound=TypedGraphSchema)
 NodeLabelT = TypeVar("NodeLabelT", bound=str)
 EdgeLabelT = TypeVar("EdgeLabelT", bound=str)
 Direction = Literal["out", "in", "both"]
-
-
+_DIRECTIONS = frozenset(("out", "in", "both"))
+# Native comparison errors raised when a stored value's type differs from the literal.
 class NodeId(int, Generic[NodeLabelT]):
-    """Branded node identifier that carries the originating label."""
+    """Branded node identifier that carries the originating label.
+
+    Ids are returned as plain ints; runtime casts use string targets so the
+    brand costs no ``Generic`` subscription per call.
+    """
 
 
 class TypedQueryResult(TypedDict):
@@ -51,8 +71,18 @@ class SombraDB(Generic[SchemaT]):
         self._schema: Optional[NormalizedGraphSchema] = (
             normalize_graph_schema(schema) if schema is not None else None
         )
+        # Allowed property keys per label, built once so per-row validation is a
+        # subset check rather than a fresh set over the schema definition.
+        self._node_allowed: Dict[str, FrozenSet[str]] = {}
+        self._edge_allowed: Dict[str, FrozenSet[str]] = {}
         if self._schema is not None:
             self._db.with_schema(extract_runtime_node_schema(self._schema))
+            self._node_allowed = _allowed_prop_keys(self._schema["nodes"])
+            self._edge_allowed = _allowed_prop_keys(self._schema["edges"])
+        else:
+            # Nothing to validate against; skip the method body on every write.
+            self._validate_node_props = _skip_prop_validation
+            self._validate_edge_props = _skip_prop_validation
 
     @classmethod
     def open(
@@ -76,14 +106,25 @@ class SombraDB(Generic[SchemaT]):
     def raw(self) -> Database:
         return self._db
 
-    def add_node(self, label: NodeLabelT, props: Optional[Mapping[str, Any]] = None) -> NodeId[NodeLabelT]:
+    def add_node(
+        self,
+        label: NodeLabelT,
+        props: Optional[Mapping[str, Any]] = None,
+        *,
+        copy_props: bool = True,
+    ) -> NodeId[NodeLabelT]:
+        """Create a node.
+
+        With ``copy_props=False`` a plain dict ``props`` is passed through
+        without a defensive copy; the caller must not mutate it afterwards.
+        """
         normalized = self._assert_node_label(label, "add_node")
-        values = dict(props or {})
+        values = _props_dict(props, copy_props)
         self._validate_node_props(normalized, values)
         node_id = self._db.create_node(normalized, values)
         if node_id is None:
             raise RuntimeError("unable to create node")
-        return cast(NodeId[NodeLabelT], int(node_id))
+        return cast("NodeId[NodeLabelT]", node_id)
 
     def add_edge(
         self,
@@ -91,9 +132,12 @@ class SombraDB(Generic[SchemaT]):
         dst: NodeId[str],
         edge_type: EdgeLabelT,
         props: Optional[Mapping[str, Any]] = None,
+        *,
+        copy_props: bool = True,
     ) -> int:
+        """Create an edge; ``copy_props`` behaves as in :meth:`add_node`."""
         normalized_edge = self._assert_edge_label(edge_type, "add_edge")
-        values = dict(props or {})
+        values = _props_dict(props, copy_props)
         self._validate_edge_props(normalized_edge, values)
         if self._schema:
             definition = self._schema["edges"].get(normalized_edge)
@@ -112,80 +156,89 @@ class SombraDB(Generic[SchemaT]):
     def bulk_load_nodes(
         self,
         label: NodeLabelT,
-        nodes: Sequence[Mapping[str, Any]],
+        nodes: Iterable[Mapping[str, Any]],
         *,
         chunk_size: int = 10_000,
+        copy_props: bool = True,
     ) -> List[NodeId[NodeLabelT]]:
         """Bulk load many nodes for a single label.
 
-        This API is explicitly non-atomic: each chunk is committed
-        independently using the underlying JSON `create` path.
+        This API is explicitly non-atomic: each chunk is validated and then
+        committed independently in a single native transaction. With
+        ``copy_props=False`` plain dict rows are handed over without being
+        copied and must not be mutated afterwards.
         """
         normalized = self._assert_node_label(label, "bulk_load_nodes")
         if not isinstance(chunk_size, int) or chunk_size <= 0:
             raise ValueError("chunk_size must be a positive integer")
-        nodes_list = list(nodes)
         results: List[NodeId[NodeLabelT]] = []
-        if not nodes_list:
-            return results
-        for i in range(0, len(nodes_list), chunk_size):
-            chunk = nodes_list[i : i + chunk_size]
-            ops: List[Dict[str, Any]] = []
-            for props in chunk:
-                values = dict(props or {})
-                self._validate_node_props(normalized, values)
-                ops.append({"op": "createNode", "labels": [normalized], "props": values})
-            summary = self._db.mutate({"ops": ops})
-            created = summary.get("createdNodes") or []
-            for node_id in created:
-                results.append(cast(NodeId[NodeLabelT], int(node_id)))
+        # The allowed-key lookup is hoisted out of the per-row loop; rows only
+        # fall back to the reporting validator when a key is unknown. Input is
+        # consumed one chunk at a time so it is never copied as a whole.
+        allowed = self._node_allowed.get(normalized)
+        it = iter(nodes)
+        while True:
+            if copy_props:
+                rows = [dict(props) if props else {} for props in islice(it, chunk_size)]
+            else:
+                rows = [_props_dict(props, False) for props in islice(it, chunk_size)]
+            if not rows:
+                break
+            if allowed is not None:
+                for values in rows:
+                    if not values.keys() <= allowed:
+                        self._validate_node_props(normalized, values)
+            created = self._db.bulk_create_nodes(normalized, rows)
+            results.extend(cast("List[NodeId[NodeLabelT]]", created))
         return results
 
     def bulk_load_edges(
         self,
-        edges: Sequence[Tuple[NodeId[str], NodeId[str], EdgeLabelT, Mapping[str, Any]]],
+        edges: Iterable[Tuple[NodeId[str], NodeId[str], EdgeLabelT, Mapping[str, Any]]],
         *,
         chunk_size: int = 100_000,
+        copy_props: bool = True,
     ) -> List[int]:
         """Bulk load many edges.
 
-        This API is explicitly non-atomic: each chunk is committed
-        independently using the underlying JSON `create` path.
+        This API is explicitly non-atomic: each chunk is validated and then
+        committed independently in a single native transaction.
+        ``copy_props`` behaves as in :meth:`bulk_load_nodes`.
         """
         if not isinstance(chunk_size, int) or chunk_size <= 0:
             raise ValueError("chunk_size must be a positive integer")
-        edges_list = list(edges)
         results: List[int] = []
-        if not edges_list:
-            return results
-        for i in range(0, len(edges_list), chunk_size):
-            chunk = edges_list[i : i + chunk_size]
-            ops: List[Dict[str, Any]] = []
+        # Label, allowed keys and endpoint labels are resolved once per edge type,
+        # and endpoint labels are checked with one native call per label and chunk.
+        rules: Dict[str, Tuple[str, Optional[FrozenSet[str]], Optional[str], Optional[str]]] = {}
+        it = iter(edges)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                break
+            rows: List[Tuple[int, int, str, Dict[str, Any]]] = []
+            endpoints: Dict[str, Dict[int, str]] = {}
             for src, dst, edge_type, props in chunk:
-                normalized_edge = self._assert_edge_label(edge_type, "bulk_load_edges")
-                values = dict(props or {})
-                self._validate_edge_props(normalized_edge, values)
-                if self._schema:
-                    definition = self._schema["edges"].get(normalized_edge)
-                    if definition:
-                        expected_src = definition.get("from_label")
-                        expected_dst = definition.get("to_label")
-                        if expected_src:
-                            self._ensure_node_matches_label(int(src), expected_src, "bulk_load_edges source")
-                        if expected_dst:
-                            self._ensure_node_matches_label(int(dst), expected_dst, "bulk_load_edges target")
-                ops.append(
-                    {
-                        "op": "createEdge",
-                        "src": int(src),
-                        "dst": int(dst),
-                        "ty": normalized_edge,
-                        "props": values,
-                    }
-                )
-            summary = self._db.mutate({"ops": ops})
-            created = summary.get("createdEdges") or []
-            results.extend(int(edge_id) for edge_id in created)
+                rule = rules.get(edge_type) if type(edge_type) is str else None
+                if rule is None:
+                    rule = rules[edge_type] = self._edge_load_rule(edge_type)
+                normalized_edge, allowed, expected_src, expected_dst = rule
+                values = _props_dict(props, copy_props)
+                if allowed is not None and not values.keys() <= allowed:
+                    self._validate_edge_props(normalized_edge, values)
+                src_id = int(src)
+                dst_id = int(dst)
+                if expected_src:
+                    endpoints.setdefault(expected_src, {}).setdefault(src_id, "bulk_load_edges source")
+                if expected_dst:
+                    endpoints.setdefault(expected_dst, {}).setdefault(dst_id, "bulk_load_edges target")
+                rows.append((src_id, dst_id, normalized_edge, values))
+            for label, checks in endpoints.items():
+                node_ids = list(checks)
+                for node_id, ok in zip(node_ids, self._db.nodes_have_label(node_ids, label)):
+                    if not ok:
+                        self._ensure_node_matches_label(node_id, label, checks[node_id])
+            results.extend(self._db.bulk_create_edges(rows))
         return results
 
     def get_node(
@@ -203,9 +256,9 @@ class SombraDB(Generic[SchemaT]):
             if isinstance(candidate, str):
                 resolved_label = cast(NodeLabelT, candidate)
         properties = record.get("properties")
-        props_dict = properties if isinstance(properties, Mapping) else {}
+        props_dict = properties if type(properties) is dict or isinstance(properties, Mapping) else {}
         return {
-            "id": cast(NodeId[NodeLabelT], int(node_id)),
+            "id": cast("NodeId[NodeLabelT]", int(node_id)),
             "label": resolved_label,
             "properties": dict(props_dict),
         }
@@ -216,20 +269,41 @@ class SombraDB(Generic[SchemaT]):
         prop: str,
         value: Any,
     ) -> Optional[NodeId[NodeLabelT]]:
-        candidates = self.list_nodes_with_label(label)
-        for node_id in candidates:
-            record = self.get_node(node_id, label)
-            if not record:
-                continue
-            props = record.get("properties") or {}
-            if props.get(prop) == value:
-                return cast(NodeId[NodeLabelT], node_id)
-        return None
+        normalized = self._assert_node_label(label, "find_node_by_property")
+        if value is None:
+            # A missing property also equals None, which eq() cannot express.
+            return cast("Optional[NodeId[NodeLabelT]]", self._scan_node_by_property(normalized, prop, value))
+        allowed = self._node_allowed.get(normalized)
+        if allowed is not None and prop not in allowed:
+            return None
+        query = self._db.query().match({"node": normalized})
+        try:
+            query.where_var("node", lambda pred: pred.eq(prop, value))
+        except (TypeError, ValueError):
+            # Values query literals cannot carry (lists, mappings, ints outside
+            # i64) are compared in Python over a single bulk read of the records.
+            return cast("Optional[NodeId[NodeLabelT]]", self._scan_node_by_property(normalized, prop, value))
+        # One native query: the planner probes a property index when one exists
+        # and otherwise filters the label scan without building Python records.
+        try:
+            rows = cast("List[Dict[str, Any]]", query.select(["node"]).execute())
+        except InvalidArgError:
+            # The native filter refuses to compare across types (str vs int,
+            # bool vs int), where Python == still gives an answer.
+            return cast("Optional[NodeId[NodeLabelT]]", self._scan_node_by_property(normalized, prop, value))
+        if not rows:
+            return None
+        return cast("NodeId[NodeLabelT]", min(int(row["node"]["_id"]) for row in rows))
 
     def list_nodes_with_label(self, label: NodeLabelT) -> List[NodeId[NodeLabelT]]:
         normalized = self._assert_node_label(label, "list_nodes_with_label")
-        values = self._db.list_nodes_with_label(normalized)
-        return [cast(NodeId[NodeLabelT], int(value)) for value in values]
+        # Database.list_nodes_with_label() already returns plain ints.
+        return cast("List[NodeId[NodeLabelT]]", self._db.list_nodes_with_label(normalized))
+
+    def list_nodes_with_label_array(self, label: NodeLabelT) -> "array[int]":
+        """Node ids for ``label`` as a compact unsigned 64-bit ``array``."""
+        normalized = self._assert_node_label(label, "list_nodes_with_label_array")
+        return self._db.list_nodes_with_label_array(normalized)
 
     def get_incoming_neighbors(
         self,
@@ -239,13 +313,13 @@ class SombraDB(Generic[SchemaT]):
         distinct: bool = True,
     ) -> List[NodeId[str]]:
         normalized_edge = self._maybe_assert_edge(edge_type, "get_incoming_neighbors")
-        neighbors = self._db.neighbors(
+        neighbors = self._db.neighbor_ids(
             int(node_id),
             direction="in",
             edge_type=normalized_edge,
             distinct=distinct,
         )
-        return cast(List[NodeId[str]], self._extract_neighbor_ids(neighbors))
+        return cast("List[NodeId[str]]", neighbors)
 
     def get_outgoing_neighbors(
         self,
@@ -255,13 +329,13 @@ class SombraDB(Generic[SchemaT]):
         distinct: bool = True,
     ) -> List[NodeId[str]]:
         normalized_edge = self._maybe_assert_edge(edge_type, "get_outgoing_neighbors")
-        neighbors = self._db.neighbors(
+        neighbors = self._db.neighbor_ids(
             int(node_id),
             direction="out",
             edge_type=normalized_edge,
             distinct=distinct,
         )
-        return cast(List[NodeId[str]], self._extract_neighbor_ids(neighbors))
+        return cast("List[NodeId[str]]", neighbors)
 
     def get_neighbors(
         self,
@@ -271,16 +345,15 @@ class SombraDB(Generic[SchemaT]):
         edge_type: Optional[EdgeLabelT] = None,
         distinct: bool = True,
     ) -> List[int]:
-        if direction not in ("out", "in", "both"):
+        if direction not in _DIRECTIONS:
             raise ValueError("direction must be 'out', 'in', or 'both'")
         normalized_edge = self._maybe_assert_edge(edge_type, "get_neighbors")
-        neighbors = self._db.neighbors(
+        return self._db.neighbor_ids(
             int(node_id),
             direction=direction,
             edge_type=normalized_edge,
             distinct=distinct,
         )
-        return [int(entry.get("node_id", -1)) for entry in neighbors if isinstance(entry, Mapping)]
 
     def count_nodes_with_label(self, label: NodeLabelT) -> int:
         normalized = self._assert_node_label(label, "count_nodes_with_label")
@@ -317,6 +390,8 @@ class SombraDB(Generic[SchemaT]):
         return self
 
     def _assert_node_label(self, label: str, ctx: str) -> str:
+        if self._schema and type(label) is str and label in self._schema["nodes"]:
+            return label
         if not isinstance(label, str) or not label.strip():
             raise TypeError(f"{ctx} requires a non-empty node label")
         if self._schema and label not in self._schema["nodes"]:
@@ -324,6 +399,8 @@ class SombraDB(Generic[SchemaT]):
         return label
 
     def _assert_edge_label(self, edge_type: str, ctx: str) -> str:
+        if self._schema and type(edge_type) is str and edge_type in self._schema["edges"]:
+            return edge_type
         if not isinstance(edge_type, str) or not edge_type.strip():
             raise TypeError(f"{ctx} requires a non-empty edge label")
         if self._schema and edge_type not in self._schema["edges"]:
@@ -335,35 +412,50 @@ class SombraDB(Generic[SchemaT]):
             return None
         return self._assert_edge_label(edge_type, ctx)
 
+    def _edge_load_rule(
+        self, edge_type: str
+    ) -> Tuple[str, Optional[FrozenSet[str]], Optional[str], Optional[str]]:
+        normalized = self._assert_edge_label(edge_type, "bulk_load_edges")
+        definition = self._schema["edges"].get(normalized) if self._schema else None
+        if not definition:
+            return normalized, self._edge_allowed.get(normalized), None, None
+        return (
+            normalized,
+            self._edge_allowed.get(normalized),
+            definition.get("from_label"),
+            definition.get("to_label"),
+        )
+
+    def _scan_node_by_property(self, label: str, prop: str, value: Any) -> Optional[int]:
+        node_ids = self._db.list_nodes_with_label(label)
+        for node_id, record in zip(node_ids, self._db.get_node_records_bulk(node_ids)):
+            props = (record.get("properties") if record else None) or {}
+            if props.get(prop) == value:
+                return node_id
+        return None
+
     def _validate_node_props(self, label: str, props: Mapping[str, Any]) -> None:
-        if not self._schema or not props:
+        if not props:
             return
-        definition = self._schema["nodes"].get(label)
-        if not definition:
+        allowed = self._node_allowed.get(label)
+        if allowed is None:
+            return
+        if props.keys() <= allowed:
             return
-        allowed = set((definition.get("properties") or {}).keys())
-        for key in props.keys():
-            if key not in allowed:
-                raise ValueError(f"unknown property '{key}' for node '{label}'")
+        # Only the failure path walks the keys, to report the first unknown one.
+        key = next(key for key in props if key not in allowed)
+        raise ValueError(f"unknown property '{key}' for node '{label}'")
 
     def _validate_edge_props(self, edge_type: str, props: Mapping[str, Any]) -> None:
-        if not self._schema or not props:
+        if not props:
             return
-        definition = self._schema["edges"].get(edge_type)
-        if not definition:
+        allowed = self._edge_allowed.get(edge_type)
+        if allowed is None:
             return
-        allowed = set((definition.get("properties") or {}).keys())
-        for key in props.keys():
-            if key not in allowed:
-                raise ValueError(f"unknown property '{key}' for edge '{edge_type}'")
-
-    def _extract_neighbor_ids(self, entries: Sequence[Mapping[str, Any]]) -> List[NodeId[Any]]:
-        results: List[NodeId[Any]] = []
-        for entry in entries:
-            node_value = entry.get("node_id")
-            if isinstance(node_value, int):
-                results.append(cast(NodeId[Any], node_value))
-        return results
+        if props.keys() <= allowed:
+            return
+        key = next(key for key in props if key not in allowed)
+        raise ValueError(f"unknown property '{key}' for edge '{edge_type}'")
 
     def _ensure_node_matches_label(self, node_id: int, label: str, ctx: str) -> None:
         record = self._db.get_node_record(node_id)
@@ -375,6 +467,25 @@ class SombraDB(Generic[SchemaT]):
         raise ValueError(f"{ctx} expected node with label '{label}'")
 
 
+def _allowed_prop_keys(definitions: Mapping[str, Any]) -> Dict[str, FrozenSet[str]]:
+    # Labels without a definition are left out, which disables validation for them.
+    return {
+        label: frozenset(definition.get("properties") or ())
+        for label, definition in definitions.items()
+        if definition
+    }
+
+
+def _skip_prop_validation(_name: str, _props: Mapping[str, Any]) -> None:
+    return None
+
+
+def _props_dict(props: Optional[Mapping[str, Any]], copy: bool) -> Dict[str, Any]:
+    if not copy and type(props) is dict:
+        return props
+    return dict(props or {})
+
+
 class TypedQueryBuilder(Generic[SchemaT]):
     def __init__(self, db: SombraDB[SchemaT]):
         self._db = db
@@ -397,7 +508,7 @@ class TypedQueryBuilder(Generic[SchemaT]):
         if not edge_types:
             raise ValueError("traverse requires at least one edge type")
         normalized = [self._db._assert_edge_label(edge, "query.traverse") for edge in edge_types]
-        if direction not in ("out", "in", "both"):
+        if direction not in _DIRECTIONS:
             raise ValueError("direction must be 'out', 'in', or 'both'")
         if not isinstance(depth, int) or depth <= 0:
             raise ValueError("depth must be a positive integer")
@@ -407,20 +518,45 @@ class TypedQueryBuilder(Generic[SchemaT]):
         return self
 
     def get_ids(self) -> TypedQueryResult:
+        return self.prepare().get_ids()
+
+    def prepare(self) -> TypedPreparedQuery:
+        """Freeze the validated query shape so it can be run repeatedly."""
         if not self._start_label:
             raise RuntimeError("start_from_label() must be called before get_ids()")
-        start_nodes = self._db.list_nodes_with_label(self._start_label)
-        seen: Set[int] = set()
-        for node_id in start_nodes:
-            visits = self._db.bfs_traversal(
-                node_id,
-                self._depth,
-                direction=self._direction,
-                edge_types=self._edge_types,
-            )
-            for visit in visits:
-                neighbor = visit.get("node_id")
-                depth = visit.get("depth")
-                if isinstance(depth, int) and depth > 0 and isinstance(neighbor, int):
-                    seen.add(neighbor)
-        return TypedQueryResult(node_ids=list(seen))
+        return TypedPreparedQuery(
+            self._db.raw(), self._start_label, tuple(self._edge_types), self._direction, self._depth
+        )
+
+
+class TypedPreparedQuery:
+    """Query shape frozen by ``TypedQueryBuilder.prepare()``.
+
+    Labels and edge types were validated when the builder was assembled, so
+    each run is a single native traversal.
+    """
+
+    __slots__ = ("_db", "_start_label", "_edge_types", "_direction", "_depth")
+
+    def __init__(
+        self,
+        db: Database,
+        start_label: str,
+        edge_types: Tuple[str, ...],
+        direction: Direction,
+        depth: int,
+    ) -> None:
+        self._db = db
+        self._start_label = start_label
+        self._edge_types = edge_types
+        self._direction = direction
+        self._depth = depth
+
+    def get_ids(self) -> TypedQueryResult:
+        reached = self._db.bfs_reachable_from_label(
+            self._start_label,
+            self._depth,
+            direction=self._direction,
+            edge_types=self._edge_types,
+        )
+        return TypedQueryResult(node_ids=reached)
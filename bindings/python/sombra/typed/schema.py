@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, Mapping, TypeVar
 
 from typing_extensions import NotRequired, TypedDict
@@ -46,52 +47,63 @@ class NormalizedGraphSchema(TypedDict):
 SchemaT = TypeVar("SchemaT", bound="TypedGraphSchema")
 
 
+def _is_mapping(value: Any) -> bool:
+    # Exact dicts skip the Mapping ABC check, which dominates on large schemas.
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _is_label(value: Any) -> bool:
+    # isspace() answers the blank check without allocating a stripped copy.
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
 def normalize_graph_schema(schema: TypedGraphSchema) -> NormalizedGraphSchema:
-    if not isinstance(schema, Mapping):
+    if not _is_mapping(schema):
         raise TypeError("graph schema must be a mapping")
 
     raw_nodes = schema.get("nodes")
     raw_edges = schema.get("edges")
     if raw_nodes is None or raw_edges is None:
         raise TypeError("graph schema must include 'nodes' and 'edges'")
-    if not isinstance(raw_nodes, Mapping):
+    if not _is_mapping(raw_nodes):
         raise TypeError("'nodes' must be a mapping from label -> node definition")
-    if not isinstance(raw_edges, Mapping):
+    if not _is_mapping(raw_edges):
         raise TypeError("'edges' must be a mapping from label -> edge definition")
 
     normalized_nodes: Dict[str, RuntimeNodeDefinition] = {}
     for label, definition in raw_nodes.items():
-        if not isinstance(label, str) or not label.strip():
+        if not _is_label(label):
             raise ValueError("node labels must be non-empty strings")
-        if not isinstance(definition, Mapping):
+        if not _is_mapping(definition):
             raise TypeError(f"definition for node '{label}' must be a mapping")
         props = definition.get("properties") or {}
-        if not isinstance(props, Mapping):
+        if not _is_mapping(props):
             raise TypeError(f"properties for node '{label}' must be a mapping")
-        normalized_nodes[label] = {"properties": dict(props)}
+        # Interned keys let per-call label checks hit the dict on a pointer compare.
+        normalized_nodes[sys.intern(str(label))] = {"properties": dict(props)}
 
     normalized_edges: Dict[str, RuntimeEdgeDefinition] = {}
     for label, definition in raw_edges.items():
-        if not isinstance(label, str) or not label.strip():
+        if not _is_label(label):
             raise ValueError("edge labels must be non-empty strings")
-        if not isinstance(definition, Mapping):
+        if not _is_mapping(definition):
             raise TypeError(f"definition for edge '{label}' must be a mapping")
         from_label = definition.get("from") or definition.get("from_")
         to_label = definition.get("to")
-        if not isinstance(from_label, str) or not from_label.strip():
+        if not _is_label(from_label):
             raise ValueError(f"edge '{label}' must include a non-empty 'from' label")
-        if not isinstance(to_label, str) or not to_label.strip():
+        if not _is_label(to_label):
             raise ValueError(f"edge '{label}' must include a non-empty 'to' label")
         if from_label not in normalized_nodes or to_label not in normalized_nodes:
             raise ValueError(
                 f"edge '{label}' references unknown nodes '{from_label}' -> '{to_label}'"
             )
         props = definition.get("properties") or {}
-        if not isinstance(props, Mapping):
+        if not _is_mapping(props):
             raise TypeError(f"properties for edge '{label}' must be a mapping")
-        normalized_edges[label] = {
-            "from_label": from_label,
-            "to_label": to_label,
+        normalized_edges[sys.intern(str(label))] = {
+            "from_label": sys.intern(str(from_label)),
+            "to_label": sys.intern(str(to_label)),
             "properties": dict(props),
         }
 
@@ -99,7 +111,6 @@ def normalize_graph_schema(schema: TypedGraphSchema) -> NormalizedGraphSchema:
 
 
 def extract_runtime_node_schema(schema: NormalizedGraphSchema) -> Dict[str, Dict[str, Any]]:
-    runtime: Dict[str, Dict[str, Any]] = {}
-    for label, definition in schema["nodes"].items():
-        runtime[label] = dict(definition.get("properties") or {})
-    return runtime
+    # The property dicts were already copied by normalize_graph_schema and
+    # Database.with_schema() copies them again, so they are passed through.
+    return {label: definition.get("properties") or {} for label, definition in schema["nodes"].items()}
@@ -1,7 +1,9 @@
 import asyncio
+import json
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 import pytest
@@ -11,6 +13,8 @@ import sombra.query as query
 from sombra.query import (
     _literal_value,
     eq,
+    OP_CREATE_EDGE,
+    OP_CREATE_NODE,
     ErrorCode,
     SombraError,
     AnalyzerError,
@@ -90,6 +94,41 @@ def test_stream_close_stops_iteration() -> None:
     asyncio.run(run())
 
 
+def test_stream_refills_past_one_batch() -> None:
+    db = Database.open(temp_db_path())
+    total = query._QueryStream._BATCH_ROWS * 2 + 5
+    db.bulk_create_nodes("User", [{"idx": idx} for idx in range(total)])
+
+    async def collect() -> list:
+        return [row async for row in db.query().nodes("User").stream()]
+
+    rows = asyncio.run(collect())
+    assert len(rows) == total
+    assert len({row["n0"]["_id"] for row in rows}) == total
+
+
+def test_stream_yields_partial_batch_before_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = Database.open(temp_db_path())
+    db.seed_demo()
+    pulls = iter([[{"n0": 1}, {"n0": 2}]])
+
+    def partial_then_cancel(handle: Any, max_rows: int) -> Any:
+        for batch in pulls:
+            return batch
+        raise RuntimeError("[CANCELLED] stopped mid-batch")
+
+    monkeypatch.setattr(query._native, "stream_next_batch", partial_then_cancel)
+
+    async def run() -> list:
+        seen = []
+        with pytest.raises(CancelledError):
+            async for row in db.query().nodes("User").stream():
+                seen.append(row)
+        return seen
+
+    assert asyncio.run(run()) == [{"n0": 1}, {"n0": 2}]
+
+
 def test_explain_plan_shape() -> None:
     db = Database.open(temp_db_path())
     db.seed_demo()
@@ -142,6 +181,111 @@ def test_mutate_batched_chunks_ops() -> None:
     assert len(created) == 3
 
 
+def test_mutate_json_accepts_serialized_ops() -> None:
+    db = Database.open(temp_db_path())
+    payload = json.dumps(
+        {"ops": [{"op": "createNode", "labels": ["User"], "props": {"name": "JsonA"}}]}
+    ).encode("utf-8")
+    summary = db.mutate_json(payload)
+    assert len(summary.get("createdNodes") or []) == 1
+
+    summary = db.mutate_json('{"ops": []}')
+    assert summary.get("createdNodes") == []
+
+    with pytest.raises(SombraError):
+        db.mutate_json(b"{not json")
+
+
+def test_mutate_many_can_skip_created_ids() -> None:
+    db = Database.open(temp_db_path())
+    summary = db.mutate_many(
+        [{"op": "createNode", "labels": ["User"], "props": {"name": "NoIds"}}],
+        collect_ids=False,
+    )
+    assert summary.get("createdNodes") == []
+    assert db.count_nodes_with_label("User") == 1
+
+
+def test_mutate_many_without_copy_accepts_mappings() -> None:
+    db = Database.open(temp_db_path())
+    op = {"op": "createNode", "labels": ["User"], "props": {"name": "Owned"}}
+    summary = db.mutate_many([op, MappingProxyType(op)], copy=False)
+    assert len(summary.get("createdNodes") or []) == 2
+    assert op == {"op": "createNode", "labels": ["User"], "props": {"name": "Owned"}}
+
+
+def test_bulk_create_returns_ids_in_row_order() -> None:
+    db = Database.open(temp_db_path())
+    a, b = db.bulk_create_nodes("User", [{"name": "BulkA"}, None])
+    assert db.count_nodes_with_label("User") == 2
+    edges = db.bulk_create_edges([(a, b, "FOLLOWS", {"weight": 1}), (b, a, "FOLLOWS", None)])
+    assert len(edges) == 2
+    assert db.bulk_create_nodes("User", []) == []
+
+
+def test_list_nodes_with_label_array_matches_list() -> None:
+    db = Database.open(temp_db_path())
+    ids = db.bulk_create_nodes("User", [{"name": "ArrA"}, {"name": "ArrB"}])
+    packed = db.list_nodes_with_label_array("User")
+    assert packed.typecode == "Q"
+    assert packed.tolist() == db.list_nodes_with_label("User")
+    assert sorted(packed) == sorted(ids)
+
+
+def test_encoded_spec_is_reused_until_builder_changes() -> None:
+    db = Database.open(temp_db_path())
+    query = db.query().match({"a": "User"})
+    before = query._encoded_spec_body()
+    assert query._encoded_spec_body() is before
+    query.where_var("a", lambda pred: pred.eq("name", "Ada"))
+    after = query._encoded_spec_body()
+    assert after != before
+    assert '"Ada"' in after
+
+
+def test_mutate_compact_accepts_op_tuples() -> None:
+    db = Database.open(temp_db_path())
+    summary = db.mutate_compact(
+        [(OP_CREATE_NODE, ["User"], {"name": "TupleA"}), (OP_CREATE_NODE, ["User"], {"name": "TupleB"})]
+    )
+    a, b = summary.get("createdNodes") or []
+    summary = db.mutate_compact([(OP_CREATE_EDGE, a, b, "FOLLOWS", None)])
+    assert len(summary.get("createdEdges") or []) == 1
+
+    with pytest.raises(SombraError):
+        db.mutate_compact([(OP_CREATE_NODE, ["User"])])
+
+
+def test_mutate_columns_applies_each_row() -> None:
+    db = Database.open(temp_db_path())
+    summary = db.mutate_columns("createNode", {"labels": ["User"], "props": {"name": ["ColA", "ColB"]}})
+    created = summary.get("createdNodes") or []
+    assert len(created) == 2
+
+    db.mutate_columns("updateNode", {"id": created, "set": {"bio": ["first", "second"]}})
+    record = db.get_node_record(created[1])
+    assert record is not None
+    assert record["properties"]["bio"] == "second"
+
+    summary = db.mutate_columns("deleteNode", {"id": created, "cascade": True})
+    assert summary["deletedNodes"] == 2
+
+    with pytest.raises(ValueError):
+        db.mutate_columns("upsertNode", {"id": created})
+
+
+def test_get_node_records_bulk_preserves_order() -> None:
+    db = Database.open(temp_db_path())
+    first = db.create_node("User", {"name": "BulkA"})
+    second = db.create_node("User", {"name": "BulkB"})
+    assert first is not None and second is not None
+
+    records = db.get_node_records_bulk([second, first, 999_999])
+    assert [record["properties"]["name"] for record in records[:2]] == ["BulkB", "BulkA"]
+    assert records[2] is None
+    assert db.get_node_records_bulk([]) == []
+
+
 def test_parallel_read_and_write_share_single_handle() -> None:
     db = Database.open(temp_db_path())
     db.seed_demo()
@@ -174,6 +318,22 @@ def test_create_builder_handle_refs() -> None:
     assert summary.alias("$missing") is None
 
 
+def test_create_builder_bulk_helpers() -> None:
+    db = Database.open(temp_db_path())
+    builder = db.create()
+    handles = builder.nodes_bulk("User", [{"name": "Ann"}, {"name": "Ben"}, None])
+    assert [handle.index for handle in handles] == [0, 1, 2]
+    builder.edges_bulk(
+        [
+            (handles[0], "KNOWS", handles[1], {"since": 2021}),
+            (handles[1], "KNOWS", handles[2], None),
+        ]
+    )
+    summary = builder.execute()
+    assert len(summary["nodes"]) == 3
+    assert len(summary["edges"]) == 2
+
+
 def test_create_builder_alias_chain() -> None:
     db = Database.open(temp_db_path())
     summary = (
@@ -205,6 +365,42 @@ def test_transaction_collects_ops() -> None:
     assert result == "done"
 
 
+def test_transaction_copies_reused_props() -> None:
+    db = Database.open(temp_db_path())
+
+    def builder(tx: Any) -> None:
+        props = {"name": "TxReuse0"}
+        labels = ["User"]
+        for idx in range(3):
+            props["name"] = f"TxReuse{idx}"
+            tx.create_node(labels, props)
+        labels.append("Admin")
+        props["name"] = "mutated"
+
+    db.transaction(builder)
+    names = {row["name"] for row in db.query().nodes("User").select("name").execute()}
+    assert {"TxReuse0", "TxReuse1", "TxReuse2"} <= names
+    assert "mutated" not in names
+
+
+def test_bfs_reachable_merges_starts() -> None:
+    db = Database.open(temp_db_path())
+    a, b, c, d = (db.create_node("User", {"name": name}) for name in "abcd")
+    db.create_edge(a, b, "FOLLOWS")
+    db.create_edge(b, c, "FOLLOWS")
+    db.create_edge(d, a, "FOLLOWS")
+
+    reached = db.bfs_reachable([a, d, a], 2)
+    # b is reached from both a and d but listed once; a is a start that d
+    # reaches, while d is never reached from another start.
+    assert len(reached) == len(set(reached))
+    assert set(reached) == {a, b, c}
+    assert db.bfs_reachable([c], 2) == []
+    assert db.bfs_reachable([], 2) == []
+    with pytest.raises(ValueError, match="non-negative node ids"):
+        db.bfs_reachable([a, -1], 2)
+
+
 def test_pragma_round_trip() -> None:
     db = Database.open(temp_db_path())
     db.pragma("synchronous", "normal")
@@ -237,6 +433,112 @@ def test_literal_value_datetime_supports_timezone() -> None:
         raise AssertionError("expected ValueError for naive datetime")
 
 
+def test_predicate_in_tags_long_literal_lists() -> None:
+    values = list(range(40)) + [None]
+    builder = query._PredicateBuilder(None, "n0")
+    builder.in_("age", values)
+    tagged = builder._exprs[0]["values"]
+    assert tagged[:2] == [{"t": "Int", "v": 0}, {"t": "Int", "v": 1}]
+    assert tagged[-1] == {"t": "Null"}
+
+    with pytest.raises(ValueError):
+        query._PredicateBuilder(None, "n0").in_("age", list(range(20)) + ["x"])
+    with pytest.raises(TypeError):
+        query._PredicateBuilder(None, "n0").in_("age", list(range(20)) + [[1]])
+
+
+def test_prop_validators_are_shared_across_builders() -> None:
+    db = Database.open(temp_db_path(), schema={"User": {"name": {}}})
+    first = db.query().nodes("User").where(eq("name", "Ada"))._builder
+    second = db.query().nodes("User").where(eq("name", "Bob"))._builder
+    assert first._cached_prop_validator("n0") is second._cached_prop_validator("n0")
+    with pytest.raises(ValueError, match="Unknown property 'email'"):
+        db.query().nodes("User").where(eq("email", "x"))
+
+
+def test_where_accepts_expressions_deeper_than_recursion_limit() -> None:
+    db = Database.open(temp_db_path())
+    db.seed_demo()
+
+    expr = eq("name", "Ada")
+    for _ in range(3000):
+        expr = query.not_(query.not_(expr))
+    db.query().nodes("User").where(expr)
+
+
+def test_where_canonicalizes_equivalent_predicates() -> None:
+    db = Database.open(temp_db_path())
+    db.seed_demo()
+
+    left = db.query().nodes("User").where(query.and_(eq("name", "Ada"), eq("age", 36)))
+    right = (
+        db.query()
+        .nodes("User")
+        .where(query.not_(query.not_(eq("age", 36))))
+        .and_where(query.and_(eq("name", "Ada"), eq("age", 36)))
+    )
+    assert left._builder._build()["predicate"] == right._builder._build()["predicate"]
+
+
+def test_build_attaches_plan_key_ignoring_request_id() -> None:
+    db = Database.open(temp_db_path())
+    first = db.query().nodes("User").request_id("a").where(eq("name", "Ada"))._builder._build()
+    second = db.query().nodes("User").request_id("b").where(eq("name", "Ada"))._builder._build()
+    other = db.query().nodes("User").where(eq("name", "Grace"))._builder._build()
+    assert first["$planKey"] == second["$planKey"]
+    assert first["$planKey"] != other["$planKey"]
+
+
+def test_encoded_spec_matches_built_spec() -> None:
+    db = Database.open(temp_db_path())
+    builder = db.query().nodes("User").request_id("req-1").where(eq("name", "Ada"))._builder
+    assert json.loads(builder._encode()) == builder._build()
+    redacted = json.loads(builder._encode(redact_literals=True))
+    assert redacted["redact_literals"] is True
+    assert redacted["$planKey"] == builder._build()["$planKey"]
+
+
+def test_prepared_query_binds_params() -> None:
+    db = Database.open(temp_db_path())
+    db.seed_demo()
+
+    builder = db.query().nodes("User").where(eq("name", query.param("name")))._builder
+    with pytest.raises(ValueError):
+        builder.execute()
+
+    prepared = builder.prepare()
+    assert prepared.params == ("name",)
+    direct = db.query().nodes("User").where(eq("name", "Ada"))._builder
+    assert json.loads(prepared.bind({"name": "Ada"})._encoded) == direct._spec_body()
+    assert prepared.bind({"name": "Ada"}).execute() == direct.execute()
+
+    with pytest.raises(ValueError):
+        prepared.bind({})
+    with pytest.raises(ValueError):
+        prepared.bind({"name": "Ada", "extra": 1})
+
+
+def test_prepared_query_bind_applies_literal_checks() -> None:
+    db = Database.open(temp_db_path())
+    below = db.query().nodes("User").where(query.lt("age", query.param("age")))._builder.prepare()
+    with pytest.raises(ValueError, match="does not accept null"):
+        below.bind({"age": None})
+    below.bind({"age": 30})
+
+    members = db.query().match({"u": "User"})
+    members.where_var("u", lambda pred: pred.in_("age", [query.param("a"), query.param("b")]))
+    prepared = members.prepare()
+    with pytest.raises(ValueError, match="share the same type"):
+        prepared.bind({"a": 1, "b": "x"})
+    with pytest.raises(TypeError, match="nested collections"):
+        prepared.bind({"a": [1], "b": 2})
+    prepared.bind({"a": 1, "b": 2})
+
+    span = db.query().nodes("User").where(query.between("age", query.param("lo"), query.param("hi")))._builder
+    with pytest.raises(ValueError, match="low <= high"):
+        span.prepare().bind({"lo": 5, "hi": 1})
+
+
 def test_runtime_schema_validation_rejects_unknown_property() -> None:
     db = Database.open(temp_db_path(), schema={"User": {"name": {"type": "string"}}})
     db.seed_demo()
@@ -5,6 +5,8 @@ from typing import TypedDict
 import pytest
 from typing_extensions import Literal
 
+import sombra.query as query
+from sombra.query import IoError
 from sombra.typed import NodeSchema, SombraDB, TypedGraphSchema
 
 
@@ -96,9 +98,67 @@ def test_typed_facade_crud_and_traversal() -> None:
     result = db.query().start_from_label("Person").traverse(["WORKS_AT"]).get_ids()
     assert acme in result["node_ids"]
 
+    prepared = db.query().start_from_label("Person").traverse(["WORKS_AT"]).prepare()
+    assert prepared.get_ids() == result
+
     assert db.count_nodes_with_label("Person") == 1
     assert db.count_edges_with_type("WORKS_AT") == 1
 
     with pytest.raises(ValueError):
         db.add_node("Unknown", {"name": "Ghost"})
 
+
+def test_find_node_by_property_handles_values_the_query_cannot_compare() -> None:
+    db = SombraDB(temp_db_path(), schema=SCHEMA)
+    first = db.add_node("Person", {"name": "Ada", "age": 36})
+    db.add_node("Person", {"name": "Ada", "age": "unknown"})
+
+    # Both nodes match; the lowest id wins.
+    assert db.find_node_by_property("Person", "name", "Ada") == first
+    # The second node stores age as a string, which the native filter will not
+    # compare with an int.
+    assert db.find_node_by_property("Person", "age", 36) == first
+    assert db.find_node_by_property("Person", "age", "36") is None
+    assert db.find_node_by_property("Person", "age", [36]) is None
+    assert db.find_node_by_property("Person", "age", 1 << 70) is None
+
+
+def test_find_node_by_property_falls_back_on_invalid_arg_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = SombraDB(temp_db_path(), schema=SCHEMA)
+    first = db.add_node("Person", {"name": "Ada", "age": 36})
+
+    def invalid_arg(handle: object, spec: object) -> object:
+        raise RuntimeError("[INVALID_ARG] any wording")
+
+    monkeypatch.setattr(query._native, "database_execute", invalid_arg)
+    assert db.find_node_by_property("Person", "name", "Ada") == first
+
+    def io_error(handle: object, spec: object) -> object:
+        raise RuntimeError("[IO] disk unavailable")
+
+    monkeypatch.setattr(query._native, "database_execute", io_error)
+    with pytest.raises(IoError):
+        db.find_node_by_property("Person", "name", "Ada")
+
+
+def test_bulk_load_rejects_unknown_properties() -> None:
+    db = SombraDB(temp_db_path(), schema=SCHEMA)
+
+    with pytest.raises(ValueError, match="unknown property 'email' for node 'Person'"):
+        db.bulk_load_nodes("Person", [{"name": "Ada"}, {"name": "Bob", "email": "bob@example.com"}])
+
+    with pytest.raises(ValueError, match="unknown property 'since' for edge 'WORKS_AT'"):
+        db.bulk_load_edges([(1, 2, "WORKS_AT", {"since": 2020})])
+
+
+def test_bulk_load_edges_checks_endpoint_labels() -> None:
+    db = SombraDB(temp_db_path(), schema=SCHEMA)
+    alice = db.add_node("Person", {"name": "Alice", "age": 32})
+    acme = db.add_node("Company", {"name": "Acme"})
+
+    created = db.bulk_load_edges([(alice, acme, "WORKS_AT", {"role": "Engineer"})])
+    assert len(created) == 1
+
+    with pytest.raises(ValueError, match="bulk_load_edges source expected node with label 'Person'"):
+        db.bulk_load_edges([(acme, alice, "WORKS_AT", {"role": "Owner"})])
+    assert db.count_edges_with_type("WORKS_AT") == 1
@@ -398,6 +398,7 @@ fn user_lookup_spec(name: String) -> QuerySpec {
             alias: None,
         }],
         distinct: false,
+        plan_key: None,
     }
 }
 
@@ -22,6 +22,7 @@ use crate::query::{
     Value as QueryValue,
 };
 use crate::storage::catalog::{Dict, DictOptions};
+use crate::storage::index::PostingStream;
 use crate::storage::VersionCodecKind;
 use crate::storage::{
     profile_timer as storage_profile_timer, record_profile_timer as record_storage_profile_timer,
@@ -34,13 +35,15 @@ use crate::storage::{
 };
 use crate::types::{EdgeId, LabelId, NodeId, PropId, SombraError, StrId, TypeId};
 use base64::{engine::general_purpose::STANDARD as BASE64, Engine as _};
-use serde::{Deserialize, Serialize};
+use lru::LruCache;
+use serde::{de::DeserializeOwned, Deserialize, Serialize};
 use serde_json::{Map, Number, Value};
 use std::cmp::Ordering;
 use std::sync::atomic::{AtomicBool, AtomicU64, Ordering as AtomicOrdering};
 use std::{
     collections::{HashMap, HashSet},
     fs, mem,
+    num::NonZeroUsize,
     ops::Bound,
     path::Path,
     sync::{Arc, Mutex, OnceLock},
@@ -640,8 +643,12 @@ pub struct Database {
     planner: Planner,
     executor: Executor,
     cancellations: Arc<CancellationRegistry>,
+    plan_cache: Mutex<LruCache<String, PlannerOutput>>,
 }
 
+/// Number of plans kept for specs that carry a `$planKey`.
+const PLAN_CACHE_CAPACITY: usize = 256;
+
 impl Database {
     /// Opens or creates a database at the specified path.
     ///
@@ -705,6 +712,9 @@ impl Database {
             planner,
             executor,
             cancellations,
+            plan_cache: Mutex::new(LruCache::new(
+                NonZeroUsize::new(PLAN_CACHE_CAPACITY).expect("plan cache capacity is non-zero"),
+            )),
         })
     }
 
@@ -763,6 +773,27 @@ impl Database {
         self.execute(spec)
     }
 
+    /// Executes a query specification supplied as JSON bytes.
+    ///
+    /// Deserializes straight into [`QuerySpec`], skipping the intermediate
+    /// [`Value`] tree that [`Database::execute_json`] walks.
+    pub fn execute_json_bytes(&self, payload: &[u8]) -> Result<Value> {
+        let spec: QuerySpec = parse_query_payload(payload)?;
+        self.execute(spec)
+    }
+
+    /// Explains a query specification supplied as JSON bytes.
+    pub fn explain_json_bytes(&self, payload: &[u8]) -> Result<Value> {
+        let spec: ExplainSpec = parse_query_payload(payload)?;
+        self.explain_with_options(spec.query, spec.redact_literals)
+    }
+
+    /// Creates a streaming query from a specification supplied as JSON bytes.
+    pub fn stream_json_bytes(&self, payload: &[u8]) -> Result<QueryStream> {
+        let spec: QuerySpec = parse_query_payload(payload)?;
+        self.stream(spec)
+    }
+
     /// Explains a JSON-serialized query without executing it.
     ///
     /// Returns the query execution plan for inspection and optimization.
@@ -852,6 +883,7 @@ impl Database {
             self.graph.create_label_index(&mut write, *label_id)?;
         }
         self.pager.commit(write)?;
+        self.clear_plan_cache();
         Ok(to_create.len())
     }
 
@@ -918,6 +950,7 @@ impl Database {
         };
         self.graph.create_property_index(&mut write, def)?;
         self.pager.commit(write)?;
+        self.clear_plan_cache();
         Ok(true)
     }
 
@@ -986,6 +1019,31 @@ impl Database {
         Ok(out)
     }
 
+    /// Fetches and materializes multiple node records using a single read snapshot.
+    ///
+    /// Lookups are reordered by node ID for storage locality; results are
+    /// returned in the original order, with `None` for missing nodes.
+    pub fn get_node_records(&self, node_ids: &[u64]) -> Result<Vec<Option<NodeRecord>>> {
+        let read = self.pager.begin_latest_committed_read()?;
+        if node_ids.is_empty() {
+            return Ok(Vec::new());
+        }
+        let mut indexed: Vec<(usize, u64)> = node_ids
+            .iter()
+            .enumerate()
+            .map(|(idx, &id)| (idx, id))
+            .collect();
+        indexed.sort_by_key(|&(_, id)| id);
+
+        let mut out: Vec<Option<NodeRecord>> = vec![None; node_ids.len()];
+        for (idx, id) in indexed {
+            if let Some(node) = self.graph.get_node(&read, NodeId(id))? {
+                out[idx] = Some(self.materialize_node(&read, NodeId(id), node)?);
+            }
+        }
+        Ok(out)
+    }
+
     /// Returns property counts for multiple nodes using a single read snapshot
     /// without materializing property values.
     ///
@@ -1037,6 +1095,36 @@ impl Database {
         Ok(out)
     }
 
+    /// Returns, for each node, whether it exists and carries `label`, using a
+    /// single read snapshot and without decoding properties.
+    ///
+    /// Lookups are reordered by node ID for locality, but results are returned
+    /// in the original order. An unknown label yields `false` for every node.
+    pub fn nodes_have_label(&self, node_ids: &[u64], label: &str) -> Result<Vec<bool>> {
+        let mut out: Vec<bool> = vec![false; node_ids.len()];
+        if node_ids.is_empty() {
+            return Ok(out);
+        }
+        let Some(label_id) = self.dict.lookup(label).map_err(FfiError::from)? else {
+            return Ok(out);
+        };
+        let label_id = LabelId(label_id.0);
+        let read = self.pager.begin_latest_committed_read()?;
+        let mut indexed: Vec<(usize, u64)> = node_ids
+            .iter()
+            .enumerate()
+            .map(|(idx, &id)| (idx, id))
+            .collect();
+        indexed.sort_by_key(|&(_, id)| id);
+
+        for (idx, id) in indexed {
+            if let Some(version) = self.graph.visible_node(&read, NodeId(id))? {
+                out[idx] = version.row.labels.contains(&label_id);
+            }
+        }
+        Ok(out)
+    }
+
     /// Fetches an edge by ID and returns its metadata.
     pub fn get_edge_record(&self, edge_id: u64) -> Result<Option<EdgeRecord>> {
         let read = self.pager.begin_latest_committed_read()?;
@@ -1142,6 +1230,96 @@ impl Database {
             .collect())
     }
 
+    /// Returns the distinct nodes reached at depth 1..=`max_depth` from any of
+    /// `start_ids`, in first-visit order, using a single read snapshot.
+    ///
+    /// Each start is traversed on its own, so a start node is reported only
+    /// when another start reaches it.
+    pub fn bfs_reachable_multi(
+        &self,
+        start_ids: &[u64],
+        direction: Dir,
+        max_depth: u32,
+        edge_types: Option<&[String]>,
+    ) -> Result<Vec<u64>> {
+        let options = self.reachable_bfs_options(direction, max_depth, edge_types)?;
+        let read = self.pager.begin_latest_committed_read()?;
+        let mut seen: HashSet<u64> = HashSet::new();
+        let mut reached = Vec::new();
+        for &start in start_ids {
+            self.collect_reachable(&read, NodeId(start), &options, &mut seen, &mut reached)?;
+        }
+        Ok(reached)
+    }
+
+    /// Same as [`Self::bfs_reachable_multi`] with every node carrying `label` as
+    /// a start. Starts are streamed from the label scan into the traversal
+    /// within one read snapshot rather than collected into a list first.
+    pub fn bfs_reachable_from_label(
+        &self,
+        label: &str,
+        direction: Dir,
+        max_depth: u32,
+        edge_types: Option<&[String]>,
+    ) -> Result<Vec<u64>> {
+        let label_id = self.lookup_label(label)?;
+        let options = self.reachable_bfs_options(direction, max_depth, edge_types)?;
+        let read = self.pager.begin_latest_committed_read()?;
+        let mut stream = self.graph.label_scan_stream(&read, label_id)?;
+        const BATCH: usize = 256;
+        let mut buf = Vec::with_capacity(BATCH);
+        let mut seen: HashSet<u64> = HashSet::new();
+        let mut reached = Vec::new();
+        loop {
+            buf.clear();
+            let has_more = stream.next_batch(&mut buf, BATCH)?;
+            for &node in &buf {
+                if self.graph.node_has_label(&read, node, label_id)? {
+                    self.collect_reachable(&read, node, &options, &mut seen, &mut reached)?;
+                }
+            }
+            if !has_more {
+                break;
+            }
+        }
+        Ok(reached)
+    }
+
+    fn reachable_bfs_options(
+        &self,
+        direction: Dir,
+        max_depth: u32,
+        edge_types: Option<&[String]>,
+    ) -> Result<BfsOptions> {
+        let edge_filters = match edge_types {
+            Some(names) if !names.is_empty() => Some(self.lookup_edge_types(names)?),
+            _ => None,
+        };
+        Ok(BfsOptions {
+            max_depth,
+            direction,
+            edge_types: edge_filters,
+            max_results: None,
+        })
+    }
+
+    /// Appends nodes reached from `start` at depth > 0 that are not yet in `seen`.
+    fn collect_reachable(
+        &self,
+        read: &ReadGuard,
+        start: NodeId,
+        options: &BfsOptions,
+        seen: &mut HashSet<u64>,
+        reached: &mut Vec<u64>,
+    ) -> Result<()> {
+        for visit in self.graph.bfs(read, start, options)? {
+            if visit.depth > 0 && seen.insert(visit.node.0) {
+                reached.push(visit.node.0);
+            }
+        }
+        Ok(())
+    }
+
     /// Handles database pragmas (configuration settings).
     ///
     /// Supported pragmas:
@@ -1878,6 +2056,31 @@ impl Database {
     }
 
     fn plan(&self, spec: QuerySpec) -> Result<PlannerOutput> {
+        if spec.plan_key.is_none() {
+            return self.plan_uncached(spec);
+        }
+        // The client's $planKey only opts the spec into caching. Entries are
+        // keyed by the parsed spec itself, so a reused or mismatched key can
+        // never hand back another query's plan (or its pinned literals).
+        let key = spec.cache_key();
+        let request_id = spec.request_id.clone();
+        let cached = self
+            .plan_cache
+            .lock()
+            .ok()
+            .and_then(|mut cache| cache.get(&key).cloned());
+        if let Some(mut plan) = cached {
+            plan.request_id = request_id;
+            return Ok(plan);
+        }
+        let plan = self.plan_uncached(spec)?;
+        if let Ok(mut cache) = self.plan_cache.lock() {
+            cache.put(key, plan.clone());
+        }
+        Ok(plan)
+    }
+
+    fn plan_uncached(&self, spec: QuerySpec) -> Result<PlannerOutput> {
         let ast = spec.into_ast()?;
         let analyzed = analyze::analyze(&ast, self.metadata.as_ref())?;
         self.planner
@@ -1885,6 +2088,13 @@ impl Database {
             .map_err(FfiError::from)
     }
 
+    /// Drops cached plans so new indexes are considered on the next query.
+    fn clear_plan_cache(&self) {
+        if let Ok(mut cache) = self.plan_cache.lock() {
+            cache.clear();
+        }
+    }
+
     fn register_cancellation(
         &self,
         request_id: Option<&str>,
@@ -2000,6 +2210,16 @@ fn enforce_payload_size(spec: &Value) -> Result<()> {
     }
 }
 
+fn parse_query_payload<T: DeserializeOwned>(payload: &[u8]) -> Result<T> {
+    if payload.len() > MAX_PAYLOAD_BYTES {
+        return Err(FfiError::Message(format!(
+            "payload exceeds {MAX_PAYLOAD_BYTES} bytes"
+        )));
+    }
+    serde_json::from_slice(payload)
+        .map_err(|err| FfiError::Message(format!("invalid query spec: {err}")))
+}
+
 /// JSON-deserializable query specification for FFI clients.
 ///
 /// Defines match clauses, edges, predicates, and projections for graph queries.
@@ -2027,6 +2247,10 @@ pub struct QuerySpec {
     /// Whether to return distinct results only.
     #[serde(default)]
     pub distinct: bool,
+    /// Client-computed digest of the spec (excluding `request_id`).
+    /// When present, the planned query is cached, keyed by the spec body.
+    #[serde(default, rename = "$planKey")]
+    pub plan_key: Option<String>,
 }
 
 /// Explain-specific options layered on top of [`QuerySpec`].
@@ -2045,6 +2269,22 @@ pub struct ExplainSpec {
 const MAX_PAYLOAD_BYTES: usize = 8 * 1024 * 1024;
 
 impl QuerySpec {
+    /// Renders every field that affects planning, leaving out `request_id`
+    /// and the client's `$planKey`.
+    fn cache_key(&self) -> String {
+        format!(
+            "{:?}",
+            (
+                self.schema_version,
+                &self.matches,
+                &self.edges,
+                &self.predicate,
+                &self.projections,
+                self.distinct,
+            )
+        )
+    }
+
     fn into_ast(self) -> Result<QueryAst> {
         let schema_version = self
             .schema_version
@@ -3913,6 +4153,7 @@ mod tests {
             predicate: Some(PredicateSpec::And { args: vec![] }),
             projections: Vec::new(),
             distinct: false,
+            plan_key: None,
         };
         let ast = spec.into_ast()?;
         assert!(ast.predicate.is_none());
@@ -3932,6 +4173,7 @@ mod tests {
             predicate: Some(PredicateSpec::Or { args: vec![] }),
             projections: Vec::new(),
             distinct: false,
+            plan_key: None,
         };
         let ast = spec.into_ast()?;
         match ast.predicate {
@@ -3990,6 +4232,7 @@ mod tests {
             predicate: None,
             projections: Vec::new(),
             distinct: false,
+            plan_key: None,
         };
         let err = spec.into_ast().expect_err("schema version required");
         match err {
@@ -4025,6 +4268,7 @@ mod tests {
             predicate: None,
             projections: Vec::new(),
             distinct: false,
+            plan_key: None,
         };
         let err = spec.into_ast().expect_err("direction check");
         match err {
@@ -4313,6 +4557,133 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn execute_json_reuses_plans_by_plan_key() -> Result<()> {
+        let dir = tempdir().unwrap();
+        let path = dir.path().join("plan_cache.db");
+        let db = Database::open(&path, DatabaseOptions::default())?;
+        db.seed_demo()?;
+        let mut spec = json!({
+            "$schemaVersion": 1,
+            "$planKey": "users-named-ada",
+            "request_id": "req-first",
+            "matches": [
+                { "var": "a", "label": "User" }
+            ],
+            "predicate": {
+                "op": "eq",
+                "var": "a",
+                "prop": "name",
+                "value": { "t": "String", "v": "Ada" }
+            },
+            "projections": [
+                { "kind": "var", "var": "a" }
+            ]
+        });
+        let first = db.execute_json(&spec)?;
+        spec["request_id"] = json!("req-second");
+        let second = db.execute_json(&spec)?;
+        assert_eq!(first.get("rows"), second.get("rows"));
+        assert_eq!(
+            second.get("request_id").and_then(Value::as_str),
+            Some("req-second")
+        );
+        assert_eq!(db.plan_cache.lock().unwrap().len(), 1);
+        Ok(())
+    }
+
+    #[test]
+    fn plan_cache_does_not_trust_a_reused_plan_key() -> Result<()> {
+        let dir = tempdir().unwrap();
+        let path = dir.path().join("plan_cache_key.db");
+        let db = Database::open(&path, DatabaseOptions::default())?;
+        db.seed_demo()?;
+        let spec_for = |name: &str| {
+            json!({
+                "$schemaVersion": 1,
+                "$planKey": "same-key-for-both",
+                "matches": [
+                    { "var": "a", "label": "User" }
+                ],
+                "predicate": {
+                    "op": "eq",
+                    "var": "a",
+                    "prop": "name",
+                    "value": { "t": "String", "v": name }
+                },
+                "projections": [
+                    { "kind": "prop", "var": "a", "prop": "name" }
+                ]
+            })
+        };
+        let ada = db.execute_json(&spec_for("Ada"))?;
+        let grace = db.execute_json(&spec_for("Grace"))?;
+        assert_eq!(ada.get("rows"), Some(&json!([{ "name": "Ada" }])));
+        assert_eq!(grace.get("rows"), Some(&json!([{ "name": "Grace" }])));
+        assert_eq!(db.plan_cache.lock().unwrap().len(), 2);
+        Ok(())
+    }
+
+    #[test]
+    fn pinned_projection_matches_stored_property() -> Result<()> {
+        let dir = tempdir().unwrap();
+        let path = dir.path().join("pinned_projection.db");
+        let db = Database::open(&path, DatabaseOptions::default())?;
+        db.seed_demo()?;
+        for name in ["Ada", "Grace", "Ada"] {
+            let spec = json!({
+                "$schemaVersion": 1,
+                "$planKey": "pinned-name",
+                "matches": [
+                    { "var": "a", "label": "User" }
+                ],
+                "predicate": {
+                    "op": "eq",
+                    "var": "a",
+                    "prop": "name",
+                    "value": { "t": "String", "v": name }
+                },
+                "projections": [
+                    { "kind": "prop", "var": "a", "prop": "name" },
+                    { "kind": "var", "var": "a" }
+                ]
+            });
+            let result = db.execute_json(&spec)?;
+            let rows = result
+                .get("rows")
+                .and_then(Value::as_array)
+                .expect("rows array");
+            assert_eq!(rows.len(), 1);
+            let stored = rows[0]
+                .pointer("/a/props/name")
+                .expect("node props carry the stored name");
+            assert_eq!(rows[0].get("name"), Some(stored));
+            assert_eq!(stored, &json!(name));
+        }
+        Ok(())
+    }
+
+    #[test]
+    fn execute_json_bytes_matches_execute_json() -> Result<()> {
+        let dir = tempdir().unwrap();
+        let path = dir.path().join("execute_bytes.db");
+        let db = Database::open(&path, DatabaseOptions::default())?;
+        db.seed_demo()?;
+        let spec = json!({
+            "$schemaVersion": 1,
+            "matches": [
+                { "var": "a", "label": "User" }
+            ],
+            "projections": [
+                { "kind": "var", "var": "a" }
+            ]
+        });
+        let payload = serde_json::to_vec(&spec).unwrap();
+        assert_eq!(db.execute_json_bytes(&payload)?, db.execute_json(&spec)?);
+        assert!(db.execute_json_bytes(b"{not json").is_err());
+        Ok(())
+    }
+
     #[test]
     fn explain_json_can_redact_literals() -> Result<()> {
         let dir = tempdir().unwrap();
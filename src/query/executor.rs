@@ -1166,6 +1166,21 @@ fn apply_projection(
                 let key = alias.clone().unwrap_or_else(|| prop_name.clone());
                 row.insert(key, value);
             }
+            ProjectField::Const {
+                var,
+                prop_name,
+                value,
+                alias,
+            } => {
+                if binding.get(&var.0).is_none() {
+                    return Err(SombraError::Invalid("projection variable missing"));
+                }
+                let key = alias.clone().unwrap_or_else(|| prop_name.clone());
+                row.insert(
+                    key,
+                    prop_value_to_exec_value(&literal_to_prop_value(value)?),
+                );
+            }
         }
     }
     Ok(row)
@@ -1430,7 +1445,7 @@ fn bound_ref<'a>(
 mod tests {
     use super::*;
     use crate::primitives::pager::{PageStore, Pager, PagerOptions};
-    use crate::query::ast::Var;
+    use crate::query::ast::{Projection, Var};
     use crate::query::builder::QueryBuilder;
     use crate::query::metadata::InMemoryMetadata;
     use crate::query::metadata::MetadataProvider;
@@ -1439,6 +1454,7 @@ mod tests {
         PropPredicate as PhysicalPredicate,
     };
     use crate::query::planner::{Planner, PlannerConfig};
+    use crate::storage::index::{IndexDef, IndexKind, TypeTag};
     use crate::storage::{GraphOptions, NodeSpec, PropEntry, PropValue};
     use crate::types::{LabelId, PropId, TypeId};
     use std::collections::HashMap;
@@ -1647,6 +1663,211 @@ mod tests {
         Ok(())
     }
 
+    fn setup_people_metadata(indexed: bool) -> Arc<dyn MetadataProvider> {
+        let metadata = InMemoryMetadata::new()
+            .with_label("User", LabelId(1))
+            .with_property("name", PropId(2))
+            .with_property("active", PropId(3));
+        if indexed {
+            Arc::new(metadata.with_property_index_def(people_name_index()))
+        } else {
+            Arc::new(metadata)
+        }
+    }
+
+    fn people_name_index() -> IndexDef {
+        IndexDef {
+            label: LabelId(1),
+            prop: PropId(2),
+            kind: IndexKind::BTree,
+            ty: TypeTag::String,
+        }
+    }
+
+    fn seed_people(
+        pager: &Arc<Pager>,
+        graph: &Arc<Graph>,
+        people: &[(&str, bool)],
+        indexed: bool,
+    ) -> Result<()> {
+        let mut write = pager.begin_write()?;
+        for (name, active) in people {
+            let props = [
+                PropEntry::new(PropId(2), PropValue::Str(name)),
+                PropEntry::new(PropId(3), PropValue::Bool(*active)),
+            ];
+            graph.create_node(
+                &mut write,
+                NodeSpec {
+                    labels: &[LabelId(1)],
+                    props: &props,
+                },
+            )?;
+        }
+        graph.create_label_index(&mut write, LabelId(1))?;
+        if indexed {
+            graph.create_property_index(&mut write, people_name_index())?;
+        }
+        pager.commit(write)?;
+        Ok(())
+    }
+
+    /// Rewrites constant projections back into property fetches.
+    fn unpin_projection(
+        node: &PhysicalNode,
+        metadata: &Arc<dyn MetadataProvider>,
+    ) -> Result<(PhysicalNode, usize)> {
+        let mut node = node.clone();
+        let mut pinned = 0;
+        if let PhysicalOp::Project { fields } = &mut node.op {
+            for field in fields.iter_mut() {
+                if let ProjectField::Const {
+                    var,
+                    prop_name,
+                    alias,
+                    ..
+                } = field
+                {
+                    *field = ProjectField::Prop {
+                        var: var.clone(),
+                        prop: metadata.resolve_property(prop_name)?,
+                        prop_name: prop_name.clone(),
+                        alias: alias.clone(),
+                    };
+                    pinned += 1;
+                }
+            }
+        }
+        Ok((node, pinned))
+    }
+
+    fn project_input_op(plan: &PhysicalPlan) -> &PhysicalOp {
+        &plan.root.inputs.first().expect("project input").op
+    }
+
+    /// Runs `ast` as planned and with every constant projection unpinned,
+    /// returning (pinned field count, planned plan, planned rows, unpinned rows).
+    fn run_pinned_and_unpinned(
+        people: &[(&str, bool)],
+        indexed: bool,
+        ast: &crate::query::ast::QueryAst,
+    ) -> Result<(usize, PhysicalPlan, Vec<Row>, Vec<Row>)> {
+        let (_tmpdir, pager, graph) = setup_graph()?;
+        let metadata = setup_people_metadata(indexed);
+        seed_people(&pager, &graph, people, indexed)?;
+        let planner = Planner::new(PlannerConfig::default(), Arc::clone(&metadata));
+        let plan = planner.plan(ast)?.plan;
+        let (root, pinned) = unpin_projection(&plan.root, &metadata)?;
+        let unpinned = PhysicalPlan::new(root);
+        let executor = Executor::new(graph, pager, metadata);
+        let rows = executor.execute(&plan, None)?.rows;
+        let expected = executor.execute(&unpinned, None)?.rows;
+        Ok((pinned, plan, rows, expected))
+    }
+
+    fn name_and_active(row: &Row) -> (String, bool) {
+        match (row.get("name"), row.get("active")) {
+            (Some(Value::String(name)), Some(Value::Bool(active))) => (name.clone(), *active),
+            other => panic!("unexpected projected values: {other:?}"),
+        }
+    }
+
+    fn assert_same_rows(rows: &[Row], expected: &[Row]) {
+        let mut left: Vec<_> = rows.iter().map(name_and_active).collect();
+        let mut right: Vec<_> = expected.iter().map(name_and_active).collect();
+        left.sort();
+        right.sort();
+        assert_eq!(left, right);
+    }
+
+    const PEOPLE: &[(&str, bool)] = &[("Ada", true), ("Grace", false), ("Ada", false)];
+
+    fn select_name_and_active() -> [Projection; 2] {
+        let prop = |name: &str| Projection::Prop {
+            var: Var("a".into()),
+            prop: name.into(),
+            alias: None,
+        };
+        [prop("name"), prop("active")]
+    }
+
+    #[test]
+    fn executor_pinned_string_projection_matches_filter_fetch() -> Result<()> {
+        let ast = QueryBuilder::new()
+            .r#match("User")
+            .where_var("a", |pred| {
+                pred.eq("name", "Ada");
+            })
+            .select(select_name_and_active())
+            .build()?;
+        let (pinned, plan, rows, expected) = run_pinned_and_unpinned(PEOPLE, false, &ast)?;
+        assert!(matches!(project_input_op(&plan), PhysicalOp::Filter { .. }));
+        assert_eq!(pinned, 1);
+        assert_eq!(rows.len(), 2);
+        assert_same_rows(&rows, &expected);
+        Ok(())
+    }
+
+    #[test]
+    fn executor_pinned_string_projection_matches_index_fetch() -> Result<()> {
+        let ast = QueryBuilder::new()
+            .r#match("User")
+            .where_var("a", |pred| {
+                pred.eq("name", "Ada");
+            })
+            .select(select_name_and_active())
+            .build()?;
+        let (pinned, plan, rows, expected) = run_pinned_and_unpinned(PEOPLE, true, &ast)?;
+        assert!(matches!(
+            project_input_op(&plan),
+            PhysicalOp::PropIndexScan { .. }
+        ));
+        assert_eq!(pinned, 1);
+        assert_eq!(rows.len(), 2);
+        assert_same_rows(&rows, &expected);
+        Ok(())
+    }
+
+    #[test]
+    fn executor_pinned_bool_projection_matches_fetch() -> Result<()> {
+        let ast = QueryBuilder::new()
+            .r#match("User")
+            .where_var("a", |pred| {
+                pred.eq("active", false);
+            })
+            .select(select_name_and_active())
+            .build()?;
+        let (pinned, _plan, rows, expected) = run_pinned_and_unpinned(PEOPLE, false, &ast)?;
+        assert_eq!(pinned, 1);
+        assert_eq!(rows.len(), 2);
+        assert_same_rows(&rows, &expected);
+        Ok(())
+    }
+
+    #[test]
+    fn executor_does_not_pin_equalities_under_or() -> Result<()> {
+        let ast = QueryBuilder::new()
+            .r#match("User")
+            .where_var("a", |pred| {
+                pred.or_group(|or| {
+                    or.eq("name", "Ada");
+                    or.eq("name", "Grace");
+                });
+            })
+            .select(select_name_and_active())
+            .build()?;
+        for indexed in [false, true] {
+            let (pinned, plan, rows, expected) = run_pinned_and_unpinned(PEOPLE, indexed, &ast)?;
+            if indexed {
+                assert!(matches!(project_input_op(&plan), PhysicalOp::Union { .. }));
+            }
+            assert_eq!(pinned, 0);
+            assert_eq!(rows.len(), 3);
+            assert_same_rows(&rows, &expected);
+        }
+        Ok(())
+    }
+
     #[test]
     fn union_stream_concatenates_inputs() -> Result<()> {
         let rows_left = vec![
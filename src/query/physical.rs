@@ -327,6 +327,17 @@ pub enum ProjectField {
         /// Optional alias for the output field.
         alias: Option<String>,
     },
+    /// Projects a property whose value is pinned by an equality predicate.
+    Const {
+        /// Variable exposing the property.
+        var: Var,
+        /// Property name preserved for explain output / default aliasing.
+        prop_name: String,
+        /// Literal every surviving row holds for the property.
+        value: LiteralValue,
+        /// Optional alias for the output field.
+        alias: Option<String>,
+    },
 }
 
 /// Literal surfaced in the physical plan.
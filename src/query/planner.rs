@@ -684,10 +684,11 @@ impl Planner {
                 right: right.clone(),
             },
             LogicalOp::Project { fields } => {
+                let pinned = pinned_equalities(&inputs);
                 let projections = fields
                     .iter()
                     .cloned()
-                    .map(|proj| convert_projection(proj, ctx))
+                    .map(|proj| convert_projection(proj, ctx, &pinned))
                     .collect::<Result<Vec<_>>>()?;
                 PhysicalOp::Project {
                     fields: projections,
@@ -875,18 +876,85 @@ fn convert_bound(bound: &Bound<Value>) -> Bound<LiteralValue> {
     }
 }
 
-fn convert_projection(proj: AnalyzedProjection, ctx: &PlanContext<'_>) -> Result<ProjectField> {
+type PinnedProps = HashMap<(Var, PropId), LiteralValue>;
+
+fn convert_projection(
+    proj: AnalyzedProjection,
+    ctx: &PlanContext<'_>,
+    pinned: &PinnedProps,
+) -> Result<ProjectField> {
     match proj {
         AnalyzedProjection::Var { var, alias } => Ok(ProjectField::Var {
             var: ctx.var_for_id(var),
             alias,
         }),
-        AnalyzedProjection::Prop { var, prop, alias } => Ok(ProjectField::Prop {
-            var: ctx.var_for_id(var),
-            prop: prop.id,
-            prop_name: prop.name.clone(),
-            alias,
-        }),
+        AnalyzedProjection::Prop { var, prop, alias } => {
+            let var = ctx.var_for_id(var);
+            if let Some(value) = pinned.get(&(var.clone(), prop.id)) {
+                return Ok(ProjectField::Const {
+                    var,
+                    prop_name: prop.name.clone(),
+                    value: value.clone(),
+                    alias,
+                });
+            }
+            Ok(ProjectField::Prop {
+                var,
+                prop: prop.id,
+                prop_name: prop.name.clone(),
+                alias,
+            })
+        }
+    }
+}
+
+/// Collects `var.prop = literal` constraints that hold for every row flowing
+/// out of `inputs`, so projections of those properties skip the node fetch.
+fn pinned_equalities(inputs: &[PhysicalNode]) -> PinnedProps {
+    let mut pinned = PinnedProps::new();
+    let mut stack: Vec<&PhysicalNode> = inputs.iter().collect();
+    while let Some(node) = stack.pop() {
+        match &node.op {
+            // Filters below a union only hold for their own branch.
+            PhysicalOp::Union { .. } => continue,
+            PhysicalOp::Filter { pred, .. } | PhysicalOp::PropIndexScan { pred, .. } => {
+                if let PhysicalPredicate::Eq {
+                    var, prop, value, ..
+                } = pred
+                {
+                    pin_equality(&mut pinned, var, *prop, value);
+                }
+            }
+            PhysicalOp::BoolFilter { expr } => pin_bool_expr(&mut pinned, expr),
+            _ => {}
+        }
+        stack.extend(node.inputs.iter());
+    }
+    pinned
+}
+
+fn pin_bool_expr(pinned: &mut PinnedProps, expr: &PhysicalBoolExpr) {
+    match expr {
+        PhysicalBoolExpr::Cmp(PhysicalComparison::Eq {
+            var, prop, value, ..
+        }) => pin_equality(pinned, var, *prop, value),
+        PhysicalBoolExpr::And(children) => {
+            for child in children {
+                pin_bool_expr(pinned, child);
+            }
+        }
+        _ => {}
+    }
+}
+
+fn pin_equality(pinned: &mut PinnedProps, var: &Var, prop: PropId, value: &LiteralValue) {
+    // Numeric equality crosses int/float (and datetimes compare as numbers),
+    // so only literals that can match exactly one stored value are pinned.
+    if matches!(
+        value,
+        LiteralValue::Bool(_) | LiteralValue::String(_) | LiteralValue::Bytes(_)
+    ) {
+        pinned.insert((var.clone(), prop), value.clone());
     }
 }
 
@@ -1954,6 +2022,12 @@ fn describe_field(field: &ProjectField) -> String {
             prop_name,
             alias,
             ..
+        }
+        | ProjectField::Const {
+            var,
+            prop_name,
+            alias,
+            ..
         } => match alias {
             Some(alias) => format!("{}.{} as {}", var.0, prop_name, alias),
             None => format!("{}.{}", var.0, prop_name),
@@ -2157,6 +2231,38 @@ mod tests {
         }
     }
 
+    #[test]
+    fn planner_projects_string_equalities_as_constants() {
+        use crate::query::ast::Projection;
+        let planner = planner_with_metadata();
+        let prop = |name: &str| Projection::Prop {
+            var: Var("a".into()),
+            prop: name.into(),
+            alias: None,
+        };
+        let ast = QueryBuilder::new()
+            .r#match("User")
+            .where_var("a", |pred| {
+                pred.eq("name", "Ada");
+                pred.eq("age", 36_i64);
+            })
+            .select([prop("name"), prop("age")])
+            .build()
+            .expect("builder succeeds");
+        let output = planner.plan(&ast).expect("plan succeeds");
+        match &output.plan.root.op {
+            PhysicalOp::Project { fields } => {
+                assert!(matches!(
+                    &fields[0],
+                    ProjectField::Const { value: LiteralValue::String(v), .. } if v == "Ada"
+                ));
+                // Numeric equality also matches floats, so the stored value is fetched.
+                assert!(matches!(fields[1], ProjectField::Prop { .. }));
+            }
+            other => panic!("unexpected root op: {other:?}"),
+        }
+    }
+
     #[test]
     fn planner_intersects_multiple_indexed_predicates() {
         let metadata = InMemoryMetadata::new()